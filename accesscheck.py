@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+import argparse
+import uuid
+import weakref
+from typing import Iterable, Optional
+from sd import SD
+from sid import SID, as_sid, sid_key
+from accessmask import AccessMask
+
+
+class Token:
+
+    # What AccessCheck() looks at in an access token: the user, its groups with their attributes,
+    # privileges, and integrity level. Groups are given as SIDs (enabled), or as (SID, attributes)
+    # pairs, e.g. (sid, Token.GROUP_USE_FOR_DENY_ONLY). Nothing is added implicitly: Everyone,
+    # Authenticated Users, etc. have to be listed like any other group
+
+    def __init__(self, user, groups: Iterable = (), privileges: Iterable[str] = (), integrity_level='ME'):
+        self.user = as_sid(user)
+        self.groups = []
+        for group in groups:
+            if isinstance(group, tuple):
+                group, attributes = group
+            else:
+                attributes = self.GROUP_ENABLED | self.GROUP_ENABLED_BY_DEFAULT | self.GROUP_MANDATORY
+            self.groups.append((as_sid(group), attributes))
+        self.privileges = frozenset(privileges)
+        self.integrity_level = as_sid(integrity_level)
+        # Allow ACEs only apply to enabled SIDs, deny ACEs also apply to deny-only ones
+        enabled = {sid_key(self.user)}
+        deny_only = set()
+        for group, attributes in self.groups:
+            if attributes & self.GROUP_USE_FOR_DENY_ONLY:
+                deny_only.add(sid_key(group))
+            elif attributes & self.GROUP_ENABLED:
+                enabled.add(sid_key(group))
+        self.allow_sids = frozenset(enabled)
+        self.deny_sids = frozenset(enabled | deny_only)
+        self.integrity_rid = integrity_rid(self.integrity_level)
+
+    def to_dict(self) -> dict:
+        return {
+            'user': self.user.to_dict(),
+            'groups': [dict(group.to_dict(), attributes=attributes) for group, attributes in self.groups],
+            'privileges': sorted(self.privileges),
+            'integrity_level': self.integrity_level.to_dict(),
+        }
+
+
+# SE_GROUP_* attributes
+Token.GROUP_MANDATORY = 0x1
+Token.GROUP_ENABLED_BY_DEFAULT = 0x2
+Token.GROUP_ENABLED = 0x4
+Token.GROUP_OWNER = 0x8
+Token.GROUP_USE_FOR_DENY_ONLY = 0x10
+
+
+class CompiledSD:
+
+    # Everything access_check() needs from a security descriptor, reduced to integers, strings and
+    # tuples once per (descriptor, object type): the ACEs which take part in access checks (no
+    # inherit-only, audit, or allow-callback ACE) with generic rights already mapped
+
+    __slots__ = ('owner', 'null_dacl', 'owner_rights', 'aces', 'label_rid', 'label_denied')
+
+    def __init__(self, sd: SD, access_mask_cls: type = AccessMask):
+        self.owner = None if sd.owner is None else sid_key(sd.owner)
+        # No DACL at all, or a NULL one (NO_ACCESS_CONTROL), grants everything
+        self.null_dacl = sd.dacl is None or sd.dacl.aces is None
+        aces = []
+        self.owner_rights = False
+        for ace in ([] if self.null_dacl else sd.dacl.aces):
+            if 'IO' in ace.flags:
+                continue
+            if ace.acetype in ('A', 'OA'):
+                deny = False
+            elif ace.acetype in ('D', 'OD', 'XD'):
+                # Conditions cannot be evaluated here: conditional deny ACEs are applied, to err
+                # on the side of denying access, and conditional allow ACEs are skipped below
+                deny = True
+            else:
+                continue
+            trustee = sid_key(ace.trustee)
+            if trustee == OWNER_RIGHTS:
+                self.owner_rights = True
+            aces.append((deny, access_mask_cls.map_generic_rights(ace.rights.rights), trustee, ace.object_guid))
+        self.aces = tuple(aces)
+        # Objects without a mandatory label are treated as medium integrity, no write up
+        self.label_rid = 0x2000
+        policy = 0x1
+        if sd.sacl is not None:
+            for ace in sd.sacl.aces or ():
+                if ace.acetype == 'ML' and 'IO' not in ace.flags:
+                    self.label_rid = integrity_rid(ace.trustee)
+                    policy = ace.rights.rights
+                    break
+        self.label_denied = get_label_denied(policy, access_mask_cls.GENERIC_MAPPING)
+
+
+def integrity_rid(sid: SID) -> int:
+    key = sid_key(sid)
+    if not key.startswith('S-1-16-'):
+        raise ValueError(f'Invalid integrity level "{sid.raw}"')
+    return int(key[len('S-1-16-'):], 0)
+
+
+def get_label_denied(policy: int, mapping: tuple) -> int:
+    # Rights withheld from tokens with a lower integrity level than the object, for each
+    # SYSTEM_MANDATORY_LABEL_NO_*_UP bit. No write up also covers the standard rights which modify
+    # the object, no write/execute up never withholds READ_CONTROL or SYNCHRONIZE
+    read, write, execute, _ = mapping
+    denied = 0
+    if policy & 0x1:  # SYSTEM_MANDATORY_LABEL_NO_WRITE_UP
+        denied |= (write | DELETE | WRITE_DAC | WRITE_OWNER) & ~(READ_CONTROL | SYNCHRONIZE)
+    if policy & 0x2:  # SYSTEM_MANDATORY_LABEL_NO_READ_UP
+        denied |= read & ~SYNCHRONIZE
+    if policy & 0x4:  # SYSTEM_MANDATORY_LABEL_NO_EXECUTE_UP
+        denied |= execute & ~(READ_CONTROL | SYNCHRONIZE)
+    return denied
+
+
+def compile_sd(sd: SD, access_mask_cls: type = AccessMask) -> CompiledSD:
+    # Compiled forms live as long as their descriptor, and are not updated if it is modified
+    per_type = COMPILED.get(sd)
+    if per_type is None:
+        per_type = COMPILED[sd] = {}
+    compiled = per_type.get(access_mask_cls)
+    if compiled is None:
+        compiled = per_type[access_mask_cls] = CompiledSD(sd, access_mask_cls)
+    return compiled
+
+
+def access_check(sd: SD, token: Token, desired: int, access_mask_cls: type = AccessMask,
+                 object_types: Optional[Iterable[uuid.UUID]] = None) -> int:
+    # Emulates AccessCheck(): returns the rights granted to 'token' on an object with this security
+    # descriptor, which is either 0 (access denied) or every right in 'desired' (generic rights
+    # mapped). With MAXIMUM_ALLOWED in 'desired', every right which can be granted is returned.
+    # Object ACEs only apply if their object type is in 'object_types', taken as a flat list
+    compiled = compile_sd(sd, access_mask_cls)
+    desired = access_mask_cls.map_generic_rights(desired)
+    maximum = desired & MAXIMUM_ALLOWED
+    desired &= ~MAXIMUM_ALLOWED
+    granted = 0
+    # Privileges are checked first, and are not subject to the DACL nor the mandatory policy
+    privileged = 0
+    if desired & ACCESS_SYSTEM_SECURITY:
+        if 'SeSecurityPrivilege' not in token.privileges:
+            return 0
+        privileged |= ACCESS_SYSTEM_SECURITY
+    if (maximum or desired & WRITE_OWNER) and 'SeTakeOwnershipPrivilege' in token.privileges:
+        privileged |= WRITE_OWNER
+    label_denied = compiled.label_denied if token.integrity_rid < compiled.label_rid else 0
+    if desired & label_denied & ~privileged:
+        return 0
+    is_owner = compiled.owner is not None and compiled.owner in token.allow_sids
+    if is_owner and not compiled.owner_rights:
+        granted |= READ_CONTROL | WRITE_DAC
+    if compiled.null_dacl:
+        granted |= access_mask_cls.GENERIC_MAPPING[3] | desired
+    else:
+        # Rights granted by privileges are not looked up in the DACL, deny ACEs cannot take them away
+        denied = 0
+        wanted = desired & ~(granted | privileged)
+        allow_sids = token.allow_sids
+        deny_sids = token.deny_sids
+        object_types = None if object_types is None else set(object_types)
+        for deny, mask, trustee, object_guid in compiled.aces:
+            if object_guid is not None and (object_types is None or object_guid not in object_types):
+                continue
+            if deny:
+                if trustee in deny_sids or (is_owner and trustee == OWNER_RIGHTS):
+                    denied |= mask & ~(granted | privileged)
+                    if not maximum and denied & wanted:
+                        return 0
+            elif trustee in allow_sids or (is_owner and trustee == OWNER_RIGHTS):
+                granted |= mask & ~denied
+                if not maximum and wanted & ~granted == 0:
+                    break
+    granted = (granted & ~label_denied & ~ACCESS_SYSTEM_SECURITY) | privileged
+    if desired & ~granted:
+        return 0
+    return granted if maximum else desired
+
+
+COMPILED = weakref.WeakKeyDictionary()
+OWNER_RIGHTS = 'S-1-3-4'
+MAXIMUM_ALLOWED = 0x02000000
+ACCESS_SYSTEM_SECURITY = 0x01000000
+SYNCHRONIZE = 0x100000
+WRITE_OWNER = 0x80000
+WRITE_DAC = 0x40000
+READ_CONTROL = 0x20000
+DELETE = 0x10000
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Computes the access rights a token is granted by a security descriptor')
+    parser.add_argument('sd')
+    parser.add_argument('--user', '-u', required=True)
+    parser.add_argument('--group', '-g', action='append', default=[], help='Enabled group SID, or SID:attributes (e.g. S-1-5-32-544:0x10 for deny-only)')
+    parser.add_argument('--privilege', '-p', action='append', default=[], help='e.g. SeSecurityPrivilege, SeTakeOwnershipPrivilege')
+    parser.add_argument('--integrity', '-i', default='ME', help='Integrity level SID or abbreviation (LW, ME, HI, SI)')
+    parser.add_argument('--desired', '-d', default='0x02000000', help='Desired access in SDDL form, defaults to MAXIMUM_ALLOWED')
+    parser.add_argument('--type', '-t', choices=AccessMask.TYPES.keys())
+    args = parser.parse_args()
+    access_mask_cls = AccessMask.get_cls(args.type)
+    groups = []
+    for group in args.group:
+        if ':' in group:
+            group, attributes = group.rsplit(':', 1)
+            groups.append((group, int(attributes, 0)))
+        else:
+            groups.append(group)
+    token = Token(args.user, groups, args.privilege, args.integrity)
+    sd = SD.from_str(args.sd, access_mask_cls=access_mask_cls)
+    granted = access_check(sd, token, access_mask_cls.from_str(args.desired).rights, access_mask_cls)
+    if granted == 0:
+        print('Access denied')
+    else:
+        print(access_mask_cls(None, granted).to_str(with_color=False))
@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
+import io
 import re
 from typing import Optional
-from utils.color import colorize
+from accessmasks import REGISTRY
+from utils.color import Colorizer
 
 
 class AccessMask:
 
-    TYPES = {
-        # Filled by subclasses
-    }
+    # Subclasses are only imported when their type is first looked up
+    TYPES = REGISTRY
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to type-specific rights'},
@@ -50,49 +52,148 @@ class AccessMask:
         {'abbr': 'KW', 'name': '<TYPE SPECIFIC BITS 0x20006>', 'val': 0x20006, 'desc': ''},
     ]
 
+    # Specific rights GENERIC_READ, GENERIC_WRITE, GENERIC_EXECUTE and GENERIC_ALL stand for, as in the
+    # GENERIC_MAPPING of each object type. Without a type, they can only be mapped to standard rights
+    GENERIC_MAPPING = (0x20000, 0x20000, 0x20000, 0x1FFFFF)
+
     def __init__(self, raw: str, rights: int):
-        self.raw = raw
-        self.rights = rights
-
-    def to_str(self, with_color: bool = True) -> str:
-        s = self.raw
-        if with_color:
-            s = colorize(s)
-        if not self.raw.startswith('0x'):
-            s += '\t(0x{:X})'.format(self.rights)
-        remaining = self.rights
-        for bit in range(31, -1, -1):
+        # Masks are shared by every cached ACE parsed from the same text, they are immutable
+        object.__setattr__(self, 'raw', raw)
+        object.__setattr__(self, 'rights', rights)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'AccessMask objects are immutable, cannot set {name}')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'AccessMask objects are immutable, cannot delete {name}')
+
+    def __reduce__(self):
+        return self.__class__, (self.raw, self.rights)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.compile_rights()
+
+    @classmethod
+    def compile_rights(cls):
+        # Type-specific rights take precedence over generic and standard ones, compile them once
+        # per type so that parsing and formatting do not have to scan both lists over and over
+        rights = cls.RIGHTS + AccessMask.RIGHTS
+        cls.RIGHTS_BY_NAME = {}
+        cls.RIGHTS_BY_ABBR = {}
+        cls.RIGHTS_BY_BIT = [None] * 32
+        for right in rights:
+            cls.RIGHTS_BY_NAME.setdefault(right['name'], right['val'])
+            if right['abbr'] is not None:
+                cls.RIGHTS_BY_ABBR.setdefault(right['abbr'], right['val'])
+            if right['val'] & (right['val'] - 1) == 0:
+                bit = right['val'].bit_length() - 1
+                if cls.RIGHTS_BY_BIT[bit] is None:
+                    cls.RIGHTS_BY_BIT[bit] = right
+        # Abbreviations are matched longest first, only lengths which actually exist need to be tried
+        cls.ABBR_LENGTHS = sorted({len(abbr) for abbr in cls.RIGHTS_BY_ABBR}, reverse=True)
+        # Rights which can be written in SDDL, each value with the first abbreviation which parses back
+        # to it (some types reuse an abbreviation for another right), composites (e.g. FA, KA) first
+        sddl_rights = {}
+        for right in rights:
+            if right['abbr'] is not None and right['val'] != 0 and cls.RIGHTS_BY_ABBR[right['abbr']] == right['val']:
+                sddl_rights.setdefault(right['val'], right['abbr'])
+        cls.SDDL_RIGHTS = sorted(sddl_rights.items(), key=lambda right: (-bin(right[0]).count('1'), -right[0]))
+        # Generic rights are expanded in one lookup, indexed by the 4 generic bits (GR, GW, GX, GA)
+        read, write, execute, everything = cls.GENERIC_MAPPING
+        cls.GENERIC_TABLE = tuple((read if index & 0x8 else 0) | (write if index & 0x4 else 0) |
+                                  (execute if index & 0x2 else 0) | (everything if index & 0x1 else 0)
+                                  for index in range(16))
+
+    def to_str(self, with_color: bool = True, colorizer: Optional[Colorizer] = None) -> str:
+        out = io.StringIO()
+        self.write(out, 0, with_color, colorizer)
+        return out.getvalue()
+
+    def write(self, out, depth: int = 0, with_color: bool = True, colorizer: Optional[Colorizer] = None):
+        # Masks decoded from binary security descriptors have no SDDL text of their own
+        raw = self.raw if self.raw is not None else self.to_sddl()
+        out.write((colorizer or Colorizer()).colorize(raw, 'rights') if with_color else raw)
+        if not raw.startswith('0x'):
+            out.write('\t(0x{:X})'.format(self.rights))
+        nl = '\n' + '    ' * (depth + 1)
+        remaining = self.rights & 0xFFFFFFFF
+        while remaining:
+            bit = remaining.bit_length() - 1
             val = 1 << bit
-            if (remaining & val) == 0:
-                continue
             remaining &= ~val
-            for right in self.RIGHTS + AccessMask.RIGHTS:
-                if right['val'] == val:
-                    s += f"\n    0x{'{:X}'.format(val):<8} {right['name']}\t({right['desc']})"
-                    break
+            right = self.RIGHTS_BY_BIT[bit]
+            if right is not None:
+                out.write(f"{nl}0x{'{:X}'.format(val):<8} {right['name']}\t({right['desc']})")
             else:
-                s += '\n    <Unknown {} right 0x{:X}>'.format(self.get_bit_type(bit), val)
-        return s
+                out.write('{}<Unknown {} right 0x{:X}>'.format(nl, self.get_bit_type(bit), val))
 
     def to_sddl(self) -> str:
-        s = ''
-        remaining = self.rights
-        prev_remaining = -1
-        while remaining > 0 and remaining != prev_remaining:
-            prev_remaining = remaining
-            for right in self.RIGHTS:
-                if (right['val'] & remaining) == right['val'] and right['abbr'] is not None:
-                    s += right['abbr']
-                    remaining &= ~right['val']
-                    break
-            for right in AccessMask.RIGHTS:
-                if (right['val'] & remaining) == right['val'] and right['abbr'] is not None:
-                    s += right['abbr']
-                    remaining &= ~right['val']
-                    break
-        if remaining > 0:
-            return '0x{:X}'.format(self.rights)
-        return s
+        return self.encode_sddl(self.rights)
+
+    def map_generic(self) -> 'AccessMask':
+        return type(self)(None, self.map_generic_rights(self.rights))
+
+    @classmethod
+    def map_generic_rights(cls, rights: int) -> int:
+        # Replaces generic rights with the specific rights they map to for this type
+        return cls.GENERIC_TABLE[(rights >> 28) & 0xF] | (rights & 0x0FFFFFFF)
+
+    def to_dict(self) -> dict:
+        return {'mask': self.rights, 'sddl': self.to_sddl(), 'rights': self.right_names()}
+
+    def right_names(self) -> list:
+        # Name of each right set in the mask, from the highest bit down, as hex for unknown bits
+        names = []
+        remaining = self.rights & 0xFFFFFFFF
+        while remaining:
+            bit = remaining.bit_length() - 1
+            remaining &= ~(1 << bit)
+            right = self.RIGHTS_BY_BIT[bit]
+            names.append(right['name'] if right is not None else f'0x{1 << bit:X}')
+        return names
+
+    @classmethod
+    @functools.lru_cache(maxsize=65536)
+    def encode_sddl(cls, rights: int) -> str:
+        # Shortest list of abbreviations whose rights add up to exactly this mask, in ascending bit order
+        cover = cls.find_sddl_cover(rights)
+        if cover is None:
+            return '0x{:X}'.format(rights)
+        cover.sort(key=lambda right: ((right[0] & -right[0]), -right[0]))
+        return ''.join(abbr for _, abbr in cover)
+
+    @classmethod
+    def find_sddl_cover(cls, rights: int) -> Optional[list]:
+        # Abbreviations can only be used if all their bits are set, and one whose bits are all part of
+        # another's is never needed in a shortest cover
+        candidates = [right for right in cls.SDDL_RIGHTS if (right[0] & ~rights) == 0]
+        candidates = [right for right in candidates
+                      if not any(other[0] != right[0] and (right[0] & ~other[0]) == 0 for other in candidates)]
+        covered = 0
+        for val, _ in candidates:
+            covered |= val
+        if covered != rights:
+            return None
+        # Branch and bound: the lowest bit left has to be covered by one of the abbreviations containing it
+        best = [None]
+
+        def search(remaining: int, chosen: list):
+            if remaining == 0:
+                best[0] = list(chosen)
+                return
+            if best[0] is not None and len(chosen) + 1 >= len(best[0]):
+                return
+            lowest = remaining & -remaining
+            options = [right for right in candidates if right[0] & lowest]
+            options.sort(key=lambda right: -bin(right[0] & remaining).count('1'))
+            for right in options:
+                chosen.append(right)
+                search(remaining & ~right[0], chosen)
+                chosen.pop()
+
+        search(rights, [])
+        return best[0]
 
     @classmethod
     def get_cls(cls, objtype: Optional[str]) -> type:
@@ -122,22 +223,25 @@ class AccessMask:
                 continue
             except ValueError:
                 pass
-            for flag in (cls.RIGHTS + AccessMask.RIGHTS):
-                if unparsed == flag['name']:
-                    rights |= flag['val']
-                    unparsed = ''
-                    break
+            val = cls.RIGHTS_BY_NAME.get(unparsed)
+            if val is not None:
+                rights |= val
+                continue
             while len(unparsed) > 0:
-                for flag in (cls.RIGHTS + AccessMask.RIGHTS):
-                    if flag['abbr'] is not None and unparsed.startswith(flag['abbr']):
-                        rights |= flag['val']
-                        unparsed = unparsed[len(flag['abbr']):]
+                for length in cls.ABBR_LENGTHS:
+                    val = cls.RIGHTS_BY_ABBR.get(unparsed[:length])
+                    if val is not None:
+                        rights |= val
+                        unparsed = unparsed[length:]
                         break
                 else:
                     raise ValueError(f'Unknown access right "{unparsed}"')
         return cls(raw, rights)
 
 
+AccessMask.compile_rights()
+
+
 def main(cls: type):
     parser = argparse.ArgumentParser(description='Parser and formatter for access right masks')
     parser.add_argument('accessmask')
@@ -151,9 +255,6 @@ def main(cls: type):
     elif args.format == 'multiline':
         print(mask.to_str(multiline=True))
 
-# Always import subclasses of AccessMask so they get a chance to register themselves
-# in the TYPES dictionary (needs to be after the AccessMask/main definition to resolve circular import)
-from accessmasks import *
 
 if __name__ == '__main__':
     main(AccessMask)
@@ -1,5 +1,55 @@
-import glob
-from os.path import dirname, basename, isfile, join
+import importlib
+from collections.abc import Mapping
 
-modules = glob.glob(join(dirname(__file__), "*.py"))
-__all__ = [ basename(f)[:-3] for f in modules if isfile(f) and not f.endswith('__init__.py')]
+
+class AccessMaskRegistry(Mapping):
+
+    # Maps object type names to their AccessMask subclass, importing each module only when its type is
+    # first used. Listing modules explicitly (instead of globbing this package) also works when running
+    # from a zipapp or a frozen build
+
+    def __init__(self, entries: dict):
+        self.entries = entries
+        self.loaded = {}
+
+    def __getitem__(self, name: str) -> type:
+        cls = self.loaded.get(name)
+        if cls is None:
+            module, cls_name = self.entries[name]
+            cls = getattr(importlib.import_module(f'{__name__}.{module}'), cls_name)
+            self.loaded[name] = cls
+        return cls
+
+    def __contains__(self, name) -> bool:
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+REGISTRY = AccessMaskRegistry({
+    'ad': ('ad', 'ActiveDirectoryAccessMask'),
+    'com': ('com', 'COMAccessMask'),
+    'directory': ('filedir', 'FileDirectoryAccessMask'),
+    'event': ('event', 'EventAccessMask'),
+    'file': ('file', 'FileAccessMask'),
+    'filedir': ('filedir', 'FileDirectoryAccessMask'),
+    'filemapping': ('filemapping', 'FileMappingAccessMask'),
+    'job': ('job', 'JobAccessMask'),
+    'mutant': ('mutant', 'MutantAccessMask'),
+    'mutex': ('mutant', 'MutantAccessMask'),
+    'namedpipe': ('pipe', 'PipeAccessMask'),
+    'pipe': ('pipe', 'PipeAccessMask'),
+    'process': ('process', 'ProcessAccessMask'),
+    'regkey': ('regkey', 'RegKeyAccessMask'),
+    'scm': ('scm', 'SCMAccessMask'),
+    'semaphore': ('semaphore', 'SemaphoreAccessMask'),
+    'service': ('service', 'ServiceAccessMask'),
+    'thread': ('thread', 'ThreadAccessMask'),
+    'timer': ('timer', 'TimerAccessMask'),
+    'token': ('token', 'TokenAccessMask'),
+    'winsta': ('winsta', 'WindowStationAccessMask'),
+})
@@ -5,6 +5,8 @@ from accessmask import AccessMask, main
 
 class ActiveDirectoryAccessMask(AccessMask):
 
+    GENERIC_MAPPING = (0x20094, 0x20028, 0x20004, 0xF01FF)
+
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to READ_PROP | DS_LIST_OBJECT | ACTRL_DS_LIST | READ_CONTROL'},
         {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to WRITE_PROP | DS_SELF | READ_CONTROL'},
@@ -22,7 +24,5 @@ class ActiveDirectoryAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['ad'] = ActiveDirectoryAccessMask
-
 if __name__ == '__main__':
     main(ActiveDirectoryAccessMask)
@@ -5,10 +5,12 @@ from accessmask import AccessMask, main
 
 class COMAccessMask(AccessMask):
 
+    GENERIC_MAPPING = (0x1, 0x1, 0x1, 0x1F)
+
     RIGHTS = [
-        {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to READ_PROP | DS_LIST_OBJECT | ACTRL_DS_LIST | READ_CONTROL'},
-        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to WRITE_PROP | DS_SELF | READ_CONTROL'},
-        {'abbr': 'GX', 'name': 'GENERIC_EXECUTE', 'val': 0x20000000, 'desc': 'Generic right to execute, mapped to ACTRL_DS_LIST | READ_CONTROL'},
+        {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to COM_RIGHTS_EXECUTE'},
+        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to COM_RIGHTS_EXECUTE'},
+        {'abbr': 'GX', 'name': 'GENERIC_EXECUTE', 'val': 0x20000000, 'desc': 'Generic right to execute, mapped to COM_RIGHTS_EXECUTE'},
         {'abbr': 'GA', 'name': 'GENERIC_ALL', 'val': 0x10000000, 'desc': 'Generic right mapped to every other existing right'},
         {'abbr': 'CC', 'name': 'COM_RIGHTS_EXECUTE', 'val': 0x1, 'desc': 'Legacy access right which must always be granted'},
         {'abbr': 'DC', 'name': 'COM_RIGHTS_EXECUTE_LOCAL', 'val': 0x2, 'desc': 'Access an existing instance locally'},
@@ -18,7 +20,5 @@ class COMAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['com'] = COMAccessMask
-
 if __name__ == '__main__':
     main(COMAccessMask)
@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class EventAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F0003
+    GENERIC_MAPPING = (0x20001, 0x20002, 0x120000, 0x1F0003)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to <unknown bit 1> | READ_CONTROL' },
@@ -17,7 +18,5 @@ class EventAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['event'] = EventAccessMask
-
 if __name__ == '__main__':
     main(EventAccessMask)
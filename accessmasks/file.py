@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class FileAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x001F01FF
+    GENERIC_MAPPING = (0x120089, 0x120116, 0x1200A0, 0x1F01FF)
 
     RIGHTS = [
         {'abbr': 'FR', 'name': 'FILE_GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read (mapped to FILE_READ_ATTRIBUTES | FILE_READ_DATA | FILE_READ_EA | SYNCHRONIZE | READ_CONTROL)'},
@@ -27,7 +28,5 @@ class FileAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['file'] = FileAccessMask
-
 if __name__ == '__main__':
     main(FileAccessMask)
@@ -6,12 +6,13 @@ from accessmask import AccessMask, main
 class FileMappingAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F001F
+    GENERIC_MAPPING = (0x20005, 0x20002, 0x20008, 0xF001F)
 
     RIGHTS = [
         {'abbr': None, 'name': 'SYNCHRONIZE', 'val': 0x100000, 'desc': '/!\\ Not supported by this object type'},
-        {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to '},
-        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to '},
-        {'abbr': 'GX', 'name': 'GENERIC_EXECUTE', 'val': 0x20000000, 'desc': 'Generic right to execute, mapped to '},
+        {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to SECTION_QUERY | FILE_MAP_READ | READ_CONTROL'},
+        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to FILE_MAP_WRITE | READ_CONTROL'},
+        {'abbr': 'GX', 'name': 'GENERIC_EXECUTE', 'val': 0x20000000, 'desc': 'Generic right to execute, mapped to SECTION_MAP_EXECUTE | READ_CONTROL'},
         {'abbr': 'GA', 'name': 'GENERIC_ALL', 'val': 0x10000000, 'desc': 'Generic right mapped to every other existing right'},
         {'abbr': None, 'name': 'FILE_MAP_ALL_ACCESS', 'val': 0xF001F, 'desc': 'All file mapping rights that existed when the requestor was compiled'},
         {'abbr': 'CC', 'name': '', 'val': 0x1, 'desc': 'Enumerate existing desktops in this station'},
@@ -26,7 +27,5 @@ class FileMappingAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['filemapping'] = FileMappingAccessMask
-
 if __name__ == '__main__':
     main(FileMappingAccessMask)
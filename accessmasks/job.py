@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class JobAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F003F
+    GENERIC_MAPPING = (0x20004, 0x2000B, 0x120000, 0x1F003F)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to JOB_OBJECT_QUERY | READ_CONTROL'},
@@ -21,7 +22,5 @@ class JobAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['job'] = JobAccessMask
-
 if __name__ == '__main__':
     main(JobAccessMask)
@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class MutantAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F0001
+    GENERIC_MAPPING = (0x20001, 0x20000, 0x120000, 0x1F0001)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to MUTANT_QUERY_STATE | READ_CONTROL'},
@@ -20,8 +21,5 @@ class MutantAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['mutant'] = MutantAccessMask
-AccessMask.TYPES['mutex'] = MutantAccessMask
-
 if __name__ == '__main__':
     main(MutantAccessMask)
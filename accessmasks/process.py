@@ -6,11 +6,12 @@ from accessmask import AccessMask, main
 class ProcessAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1FFFFF
+    GENERIC_MAPPING = (0x20410, 0x20BEA, 0x121001, 0x1FFFFF)
 
     RIGHTS = [
-        {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x00020410, 'desc': 'Generic right to read, mapped to PROCESS_QUERY_INFORMATION | PROCESS_VM_READ | READ_CONTROL'},
-        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x00020BEA, 'desc': 'Generic right to write, mapped to PROCESS_CREATE_THREAD | PROCESS_VM_OPERATION | PROCESS_VM_WRITE | PROCESS_DUP_HANDLE | PROCESS_CREATE_PROCESS | PROCESS_SET_QUOTA | PROCESS_SET_INFORMATION | PROCESS_SUSPEND_RESUME | READ_CONTROL'},
-        {'abbr': 'GX', 'name': 'GENERIC_EXECUTE', 'val': 0x00121001, 'desc': 'Generic right to execute, mapped to PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_TERMINATE | SYNCHRONIZE | READ_CONTROL'},
+        {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to PROCESS_QUERY_INFORMATION | PROCESS_VM_READ | READ_CONTROL'},
+        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to PROCESS_CREATE_THREAD | PROCESS_VM_OPERATION | PROCESS_VM_WRITE | PROCESS_DUP_HANDLE | PROCESS_CREATE_PROCESS | PROCESS_SET_QUOTA | PROCESS_SET_INFORMATION | PROCESS_SUSPEND_RESUME | READ_CONTROL'},
+        {'abbr': 'GX', 'name': 'GENERIC_EXECUTE', 'val': 0x20000000, 'desc': 'Generic right to execute, mapped to PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_TERMINATE | SYNCHRONIZE | READ_CONTROL'},
         {'abbr': 'GA', 'name': 'GENERIC_ALL', 'val': 0x10000000, 'desc': 'Generic right mapped to every other existing right'},
         {'abbr': None, 'name': 'PROCESS_ALL_ACCESS', 'val': 0x1FFFFF, 'desc': 'All rights that existed when the requestor was compiled (was 0x1F0FFF before Vista)'},
         {'abbr': 'CC', 'name': 'PROCESS_TERMINATE', 'val': 0x1, 'desc': 'Terminate the process'},
@@ -30,7 +31,5 @@ class ProcessAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['process'] = ProcessAccessMask
-
 if __name__ == '__main__':
     main(ProcessAccessMask)
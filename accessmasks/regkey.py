@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class RegKeyAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F003F
+    GENERIC_MAPPING = (0x20019, 0x20006, 0x20039, 0xF003F)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to KEY_QUERY_VALUE | KEY_ENUMERATE_SUB_KEYS | KEY_NOTIFY | READ_CONTROL'},
@@ -27,7 +28,5 @@ class RegKeyAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['regkey'] = RegKeyAccessMask
-
 if __name__ == '__main__':
     main(RegKeyAccessMask)
@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class SCMAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F0003
+    GENERIC_MAPPING = (0x20014, 0x20022, 0x20009, 0xF003F)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to SC_MANAGER_ENUMERATE_SERVICE | SC_MANAGER_QUERY_LOCK_STATUS | READ_CONTROL'},
@@ -22,7 +23,5 @@ class SCMAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['scm'] = SCMAccessMask
-
 if __name__ == '__main__':
     main(SCMAccessMask)
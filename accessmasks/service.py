@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class ServiceAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F0003
+    GENERIC_MAPPING = (0x2008D, 0x20002, 0x20170, 0xF01FF)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to SERVICE_QUERY_CONFIG | SERVICE_QUERY_STATUS | SERVICE_INTERROGATE | SERVICE_ENUMERATE_DEPENDENTS | READ_CONTROL'},
@@ -25,7 +26,5 @@ class ServiceAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['service'] = ServiceAccessMask
-
 if __name__ == '__main__':
     main(ServiceAccessMask)
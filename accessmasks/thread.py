@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class ThreadAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1FFFFF
+    GENERIC_MAPPING = (0x20048, 0x20437, 0x121800, 0x1FFFFF)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to THREAD_GET_INFORMATION | THREAD_GET_CONTEXT | READ_CONTROL'},
@@ -27,7 +28,5 @@ class ThreadAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['thread'] = ThreadAccessMask
-
 if __name__ == '__main__':
     main(ThreadAccessMask)
@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class TimerAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F0003
+    GENERIC_MAPPING = (0x20001, 0x20002, 0x120000, 0x1F0003)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to TIMER_QUERY_STATE | READ_CONTROL'},
@@ -18,7 +19,5 @@ class TimerAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['timer'] = TimerAccessMask
-
 if __name__ == '__main__':
     main(TimerAccessMask)
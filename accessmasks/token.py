@@ -6,10 +6,11 @@ from accessmask import AccessMask, main
 class TokenAccessMask(AccessMask):
 
     VALID_RIGHTS = 0x1F01FF
+    GENERIC_MAPPING = (0x2001A, 0x201E0, 0x20005, 0xF01FF)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to TOKEN_DUPLICATE | TOKEN_QUERY | TOKEN_QUERY_SOURCE | READ_CONTROL'},
-        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to TOKEN_ADJUST_PRIVILEGES | TOKEN_ADJUST_GROUPS | TOKEN_ADJUST_SESSIONID | READ_CONTROL'},
+        {'abbr': 'GW', 'name': 'GENERIC_WRITE', 'val': 0x40000000, 'desc': 'Generic right to write, mapped to TOKEN_ADJUST_PRIVILEGES | TOKEN_ADJUST_GROUPS | TOKEN_ADJUST_DEFAULT | TOKEN_ADJUST_SESSIONID | READ_CONTROL'},
         {'abbr': 'GX', 'name': 'GENERIC_EXECUTE', 'val': 0x20000000, 'desc': 'Generic right to execute, mapped to TOKEN_IMPERSONATE | TOKEN_ASSIGN_PRIMARY | READ_CONTROL'},
         {'abbr': 'GA', 'name': 'GENERIC_ALL', 'val': 0x10000000, 'desc': 'Generic right mapped to every other existing right'},
         {'abbr': None, 'name': 'TOKEN_ALL_ACCESS', 'val': 0xF01FF, 'desc': 'Every thread right that existed when the requestor was compiled (was 0xF00FF before Windows 2000)'},
@@ -25,7 +26,5 @@ class TokenAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['token'] = TokenAccessMask
-
 if __name__ == '__main__':
     main(TokenAccessMask)
@@ -6,6 +6,7 @@ from accessmask import AccessMask, main
 class WindowStationAccessMask(AccessMask):
 
     VALID_RIGHTS = 0xF037F
+    GENERIC_MAPPING = (0x20103, 0x2000C, 0x20060, 0xF037F)
 
     RIGHTS = [
         {'abbr': 'GR', 'name': 'GENERIC_READ', 'val': 0x80000000, 'desc': 'Generic right to read, mapped to WINSTA_READATTRIBUTES | WINSTA_ENUMDESKTOPS | WINSTA_ENUMERATE | READ_CONTROL, and WINSTA_READSCREEN if interactive'},
@@ -25,7 +26,5 @@ class WindowStationAccessMask(AccessMask):
     ]
 
 
-AccessMask.TYPES['winsta'] = WindowStationAccessMask
-
 if __name__ == '__main__':
     main(WindowStationAccessMask)
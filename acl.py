@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
 
 import argparse
-from typing import Optional, List
+import io
+import struct
+from types import MappingProxyType
+from typing import Iterable, Optional, List
 from ace import ACE
+from lexer import SDDLSyntaxError, tokenize
+from sid import SID
+from resolver import Resolver
 from accessmask import AccessMask
+from utils.cache import LRUCache
+from utils.color import Colorizer
+from utils.frozen import freeze, is_frozen
 
 
 class ACL:
@@ -13,40 +22,144 @@ class ACL:
         self.flags = flags
         self.aces = aces
 
-    def to_str(self, with_color: bool = True) -> str:
-        s = self.aclstr
+    def to_str(self, with_color: bool = True, colorizer: Optional[Colorizer] = None) -> str:
+        out = io.StringIO()
+        self.write(out, 0, with_color, colorizer)
+        return out.getvalue()
+
+    def write(self, out, depth: int = 0, with_color: bool = True, colorizer: Optional[Colorizer] = None):
+        if with_color and colorizer is None:
+            colorizer = Colorizer()
+        nl = '\n' + '    ' * (depth + 1)
+        out.write(self.aclstr if self.aclstr is not None else self.to_sddl())
         if self.flags is not None and len(self.flags) > 0:
-            s += f'\n    Flags: '
-            s += '\n           '.join(f'{abbr}: {props[0]} ({props[1]})' for abbr, props in self.flags.items())
+            out.write(nl + 'Flags: ')
+            out.write((nl + '       ').join(f'{abbr}: {props[0]} ({props[1]})' for abbr, props in self.flags.items()))
         for num, ace in enumerate([] if self.aces is None else self.aces):
-            s += '\n\n    ACE {}: '.format(num + 1) + '\n    '.join(ace.to_str(with_color).split('\n'))
-        return s
+            out.write('\n' + '    ' * depth + nl + 'ACE {}: '.format(num + 1))
+            if colorizer is not None:
+                colorizer.index = num
+            ace.write(out, depth + 1, with_color, colorizer)
+
+    def freeze(self) -> 'ACL':
+        # Cached ACLs are shared between all security descriptors they appear in, they become read-only
+        if is_frozen(self):
+            return self
+        self.flags = MappingProxyType(self.flags)
+        if self.aces is not None:
+            self.aces = tuple(ace.freeze() for ace in self.aces)
+        return freeze(self)
+
+    def to_dict(self) -> dict:
+        return {
+            'flags': [abbr for abbr in self.flags if abbr != 'NO_ACCESS_CONTROL'],
+            'aces': None if self.aces is None else [ace.to_dict() for ace in self.aces],
+        }
+
+    def to_sddl(self) -> str:
+        if self.aces is None:
+            return 'NO_ACCESS_CONTROL'
+        s = ''.join(abbr for abbr in self.flags if abbr in self.FLAGS and abbr != 'NO_ACCESS_CONTROL')
+        return s + ''.join('(' + ace.to_sddl() + ')' for ace in self.aces)
+
+    @classmethod
+    def from_bytes(cls, buf, offset: int = 0, flags: Optional[dict] = None, access_mask_cls: type = AccessMask,
+                   cached: bool = False, resolve: bool = True):
+        if offset + 8 > len(buf):
+            raise ValueError(f'Truncated ACL header at offset {offset}')
+        revision, _, size, count, _ = struct.unpack_from('<BBHHH', buf, offset)
+        if cached:
+            key = (bytes(buf[offset:offset + size]), tuple(flags or ()), access_mask_cls, resolve)
+            acl = cls.CACHE.get(key)
+            if acl is not None:
+                return acl
+        end = offset + size
+        if size < 8 or end > len(buf):
+            raise ValueError(f'Invalid ACL size {size} at offset {offset}')
+        aces = []
+        pos = offset + 8
+        for _ in range(count):
+            if pos + 4 > end:
+                raise ValueError(f'Truncated ACL at offset {offset}, expected {count} ACEs')
+            aces.append(ACE.from_bytes(buf, pos, access_mask_cls=access_mask_cls, cached=cached, resolve=resolve))
+            pos += struct.unpack_from('<H', buf, pos + 2)[0]
+            if pos > end:
+                raise ValueError(f'ACE overflows its ACL at offset {offset}')
+        acl = cls(None, {} if flags is None else flags, aces)
+        if cached:
+            return cls.CACHE.put(key, acl.freeze())
+        return acl
 
     @classmethod
-    def from_str(cls, raw: str, access_mask_cls: type = AccessMask):
+    def from_str(cls, raw: str, access_mask_cls: type = AccessMask, cached: bool = False, resolve: bool = True):
         raw = raw.strip()
+        return cls.from_tokens(raw, tokenize(raw, sections=False), raw, access_mask_cls=access_mask_cls,
+                               cached=cached, resolve=resolve)
+
+    @classmethod
+    def from_tokens(cls, text: str, tokens: Iterable[tuple], aclstr: str, access_mask_cls: type = AccessMask,
+                    cached: bool = False, resolve: bool = True):
+        # Builds an ACL from the 'flags' and 'ace' spans the lexer found in 'text', 'aclstr' being
+        # the whole ACL as written there
+        if cached:
+            key = (aclstr, access_mask_cls, resolve)
+            acl = cls.CACHE.get(key)
+            if acl is not None:
+                return acl
         flags = {}
-        left = raw
-        ace_start = raw.find('(')
-        if ace_start > 0:
-            raw_flags, left = raw[:ace_start].upper(), raw[ace_start:]
-            while len(raw_flags) > 0:
-                for abbr, props in cls.FLAGS.items():
-                    if raw_flags.startswith(abbr):
-                        flags[abbr] = props
-                        raw_flags = raw_flags[len(abbr):]
-                        break
-                else:
-                    flags[raw_flags] = ('', 'Unknown flag')
-                    raw_flags = ''
-        aces = None
-        if left == '' or (left[0] == '(' and left[-1] == ')'):
-            aces = []
-            for ace in left[1:-1].split(')('):
-                aces.append(ACE.from_str(ace, access_mask_cls=access_mask_cls))
-        return cls(raw, flags, aces)
+        aces = []
+        for kind, start, end in tokens:
+            if kind == 'flags':
+                raw_flags = text[start:end].upper()
+                while len(raw_flags) > 0:
+                    for abbr, props in cls.FLAGS.items():
+                        if raw_flags.startswith(abbr):
+                            flags[abbr] = props
+                            raw_flags = raw_flags[len(abbr):]
+                            break
+                    else:
+                        flags[raw_flags] = ('', 'Unknown flag')
+                        raw_flags = ''
+            elif start == end:
+                raise SDDLSyntaxError('Empty ACE', text, start)
+            else:
+                try:
+                    aces.append(ACE.from_str(text[start:end], access_mask_cls=access_mask_cls, cached=cached,
+                                             resolve=resolve))
+                except SDDLSyntaxError:
+                    raise
+                except ValueError as e:
+                    raise SDDLSyntaxError(str(e), text, start) from e
+        if 'NO_ACCESS_CONTROL' in flags and len(aces) == 0:
+            aces = None
+        acl = cls(aclstr, flags, aces)
+        if cached:
+            return cls.CACHE.put(key, acl.freeze())
+        return acl
+
+    @classmethod
+    def resolve_all(cls, acls: Iterable['ACL'], resolver: Optional[Resolver] = None) -> List['ACL']:
+        # Resolve the trustees of all ACEs parsed with resolve=False at once, instead of one by one.
+        # Returns the ACLs with resolved trustees, in the same order: those which changed are copies,
+        # the originals (which may be cached and shared) are left as they are
+        acls = list(acls)
+        resolved = SID.resolve_all((sid for acl in acls if acl is not None and acl.aces is not None
+                                    for sid in acl.iter_trustees()), resolver=resolver)
+        return [acl if acl is None or acl.aces is None else acl.replace_trustees(resolved) for acl in acls]
+
+    def iter_trustees(self) -> Iterable[SID]:
+        return (ace.trustee for ace in self.aces or ())
+
+    def replace_trustees(self, sids: dict) -> 'ACL':
+        # Copy of this ACL with trustees swapped for the SIDs they map to (e.g. their resolved version),
+        # see resolve_all(), or this ACL itself if none of them changes
+        if not any(ace.trustee in sids for ace in self.aces or ()):
+            return self
+        aces = [ace.with_trustee(sids[ace.trustee]) if ace.trustee in sids else ace for ace in self.aces]
+        return ACL(self.aclstr, None if self.flags is None else dict(self.flags), aces)
 
 
+ACL.CACHE = LRUCache(8192)
 ACL.FLAGS = {
     'P': ('SE_DACL_PROTECTED', 'Blocks inheritance of parent\'s ACEs'),
     'AR': ('SE_DACL_AUTO_INHERIT_REQ', 'ACEs should be automatically propagated to children'),
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import random
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import adguids
+from accessmask import AccessMask
+
+# Realistic-looking security descriptors, generated from a seed so that every run (and every machine)
+# benchmarks the same input. Each object type of AccessMask.TYPES gets its own corpus, shaped after
+# what such objects usually carry: inherited NTFS ACEs, registry keys, services, AD objects with object
+# ACEs. Two extra corpora cover mandatory labels and conditional ACEs
+
+DOMAIN = 'S-1-5-21-3623811015-3361044348-30300820'
+WELL_KNOWN = ['SY', 'BA', 'BU', 'AU', 'WD', 'IU', 'NS', 'LS', 'CO', 'OW', 'PU', 'SO', 'RD', 'AC']
+DOMAIN_RIDS = ['DA', 'DU', 'EA', 'CA', 'DC', 'DD', 'RS', 'PA']
+LABELS = ['LW', 'ME', 'MP', 'HI', 'SI']
+INHERIT_FLAGS = ['', 'CI', 'OI', 'CIOI', 'CIIO', 'OICIIO', 'OICINP']
+ATTRIBUTES = ['Member_of {SID(BA)}', '@User.department == "Finance"', 'Device_Member_of {SID(DD)}',
+              '(@Resource.confidentiality >= 3) && Member_of {SID(AU)}', 'Exists @User.clearance',
+              '@User.title Any_of {"Manager", "Director"}']
+
+# Corpora which are not named after an AccessMask.TYPES entry, and the type they are parsed with
+EXTRA = {
+    'label': 'file',
+    'conditional': 'file',
+}
+
+
+class Generator:
+
+    def __init__(self, seed: int):
+        self.rand = random.Random(seed)
+        self.guids = {
+            'object': sorted(adguids.OBJECT_TYPES),
+            'property': sorted(adguids.ATTRIBUTES) + sorted(adguids.PROPERTY_SETS),
+            'right': sorted(adguids.EXTENDED_RIGHTS) + sorted(adguids.VALIDATED_WRITES),
+        }
+
+    def trustee(self) -> str:
+        roll = self.rand.random()
+        if roll < 0.6:
+            return self.rand.choice(WELL_KNOWN)
+        elif roll < 0.8:
+            return self.rand.choice(DOMAIN_RIDS)
+        return f'{DOMAIN}-{self.rand.randrange(1000, 200000)}'
+
+    def rights(self, cls: type) -> str:
+        # A few named rights of this type, or (rarely) a raw hex mask
+        if self.rand.random() < 0.05 or len(cls.SDDL_RIGHTS) == 0:
+            known = 0
+            for val, _ in cls.SDDL_RIGHTS:
+                known |= val
+            return hex(self.rand.getrandbits(32) & known or 0x00120089)
+        count = self.rand.choice([1, 1, 2, 2, 3, 4])
+        return ''.join(abbr for _, abbr in self.rand.sample(cls.SDDL_RIGHTS, min(count, len(cls.SDDL_RIGHTS))))
+
+    def header(self) -> str:
+        return f'O:{self.trustee()}G:{self.trustee()}'
+
+    def aces(self, cls: type, count: int, flags: List[str], inherited: float = 0.0) -> str:
+        res = []
+        for _ in range(count):
+            acetype = 'D' if self.rand.random() < 0.1 else 'A'
+            ace_flags = self.rand.choice(flags)
+            if self.rand.random() < inherited:
+                ace_flags += 'ID'
+            res.append(f'({acetype};{ace_flags};{self.rights(cls)};;;{self.trustee()})')
+        return ''.join(res)
+
+    def generic(self, cls: type) -> str:
+        return f'{self.header()}D:{self.aces(cls, self.rand.randint(1, 6), [""])}'
+
+    def ntfs(self, cls: type, sacl: str = '') -> str:
+        dacl_flags = self.rand.choice(['', 'AI', 'PAI'])
+        dacl = self.aces(cls, self.rand.randint(2, 10), INHERIT_FLAGS, inherited=0.6)
+        if self.rand.random() < 0.2:
+            sacl = f'(AU;{self.rand.choice(["SA", "FA", "SAFA"])};{self.rights(cls)};;;WD)' + sacl
+        res = f'{self.header()}D:{dacl_flags}{dacl}'
+        if len(sacl) > 0:
+            res += f'S:AI{sacl}'
+        return res
+
+    def registry(self, cls: type) -> str:
+        return f'{self.header()}D:{self.rand.choice(["", "AI", "P"])}{self.aces(cls, self.rand.randint(3, 8), ["", "CI", "CIIO"], 0.5)}'
+
+    def service(self, cls: type) -> str:
+        res = f'D:{self.aces(cls, self.rand.randint(3, 6), [""])}'
+        if self.rand.random() < 0.5:
+            res += f'S:(AU;FA;{self.rights(cls)};;;WD)'
+        return res
+
+    def ad(self, cls: type) -> str:
+        aces = [self.aces(cls, self.rand.randint(2, 5), ['', 'CI', 'CIID'])]
+        for _ in range(self.rand.randint(2, 12)):
+            kind = self.rand.choice(['property', 'property', 'right', 'object'])
+            rights = {'property': 'RPWP', 'right': 'CR', 'object': 'CCDC'}[kind]
+            inherit = self.rand.choice(self.guids['object']) if self.rand.random() < 0.5 else ''
+            acetype = 'OD' if self.rand.random() < 0.05 else 'OA'
+            flags = self.rand.choice(['', 'CI', 'CIIO', 'CIID', 'CIIOID'])
+            aces.append(f'({acetype};{flags};{rights};{self.rand.choice(self.guids[kind])};{inherit};{self.trustee()})')
+        return f'{self.header()}D:{self.rand.choice(["", "AI", "PAI"])}{"".join(aces)}'
+
+    def label(self, cls: type) -> str:
+        policy = self.rand.choice(['NW', 'NW', 'NR', 'NX', 'NWNR', 'NWNRNX'])
+        return self.ntfs(cls, f'(ML;{self.rand.choice(["", "CIOI"])};{policy};;;{self.rand.choice(LABELS)})')
+
+    def conditional(self, cls: type) -> str:
+        aces = self.aces(cls, self.rand.randint(1, 4), INHERIT_FLAGS)
+        for _ in range(self.rand.randint(1, 3)):
+            acetype = 'XD' if self.rand.random() < 0.2 else 'XA'
+            aces += f'({acetype};;{self.rights(cls)};;;{self.trustee()};({self.rand.choice(ATTRIBUTES)}))'
+        return f'{self.header()}D:AI{aces}'
+
+
+SHAPES = {
+    'file': 'ntfs',
+    'filedir': 'ntfs',
+    'directory': 'ntfs',
+    'regkey': 'registry',
+    'service': 'service',
+    'scm': 'service',
+    'ad': 'ad',
+    'label': 'label',
+    'conditional': 'conditional',
+}
+
+
+def generate(count: int = 1000, seed: int = 0) -> Dict[str, Tuple[str, List[str]]]:
+    # Returns {corpus name: (object type, [SDDL strings])}
+    gen = Generator(seed)
+    corpora = {}
+    for name in list(AccessMask.TYPES) + list(EXTRA):
+        objtype = EXTRA.get(name, name)
+        cls = AccessMask.TYPES[objtype]
+        shape = getattr(gen, SHAPES.get(name, 'generic'))
+        corpora[name] = (objtype, [shape(cls) for _ in range(count)])
+    return corpora
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generates a reproducible corpus of SDDL strings, one per line')
+    parser.add_argument('corpus', nargs='*', help='Corpora to generate (defaults to all of them)')
+    parser.add_argument('--count', '-n', type=int, default=1000, help='Security descriptors per corpus')
+    parser.add_argument('--seed', '-s', type=int, default=0)
+    args = parser.parse_args()
+    for name, (objtype, lines) in generate(args.count, args.seed).items():
+        if len(args.corpus) == 0 or name in args.corpus:
+            print('\n'.join(lines))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each measurement runs in a fresh interpreter, so that nothing is already imported or loaded
+SNIPPET = '''
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+from ace import ACE
+ACE.GUID_EXTENDED_RIGHTS.get('00299570-246d-11d0-a768-00aa006e0529')
+looked_up = time.perf_counter()
+print(imported - start, looked_up - imported)
+'''
+
+
+def measure(module: str, runs: int):
+    imports = []
+    lookups = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', SNIPPET.format(root=ROOT, module=module)])
+        import_time, lookup_time = map(float, out.split())
+        imports.append(import_time)
+        lookups.append(lookup_time)
+    return statistics.median(imports), statistics.median(lookups)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measures the time taken to import modules, and to load AD GUID names on first use')
+    parser.add_argument('modules', nargs='*', default=['ace', 'sd'])
+    parser.add_argument('--runs', '-r', type=int, default=20)
+    args = parser.parse_args()
+    for module in args.modules:
+        import_time, lookup_time = measure(module, args.runs)
+        print(f'{module:<10} import: {import_time * 1000:8.2f} ms    first AD GUID lookup: {lookup_time * 1000:8.2f} ms')
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpus import generate
+from sd import SD
+from acl import ACL
+from ace import ACE
+from sid import SID
+from accessmask import AccessMask
+from index import TrusteeIndex, MaskIndex
+
+# Times the parse and format hot paths over the generated corpus (see corpus.py), and writes the
+# results as JSON. Saving them once gives a baseline which later runs can be compared against:
+#   python benchmarks/run.py -o benchmarks/baseline.json
+#   python benchmarks/run.py --baseline benchmarks/baseline.json
+# Each benchmark runs --repeat times and keeps its best time, the least disturbed by everything else
+# running on the machine. Comparisons are only meaningful between runs on the same machine: the
+# committed baseline.json is a reference (see its meta), measure your own before comparing against it
+
+# The CLI is benchmarked end to end on these corpora, all parsed with --type file
+CLI_CORPORA = ['file', 'label', 'conditional']
+
+
+def prepare(corpora: dict) -> Dict[str, list]:
+    # Splits the corpus into the inputs of each hot path, as (AccessMask subclass, input) pairs
+    items = {'sd': [], 'acl': [], 'ace': [], 'sid': [], 'mask': [], 'parsed_sd': [], 'parsed_mask': []}
+    for objtype, lines in corpora.values():
+        cls = AccessMask.TYPES[objtype]
+        for line in lines:
+            sd = SD.from_str(line, access_mask_cls=cls)
+            items['sd'].append((cls, line))
+            items['parsed_sd'].append((cls, sd))
+            for sid in (sd.owner, sd.primary_group):
+                if sid is not None:
+                    items['sid'].append((cls, sid.raw))
+            for acl in (sd.dacl, sd.sacl):
+                if acl is None:
+                    continue
+                items['acl'].append((cls, acl.aclstr))
+                for ace in acl.aces or []:
+                    items['ace'].append((cls, ace.acestr))
+                    items['sid'].append((cls, ace.trustee.raw))
+                    items['mask'].append((type(ace.rights), ace.rights.raw))
+                    items['parsed_mask'].append((type(ace.rights), ace.rights))
+    return items
+
+
+def get_benchmarks(items: Dict[str, list]) -> Dict[str, tuple]:
+    # {name: (function, number of operations per call, setup function or None)}
+
+    def sd_from_str():
+        for cls, raw in items['sd']:
+            SD.from_str(raw, access_mask_cls=cls)
+
+    def sd_from_str_cached():
+        for cls, raw in items['sd']:
+            SD.from_str(raw, access_mask_cls=cls, cached=True)
+
+    def sd_to_sddl():
+        for _, sd in items['parsed_sd']:
+            sd.to_sddl()
+
+    def sd_to_str():
+        for _, sd in items['parsed_sd']:
+            sd.to_str(with_color=False)
+
+    def acl_from_str():
+        for cls, raw in items['acl']:
+            ACL.from_str(raw, access_mask_cls=cls)
+
+    def ace_from_str():
+        for cls, raw in items['ace']:
+            ACE.from_str(raw, access_mask_cls=cls)
+
+    def sid_from_str():
+        for _, raw in items['sid']:
+            SID.from_str(raw)
+
+    def sid_parse():
+        for _, raw in items['sid']:
+            SID.parse(raw)
+
+    def mask_from_str():
+        for cls, raw in items['mask']:
+            cls.from_str(raw)
+
+    def mask_to_str():
+        for _, mask in items['parsed_mask']:
+            mask.to_str(with_color=False)
+
+    def mask_to_sddl():
+        for _, mask in items['parsed_mask']:
+            mask.to_sddl()
+
+    # Objects of the index all share the type of the first corpus, and each descriptor 10 objects
+    index_cls = items['sd'][0][0] if len(items['sd']) > 0 else AccessMask
+    index_lines = [raw for cls, raw in items['sd'] if cls is index_cls] * 10
+    index = TrusteeIndex(index_cls).add_many(enumerate(index_lines))
+    index_trustees = [sid for cls, sid in items['sid'] if cls is index_cls]
+    mask_index = MaskIndex(index_cls).add_many(enumerate(index_lines)).finalize()
+    # WRITE_DAC, WRITE_OWNER, DELETE and GENERIC_ALL, in each query mode
+    mask_queries = [(rights, mode) for rights in (0x40000, 0xC0000, 0x10000000) for mode in ('superset', 'any', 'subset')]
+
+    def index_add():
+        TrusteeIndex(index_cls).add_many(enumerate(index_lines))
+
+    def index_find_sds():
+        for trustee in index_trustees:
+            index.find_sds(trustee, 0x2, match_all=False)
+
+    def mask_index_query_rows():
+        for rights, mode in mask_queries:
+            mask_index.query_rows(rights, mode)
+
+    def clear_sd_cache():
+        SD.CACHE.clear()
+
+    def clear_sddl_cache():
+        # Encodings are memoized per class, start each run as a fresh process would
+        for cls in set(cls for cls, _ in items['parsed_mask']):
+            cls.encode_sddl.cache_clear()
+
+    return {
+        'sd.from_str': (sd_from_str, len(items['sd']), None),
+        'sd.from_str[cached]': (sd_from_str_cached, len(items['sd']), clear_sd_cache),
+        'sd.to_sddl': (sd_to_sddl, len(items['parsed_sd']), None),
+        'sd.to_str': (sd_to_str, len(items['parsed_sd']), None),
+        'acl.from_str': (acl_from_str, len(items['acl']), None),
+        'ace.from_str': (ace_from_str, len(items['ace']), None),
+        'sid.from_str': (sid_from_str, len(items['sid']), None),
+        'sid.parse': (sid_parse, len(items['sid']), None),
+        'accessmask.from_str': (mask_from_str, len(items['mask']), None),
+        'accessmask.to_str': (mask_to_str, len(items['parsed_mask']), None),
+        'accessmask.to_sddl': (mask_to_sddl, len(items['parsed_mask']), clear_sddl_cache),
+        'index.add': (index_add, len(index_lines), None),
+        'index.find_sds': (index_find_sds, len(index_trustees), None),
+        'maskindex.query_rows': (mask_index_query_rows, len(mask_queries), None),
+    }
+
+
+def time_best(func: Callable, repeat: int, setup: Callable = None) -> float:
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_cli(lines: List[str], output_format: str, repeat: int) -> float:
+    # Wall time of a whole sd.py run, interpreter startup included
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'corpus.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        cmd = [sys.executable, os.path.join(ROOT, 'sd.py'), '--type', 'file', '--input', path,
+               '--format', output_format, '--output', os.devnull]
+
+        def run():
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+
+        return time_best(run, repeat)
+
+
+def run_all(count: int, seed: int, repeat: int, only: List[str], cli: bool) -> dict:
+    corpora = generate(count, seed)
+    benchmarks = get_benchmarks(prepare(corpora))
+    cli_lines = [line for name in CLI_CORPORA for line in corpora[name][1]]
+    if cli:
+        for output_format in ('sddl', 'jsonl'):
+            benchmarks[f'cli[{output_format}]'] = (output_format, len(cli_lines), None)
+    results = {}
+    for name, (func, ops, setup) in benchmarks.items():
+        if len(only) > 0 and not any(pattern in name for pattern in only):
+            continue
+        if name.startswith('cli['):
+            seconds = time_cli(cli_lines, func, max(1, repeat // 2))
+        else:
+            seconds = time_best(func, repeat, setup)
+        results[name] = {'ops': ops, 'seconds': seconds, 'us_per_op': seconds * 1e6 / max(ops, 1)}
+        print(f'{name:<24} {ops:>8} ops  {results[name]["us_per_op"]:>10.2f} us/op', file=sys.stderr)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'count': count,
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    # Returns the names of benchmarks slower than the baseline by more than 'tolerance' (a fraction)
+    regressions = []
+    if baseline['meta'].get('count') != report['meta']['count'] or baseline['meta'].get('seed') != report['meta']['seed']:
+        print('Warning: the baseline was measured on a different corpus', file=sys.stderr)
+    for name, result in report['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f'{name:<24} (not in baseline)', file=sys.stderr)
+            continue
+        ratio = result['us_per_op'] / base['us_per_op']
+        status = 'REGRESSION' if ratio > 1 + tolerance else 'ok'
+        if status != 'ok':
+            regressions.append(name)
+        print(f'{name:<24} {base["us_per_op"]:>10.2f} -> {result["us_per_op"]:>10.2f} us/op  {ratio:>6.2f}x  {status}',
+              file=sys.stderr)
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks parsing and formatting of security descriptors')
+    parser.add_argument('--count', '-n', type=int, default=500, help='Security descriptors per corpus (see corpus.py)')
+    parser.add_argument('--seed', '-s', type=int, default=0)
+    parser.add_argument('--repeat', '-r', type=int, default=5, help='Runs per benchmark, the best one is kept')
+    parser.add_argument('--only', '-k', action='append', default=[], help='Only run benchmarks whose name contains this (can be repeated)')
+    parser.add_argument('--no-cli', action='store_true', help='Skip end to end runs of sd.py')
+    parser.add_argument('--output', '-o', default='-', help='Where to write results as JSON, - for stdout')
+    parser.add_argument('--baseline', '-b', help='Results of a previous run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Slowdown tolerated before failing, as a fraction of the baseline')
+    args = parser.parse_args()
+    report = run_all(args.count, args.seed, args.repeat, args.only, not args.no_cli)
+    if args.output == '-':
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if len(regressions) > 0:
+            print(f'{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}: {", ".join(regressions)}', file=sys.stderr)
+            sys.exit(1)
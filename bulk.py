@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+import argparse
+import collections
+import concurrent.futures
+import itertools
+import json
+import os
+import sys
+from typing import Iterable, Iterator, Optional, Tuple
+from sd import SD
+from sid import SID
+from accessmask import AccessMask
+from resolver import Resolver
+
+
+def parse_chunk(objtype: Optional[str], chunk: list) -> list:
+    # Runs in worker processes: returns one compact record per descriptor (see SD.to_dict()), or an
+    # {'error': ...} record, rather than pickled object graphs. Trustees are left unresolved, the
+    # parent resolves those of all its workers through its own (cached) resolver
+    access_mask_cls = AccessMask.get_cls(objtype)
+    res = []
+    for index, descriptor in chunk:
+        try:
+            sd = SD.from_str(descriptor, access_mask_cls=access_mask_cls, cached=True, resolve=False)
+            res.append((index, sd.to_dict()))
+        except Exception as e:
+            res.append((index, {'error': f'{type(e).__name__}: {e}'}))
+    return res
+
+
+def iter_sid_records(record: dict) -> Iterator[dict]:
+    for key in ('owner', 'group'):
+        if record.get(key) is not None:
+            yield record[key]
+    for key in ('dacl', 'sacl'):
+        if record.get(key) is not None and record[key]['aces'] is not None:
+            for ace in record[key]['aces']:
+                yield ace['trustee']
+
+
+def resolve_records(records: Iterable[dict], resolver: Optional[Resolver] = None):
+    # Same as SD.resolve_all(), on records: all SIDs and names still unresolved are looked up at once
+    resolver = SID.RESOLVER if resolver is None else resolver
+    to_names = collections.defaultdict(list)
+    from_names = collections.defaultdict(list)
+    for record in records:
+        for sid in iter_sid_records(record):
+            if sid['sid'] is not None and sid['name'] is None:
+                to_names[sid['sid']].append(sid)
+            elif sid['sid'] is None and sid['name'] is not None:
+                from_names[sid['name']].append(sid)
+    for sidstr, name in resolver.resolve_many_to_names(list(to_names)).items():
+        for sid in to_names[sidstr]:
+            sid['name'] = name
+    for name, sidstr in resolver.resolve_many_from_names(list(from_names)).items():
+        for sid in from_names[name]:
+            sid['sid'] = sidstr
+
+
+def iter_chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def parse_many(descriptors: Iterable, type: Optional[str] = None, workers: Optional[int] = None,
+               chunksize: int = 256, ordered: bool = True, resolve: bool = True) -> Iterator[Tuple[int, dict]]:
+    # Parses security descriptors (SDDL, hex, or bytes) in a pool of worker processes, and yields
+    # (position in the input, record) pairs, in input order or as soon as each chunk is done. Input is
+    # consumed lazily, with at most two chunks per worker in flight
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = iter_chunks(enumerate(descriptors), chunksize)
+    if workers <= 1:
+        results = (parse_chunk(type, chunk) for chunk in chunks)
+        yield from iter_results(results, resolve)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = collections.deque()
+        for chunk in itertools.islice(chunks, workers * 2):
+            pending.append(pool.submit(parse_chunk, type, chunk))
+        yield from iter_results(iter_futures(pool, pending, chunks, type, ordered), resolve)
+
+
+def iter_futures(pool, pending: collections.deque, chunks: Iterator[list], objtype: Optional[str],
+                 ordered: bool) -> Iterator[list]:
+    while len(pending) > 0:
+        if ordered:
+            done = pending.popleft()
+        else:
+            done = next(concurrent.futures.as_completed(pending))
+            pending.remove(done)
+        for chunk in itertools.islice(chunks, 1):
+            pending.append(pool.submit(parse_chunk, objtype, chunk))
+        yield done.result()
+
+
+def iter_results(results: Iterable[list], resolve: bool) -> Iterator[Tuple[int, dict]]:
+    for result in results:
+        if resolve:
+            resolve_records(record for _, record in result if 'error' not in record)
+        yield from result
+
+
+def format_many(lines: Iterable[tuple], writer, type: Optional[str] = None, workers: Optional[int] = None,
+                chunksize: int = 256, batch_size: int = 1000, err=sys.stderr) -> int:
+    # Same as sd.format_stream(), with parsing spread over worker processes: (source, line number, line)
+    # are parsed in order and handed to the writer (see export.py) as records. Returns the number of
+    # lines which could not be parsed
+    positions = {}
+
+    def descriptors():
+        index = 0
+        for source, num, line in lines:
+            line = line.strip()
+            if len(line) > 0:
+                positions[index] = (source, num)
+                index += 1
+                yield line
+
+    errors = 0
+    batch = []
+    for index, record in parse_many(descriptors(), type, workers, chunksize):
+        source, num = positions.pop(index)
+        if 'error' in record:
+            errors += 1
+            # Keep errors next to the output of the lines around them
+            if len(batch) > 0:
+                writer.write_dicts(batch)
+                batch.clear()
+            err.write(f'{source}:{num}: {record["error"]}\n')
+            err.flush()
+            continue
+        batch.append((source, num, record))
+        if len(batch) >= batch_size:
+            writer.write_dicts(batch)
+            batch.clear()
+    if len(batch) > 0:
+        writer.write_dicts(batch)
+    return errors
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Parses security descriptors from stdin (one per line) in parallel, and writes them as JSON lines')
+    parser.add_argument('--type', '-t', choices=AccessMask.TYPES.keys())
+    parser.add_argument('--workers', '-w', type=int, default=None, help='Number of worker processes (defaults to the number of CPUs)')
+    parser.add_argument('--chunksize', type=int, default=256)
+    parser.add_argument('--unordered', action='store_true', help='Write results as soon as they are parsed')
+    args = parser.parse_args()
+    lines = (line.strip() for line in sys.stdin if len(line.strip()) > 0)
+    for index, record in parse_many(lines, args.type, args.workers, args.chunksize, not args.unordered):
+        print(json.dumps(dict(record, index=index), separators=(',', ':')))
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+import abc
+import csv
+import json
+import sys
+from typing import Iterable, Iterator, Optional, TextIO
+
+
+# Flat, one-row-per-ACE layout shared by the CSV and Arrow/Parquet writers
+ACE_COLUMNS = [
+    ('source', 'string'),
+    ('line', 'int64'),
+    ('owner_sid', 'string'),
+    ('group_sid', 'string'),
+    ('acl', 'string'),
+    ('acl_flags', 'string'),
+    ('ace_index', 'int32'),
+    ('ace_type', 'string'),
+    ('ace_flags', 'string'),
+    ('mask', 'uint32'),
+    ('rights', 'string'),
+    ('object_guid', 'string'),
+    ('inherit_object_guid', 'string'),
+    ('trustee_sid', 'string'),
+    ('trustee_name', 'string'),
+    ('resource_attribute', 'string'),
+]
+
+
+def iter_ace_rows(source: Optional[str], line: Optional[int], record: dict) -> Iterator[dict]:
+    # One row per ACE of a security descriptor record (see SD.to_dict()). ACLs without any ACE still
+    # get a row with empty ACE columns, so that they show up in queries
+    owner = None if record['owner'] is None else record['owner']['sid']
+    group = None if record['group'] is None else record['group']['sid']
+    for name in ('dacl', 'sacl'):
+        acl = record[name]
+        if acl is None:
+            continue
+        row = {'source': source, 'line': line, 'owner_sid': owner, 'group_sid': group, 'acl': name[0].upper(),
+               'acl_flags': ''.join(acl['flags']) or None}
+        if not acl['aces']:
+            yield dict(dict.fromkeys(col for col, _ in ACE_COLUMNS), **row)
+            continue
+        for num, ace in enumerate(acl['aces']):
+            yield dict(row, **{
+                'ace_index': num,
+                'ace_type': ace['type'],
+                'ace_flags': ''.join(ace['flags']) or None,
+                'mask': ace['access_mask']['mask'],
+                'rights': '|'.join(ace['access_mask']['rights']) or None,
+                'object_guid': ace['object_guid'],
+                'inherit_object_guid': ace['inherit_object_guid'],
+                'trustee_sid': ace['trustee']['sid'],
+                'trustee_name': ace['trustee']['name'],
+                'resource_attribute': ace['resource_attribute'],
+            })
+
+
+def close_stream(stream: TextIO):
+    if stream not in (sys.stdout, sys.stderr):
+        stream.close()
+
+
+class TextWriter:
+
+    def __init__(self, stream: TextIO = sys.stdout, sddl: bool = False):
+        self.stream = stream
+        self.sddl = sddl
+
+    def write_dicts(self, records: Iterable[tuple]):
+        if not self.sddl:
+            raise ValueError('Multiline output can only be written from parsed security descriptors')
+        self.stream.write('\n'.join(record['sddl'] for _, _, record in records) + '\n')
+        self.stream.flush()
+
+    def write_batch(self, records: Iterable[tuple]):
+        if self.sddl:
+            self.stream.write('\n'.join(sd.to_sddl() for _, _, sd in records) + '\n')
+        else:
+            # Only color output meant for a terminal
+            with_color = self.stream.isatty()
+            for _, _, sd in records:
+                sd.write(self.stream, with_color=with_color)
+                self.stream.write('\n')
+        self.stream.flush()
+
+    def close(self):
+        close_stream(self.stream)
+
+
+class RecordWriter(abc.ABC):
+
+    # Writers working from SD.to_dict() records, which is all they get from parse_many() workers
+
+    def write_batch(self, records: Iterable[tuple]):
+        self.write_dicts([(source, line, sd.to_dict()) for source, line, sd in records])
+
+    @abc.abstractmethod
+    def write_dicts(self, records: Iterable[tuple]):
+        pass
+
+
+class JsonLinesWriter(RecordWriter):
+
+    # One JSON object per security descriptor and per line, see SD.to_dict()
+
+    def __init__(self, stream: TextIO = sys.stdout):
+        self.stream = stream
+
+    def write_dicts(self, records: Iterable[tuple]):
+        lines = []
+        for source, line, record in records:
+            record = dict(record, source=source, line=line)
+            lines.append(json.dumps(record, separators=(',', ':')))
+        self.stream.write('\n'.join(lines) + '\n')
+        self.stream.flush()
+
+    def close(self):
+        close_stream(self.stream)
+
+
+class CsvWriter(RecordWriter):
+
+    # One row per ACE, see ACE_COLUMNS
+
+    def __init__(self, stream: TextIO = sys.stdout):
+        self.stream = stream
+        self.writer = csv.DictWriter(stream, fieldnames=[col for col, _ in ACE_COLUMNS], lineterminator='\n')
+        self.writer.writeheader()
+
+    def write_dicts(self, records: Iterable[tuple]):
+        for source, line, record in records:
+            self.writer.writerows(iter_ace_rows(source, line, record))
+        self.stream.flush()
+
+    def close(self):
+        close_stream(self.stream)
+
+
+class ArrowWriter(RecordWriter):
+
+    # One row per ACE (see ACE_COLUMNS) written as a Parquet file, or as an Arrow IPC stream, one
+    # record batch per batch of security descriptors. pyarrow is only needed (and imported) here
+
+    def __init__(self, path: str, file_format: str = 'parquet'):
+        try:
+            import pyarrow
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError(f'Writing {file_format} files requires pyarrow (pip install pyarrow)') from None
+        self.pa = pyarrow
+        self.file_format = file_format
+        self.schema = pyarrow.schema([(col, getattr(pyarrow, col_type)()) for col, col_type in ACE_COLUMNS])
+        if file_format == 'parquet':
+            self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        elif file_format == 'arrow':
+            self.writer = pyarrow.ipc.new_stream(path, self.schema)
+        else:
+            raise ValueError(f'Unsupported file format "{file_format}"')
+
+    def write_dicts(self, records: Iterable[tuple]):
+        columns = {col: [] for col, _ in ACE_COLUMNS}
+        for source, line, record in records:
+            for row in iter_ace_rows(source, line, record):
+                for col, values in columns.items():
+                    values.append(row[col])
+        batch = self.pa.record_batch([columns[col] for col, _ in ACE_COLUMNS], schema=self.schema)
+        if self.file_format == 'arrow':
+            self.writer.write_batch(batch)
+        else:
+            self.writer.write_table(self.pa.Table.from_batches([batch], schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+FORMATS = ['multiline', 'sddl', 'jsonl', 'csv', 'parquet', 'arrow']
+
+
+def get_writer(output_format: str, path: str = '-'):
+    # Text formats are written to a file or stdout ('-'), binary ones need an output file
+    if output_format in ('parquet', 'arrow'):
+        if path == '-':
+            raise ValueError(f'An output file is required for the {output_format} format')
+        return ArrowWriter(path, file_format=output_format)
+    stream = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='')
+    if output_format == 'jsonl':
+        return JsonLinesWriter(stream)
+    elif output_format == 'csv':
+        return CsvWriter(stream)
+    return TextWriter(stream, sddl=(output_format == 'sddl'))
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+
+import argparse
+import re
+import sys
+from array import array
+from typing import Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+from sd import SD, iter_input_lines
+from sid import SID, as_sid, sid_key
+from accessmask import AccessMask
+
+
+class TrusteeIndex:
+
+    # Inverted index from trustees to the descriptors granting (or denying, auditing...) them rights,
+    # over a stream of (object id, SD or SDDL string) pairs. Objects sharing a descriptor share its
+    # id, and each distinct descriptor is only parsed and indexed once. The postings of a trustee are
+    # (descriptor id, entry) pairs, where the entry indexes a table of the distinct (ACE type, mask),
+    # written as varints with descriptor ids delta-encoded: ids only grow as descriptors are added,
+    # so the lists are compressed as they are built. Queries first pick the entries of the table with
+    # the wanted rights, then scan postings for them, and only then map descriptors to objects.
+    # Generic rights are mapped with the index's AccessMask subclass, in ACEs and queries alike.
+    # Trustees are matched by SID as written in ACEs: group memberships are not expanded
+
+    def __init__(self, access_mask_cls: type = AccessMask, inherit_only: bool = False):
+        self.access_mask_cls = access_mask_cls
+        # Inherit-only ACEs grant nothing on the object itself, and are not indexed unless asked to
+        self.inherit_only = inherit_only
+        self.objects = []
+        self.object_sds = array('I')
+        self.sd_ids = {}
+        self.sddls = []
+        self.entries = []
+        self.entry_ids = {}
+        self.postings = {}
+        self.last_sd = {}
+        # Objects of each descriptor, as offsets into an array of object positions (see finalize())
+        self.sd_offsets = None
+        self.sd_objects = None
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def add(self, object_id: Hashable, sd: Union[SD, str]) -> int:
+        # Returns the id of the object's descriptor. Descriptors are deduplicated on their SDDL form
+        # before being parsed, so strings are best passed as they come
+        key = (sd.raw if sd.raw is not None else sd.to_sddl()) if isinstance(sd, SD) else sd.strip()
+        sd_id = self.sd_ids.get(key)
+        if sd_id is None:
+            if not isinstance(sd, SD):
+                sd = SD.from_str(key, access_mask_cls=self.access_mask_cls, resolve=False)
+            sd_id = self.sd_ids[key] = len(self.sddls)
+            self.sddls.append(key)
+            self.index_sd(sd_id, sd)
+        self.objects.append(object_id)
+        self.object_sds.append(sd_id)
+        self.sd_offsets = self.sd_objects = None
+        return sd_id
+
+    def add_many(self, objects: Iterable[Tuple[Hashable, Union[SD, str]]]) -> 'TrusteeIndex':
+        for object_id, sd in objects:
+            self.add(object_id, sd)
+        return self
+
+    def index_sd(self, sd_id: int, sd: SD):
+        for acl in (sd.dacl, sd.sacl):
+            if acl is None or acl.aces is None:
+                continue
+            for ace in acl.aces:
+                if ace.rights is None or (not self.inherit_only and 'IO' in ace.flags):
+                    continue
+                mask = self.access_mask_cls.map_generic_rights(ace.rights.rights)
+                entry = self.entry_ids.get((ace.acetype, mask))
+                if entry is None:
+                    entry = self.entry_ids[(ace.acetype, mask)] = len(self.entries)
+                    self.entries.append((ace.acetype, mask))
+                self.add_posting(sd_id, entry, sid_key(ace.trustee))
+
+    def add_posting(self, sd_id: int, entry: int, trustee: str):
+        postings = self.postings.get(trustee)
+        if postings is None:
+            postings = self.postings[trustee] = bytearray()
+        write_varint(postings, sd_id - self.last_sd.get(trustee, 0))
+        write_varint(postings, entry)
+        self.last_sd[trustee] = sd_id
+
+    def finalize(self) -> 'TrusteeIndex':
+        # Groups objects by descriptor (a counting sort), done again by the first query after an add()
+        counts = array('I', bytes(4 * (len(self.sddls) + 1)))
+        for sd_id in self.object_sds:
+            counts[sd_id + 1] += 1
+        for sd_id in range(len(self.sddls)):
+            counts[sd_id + 1] += counts[sd_id]
+        fill = array('I', counts)
+        objects = array('I', bytes(4 * len(self.objects)))
+        for pos, sd_id in enumerate(self.object_sds):
+            objects[fill[sd_id]] = pos
+            fill[sd_id] += 1
+        self.sd_offsets = counts
+        self.sd_objects = objects
+        return self
+
+    def match_entries(self, rights: int, match_all: bool, acetypes: Optional[Iterable[str]]) -> set:
+        rights = self.access_mask_cls.map_generic_rights(rights)
+        types = None if acetypes is None else {acetype.upper() for acetype in acetypes}
+        return {entry for entry, (acetype, mask) in enumerate(self.entries)
+                if (types is None or acetype in types)
+                and (rights == 0 or (mask & rights == rights if match_all else mask & rights != 0))}
+
+    def find_sds(self, trustee: Union[SID, str], rights: int = 0, match_all: bool = True,
+                 acetypes: Optional[Iterable[str]] = ('A', 'OA')) -> List[int]:
+        # Ids of the descriptors with an ACE of one of 'acetypes' (all of them if None) for 'trustee',
+        # with all (or, if not match_all, any) of the bits of 'rights' set, in increasing order
+        postings = self.postings.get(sid_key(as_sid(trustee)))
+        if postings is None:
+            return []
+        wanted = self.match_entries(rights, match_all, acetypes)
+        if len(wanted) == 0:
+            return []
+        res = []
+        sd_id = 0
+        for delta, entry in iter_postings(postings):
+            sd_id += delta
+            if entry in wanted and (len(res) == 0 or res[-1] != sd_id):
+                res.append(sd_id)
+        return res
+
+    def find(self, trustee: Union[SID, str], rights: int = 0, match_all: bool = True,
+             acetypes: Optional[Iterable[str]] = ('A', 'OA')) -> Iterator[Hashable]:
+        # Ids of the objects matching find_sds(), grouped by descriptor
+        return self.iter_objects(self.find_sds(trustee, rights, match_all, acetypes))
+
+    def iter_objects(self, sd_ids: Iterable[int]) -> Iterator[Hashable]:
+        if self.sd_offsets is None:
+            self.finalize()
+        objects = self.objects
+        for sd_id in sd_ids:
+            yield from map(objects.__getitem__, self.sd_objects[self.sd_offsets[sd_id]:self.sd_offsets[sd_id + 1]])
+
+    def get_sd(self, sd_id: int) -> SD:
+        return SD.from_str(self.sddls[sd_id], access_mask_cls=self.access_mask_cls, cached=True)
+
+    def trustees(self) -> List[Tuple[str, int]]:
+        # (SID, number of postings) pairs, largest first
+        counts = [(trustee, sum(1 for _ in iter_postings(postings))) for trustee, postings in self.postings.items()]
+        return sorted(counts, key=lambda item: -item[1])
+
+    def to_str(self) -> str:
+        size = sum(len(postings) for postings in self.postings.values())
+        return (f'{len(self.objects)} objects, {len(self.sddls)} distinct descriptors, {len(self.postings)} trustees, '
+                f'{len(self.entries)} distinct entries, {size} bytes of postings')
+
+
+class MaskIndex(TrusteeIndex):
+
+    # TrusteeIndex which also answers mask queries over every indexed ACE (one row per ACE of each
+    # distinct descriptor) without looking at rows one by one: each bit of the 32-bit masks has a
+    # bitmap of the rows with that bit set, held in a Python int, and so does each ACE type.
+    # Queries are then ANDs and ORs of a few big ints, each running in C over whole bitmaps:
+    # - superset: masks with all the bits of 'rights', AND of their bitmaps
+    # - any: masks with any of them, OR of their bitmaps (every mask if 'rights' is 0, like find_sds())
+    # - subset: masks with no other bit, every row minus the OR of the other bits' bitmaps
+    # Bitmaps are built as bytearrays while adding, and turned into ints by finalize(). Trustees keep
+    # sorted arrays of their rows instead, which are checked against the result's bytes
+
+    def __init__(self, access_mask_cls: type = AccessMask, inherit_only: bool = False):
+        super().__init__(access_mask_cls, inherit_only)
+        self.row_sds = array('I')
+        self.row_entries = array('I')
+        self.row_trustees = array('I')
+        self.trustee_ids = {}
+        self.trustee_keys = []
+        self.trustee_rows = []
+        self.bit_bufs = [bytearray() for _ in range(32)]
+        self.type_bufs = {}
+        self.entry_bits = []
+        # Bitmaps as ints, None until finalize()
+        self.bit_maps = None
+        self.type_maps = None
+
+    def add_posting(self, sd_id: int, entry: int, trustee: str):
+        super().add_posting(sd_id, entry, trustee)
+        self.bit_maps = self.type_maps = None
+        row = len(self.row_sds)
+        byte, bit = row >> 3, 1 << (row & 7)
+        if bit == 1:
+            for buf in self.bit_bufs:
+                buf.append(0)
+        while len(self.entry_bits) <= entry:
+            mask = self.entries[len(self.entry_bits)][1]
+            self.entry_bits.append([pos for pos in range(32) if mask >> pos & 1])
+        for pos in self.entry_bits[entry]:
+            self.bit_bufs[pos][byte] |= bit
+        acetype = self.entries[entry][0]
+        buf = self.type_bufs.get(acetype)
+        if buf is None:
+            buf = self.type_bufs[acetype] = bytearray()
+        buf.extend(bytes(byte + 1 - len(buf)))
+        buf[byte] |= bit
+        trustee_id = self.trustee_ids.get(trustee)
+        if trustee_id is None:
+            trustee_id = self.trustee_ids[trustee] = len(self.trustee_keys)
+            self.trustee_keys.append(trustee)
+            self.trustee_rows.append(array('I'))
+        self.trustee_rows[trustee_id].append(row)
+        self.row_sds.append(sd_id)
+        self.row_entries.append(entry)
+        self.row_trustees.append(trustee_id)
+
+    def finalize(self) -> 'MaskIndex':
+        super().finalize()
+        self.bit_maps = [int.from_bytes(buf, 'little') for buf in self.bit_bufs]
+        self.type_maps = {acetype: int.from_bytes(buf, 'little') for acetype, buf in self.type_bufs.items()}
+        return self
+
+    def query_bitmap(self, rights: int, mode: str = 'superset', acetypes: Optional[Iterable[str]] = ('A', 'OA')) -> int:
+        # Bitmap of the rows of ACEs of one of 'acetypes' (all of them if None) whose mask matches
+        # 'rights' (see above)
+        if self.bit_maps is None:
+            self.finalize()
+        rows = len(self.row_sds)
+        every = (1 << rows) - 1
+        rights = self.access_mask_cls.map_generic_rights(rights)
+        bits = [pos for pos in range(32) if rights >> pos & 1]
+        if mode == 'superset':
+            res = every
+            for pos in bits:
+                res &= self.bit_maps[pos]
+        elif mode == 'any':
+            res = 0 if len(bits) > 0 else every
+            for pos in bits:
+                res |= self.bit_maps[pos]
+        elif mode == 'subset':
+            others = 0
+            for pos in range(32):
+                if not rights >> pos & 1:
+                    others |= self.bit_maps[pos]
+            res = every & ~others
+        else:
+            raise ValueError(f'Unknown mask query mode "{mode}"')
+        if acetypes is not None:
+            types = 0
+            for acetype in acetypes:
+                types |= self.type_maps.get(acetype.upper(), 0)
+            res &= types
+        return res
+
+    def count(self, rights: int, mode: str = 'superset', acetypes: Optional[Iterable[str]] = ('A', 'OA')) -> int:
+        # Number of matching ACEs, without listing them
+        return bin(self.query_bitmap(rights, mode, acetypes)).count('1')
+
+    def query_rows(self, rights: int, mode: str = 'superset', acetypes: Optional[Iterable[str]] = ('A', 'OA'),
+                   trustees: Optional[Iterable[Union[SID, str]]] = None) -> List[int]:
+        # Rows matching query_bitmap(), for one of 'trustees' (anyone if None), in increasing order
+        data = self.query_bitmap(rights, mode, acetypes).to_bytes((len(self.row_sds) + 7) >> 3, 'little')
+        if trustees is None:
+            # Only look at the runs of bytes with rows in them
+            byte_bits = self.BYTE_BITS
+            return [((match.start() + offset) << 3) + pos for match in self.NONZERO.finditer(data)
+                    for offset, byte in enumerate(match.group()) for pos in byte_bits[byte]]
+        matches = []
+        for trustee in trustees:
+            trustee_id = self.trustee_ids.get(sid_key(as_sid(trustee)))
+            if trustee_id is not None:
+                matches.extend(row for row in self.trustee_rows[trustee_id] if data[row >> 3] >> (row & 7) & 1)
+        return sorted(matches)
+
+    def query_sds(self, rights: int, mode: str = 'superset', acetypes: Optional[Iterable[str]] = ('A', 'OA'),
+                  trustees: Optional[Iterable[Union[SID, str]]] = None) -> List[int]:
+        # Rows are added descriptor by descriptor, their ids are in order too
+        res = []
+        for row in self.query_rows(rights, mode, acetypes, trustees):
+            sd_id = self.row_sds[row]
+            if len(res) == 0 or res[-1] != sd_id:
+                res.append(sd_id)
+        return res
+
+    def query(self, rights: int, mode: str = 'superset', acetypes: Optional[Iterable[str]] = ('A', 'OA'),
+              trustees: Optional[Iterable[Union[SID, str]]] = None) -> Iterator[Hashable]:
+        return self.iter_objects(self.query_sds(rights, mode, acetypes, trustees))
+
+    def get_row(self, row: int) -> Tuple[int, str, str, int]:
+        # (descriptor id, ACE type, trustee SID, mask) of a row
+        acetype, mask = self.entries[self.row_entries[row]]
+        return self.row_sds[row], acetype, self.trustee_keys[self.row_trustees[row]], mask
+
+    def to_str(self) -> str:
+        return f'{super().to_str()}, {len(self.row_sds)} ACE rows'
+
+
+MaskIndex.NONZERO = re.compile(b'[^\\x00]+')
+# Positions of the bits set in each byte value
+MaskIndex.BYTE_BITS = [tuple(pos for pos in range(8) if byte >> pos & 1) for byte in range(256)]
+
+
+def write_varint(buf: bytearray, value: int):
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def iter_postings(buf: bytes) -> Iterator[Tuple[int, int]]:
+    # (descriptor id delta, entry) pairs
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        values = []
+        for _ in range(2):
+            byte = buf[pos]
+            pos += 1
+            value = byte & 0x7F
+            shift = 7
+            while byte & 0x80:
+                byte = buf[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+            values.append(value)
+        yield values[0], values[1]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Lists the objects whose security descriptor grants rights to trustees')
+    parser.add_argument('trustee', nargs='*', help='SIDs or SDDL abbreviations of the trustees, as written in ACEs (anyone if none is given)')
+    parser.add_argument('--input', '-i', action='append', default=[], help='File with one "object id<TAB>security descriptor" per line (the line number is the id if there is no tab), - for stdin (can be repeated)')
+    parser.add_argument('--encoding', default='utf-8-sig')
+    parser.add_argument('--rights', '-r', default='0', help='Access rights in SDDL form (e.g. GW, or 0x2)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--any', action='store_true', help='Match ACEs with any of the rights, instead of all of them')
+    mode.add_argument('--subset', action='store_true', help='Match ACEs with no other right than these')
+    parser.add_argument('--acetype', '-a', action='append', help='ACE types to look for (defaults to A and OA)')
+    parser.add_argument('--type', '-t', choices=AccessMask.TYPES.keys())
+    parser.add_argument('--stats', action='store_true', help='Print the size of the index on stderr')
+    args = parser.parse_args()
+    access_mask_cls = AccessMask.get_cls(args.type)
+    index = MaskIndex(access_mask_cls)
+    errors = 0
+    for source, num, line in iter_input_lines(args.input or ['-'], encoding=args.encoding):
+        object_id, sep, sddl = line.rstrip('\r\n').rpartition('\t')
+        if len(sddl.strip()) == 0:
+            continue
+        try:
+            index.add(object_id if sep else f'{source}:{num}', sddl)
+        except Exception as e:
+            errors += 1
+            sys.stderr.write(f'{source}:{num}: {type(e).__name__}: {e}\n')
+    if args.stats:
+        sys.stderr.write(index.to_str() + '\n')
+    for object_id in index.query(access_mask_cls.from_str(args.rights).rights,
+                                 'any' if args.any else 'subset' if args.subset else 'superset',
+                                 args.acetype or ('A', 'OA'), args.trustee or None):
+        print(object_id)
+    sys.exit(1 if errors > 0 else 0)
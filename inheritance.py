@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+import argparse
+import copy
+import uuid
+import weakref
+from typing import Iterable, Iterator, Optional, Tuple
+from sd import SD
+from acl import ACL
+from ace import ACE
+from sid import SID
+from accessmask import AccessMask
+from utils.cache import LRUCache
+from utils.frozen import is_frozen
+
+# Emulates what CreatePrivateObjectSecurityEx() computes for a new (or re-propagated) object with
+# automatic inheritance: the ACEs a child gets from its parent's DACL and SACL. Objects with the same
+# parent descriptor, kind, and owner get the same descriptor: a whole tree only has a handful of distinct
+# ones, and they are computed once each. Descriptors returned are shared, and read-only
+
+CREATOR_OWNER = 'S-1-3-0'
+CREATOR_GROUP = 'S-1-3-1'
+# Inheritance flags, cleared from ACEs which are not inherited any further
+INHERIT_FLAGS = ('OI', 'CI', 'NP', 'IO')
+
+
+def make_flags(abbrs: Iterable[str]) -> dict:
+    # Flags in the order Windows writes them (OICIIOID)
+    abbrs = set(abbrs)
+    flags = {abbr: ACE.FLAGS[abbr] for abbr in ACE.FLAG_BITS if abbr in abbrs}
+    flags.update((abbr, ('?', '?')) for abbr in abbrs if abbr not in flags)
+    return flags
+
+
+def copy_ace(ace: ACE, flags: Iterable[str], rights: Optional[int] = None, trustee: Optional[SID] = None) -> ACE:
+    rights = ace.rights if rights is None else type(ace.rights)(None, rights)
+    return ACE(None, ace.acetype, make_flags(flags), rights, ace.object_guid, ace.inherit_object_guid,
+               ace.trustee if trustee is None else trustee, ace.resource_attribute)
+
+
+def inherit_ace(ace: ACE, is_container: bool, object_type: Optional[uuid.UUID], owner: Optional[SID],
+                group: Optional[SID], access_mask_cls: type) -> Iterator[ACE]:
+    # ACEs a child gets from one ACE of its parent: none, one, or an effective ACE for the child itself
+    # plus an inherit-only one which keeps propagating the original to grandchildren
+    flags = set(ace.flags)
+    if is_container:
+        if 'CI' in flags:
+            # Effective on the container, and inherited further unless NP says otherwise
+            effective = True
+            propagates = 'NP' not in flags
+        elif 'OI' in flags and 'NP' not in flags:
+            # Only kept so that objects below the container inherit it
+            effective = False
+            propagates = True
+        else:
+            return
+    elif 'OI' in flags:
+        effective = True
+        propagates = False
+    else:
+        return
+    # Object-specific inheritance (Active Directory): only effective on children of that type, but
+    # still carried down through containers of other types
+    if ace.inherit_object_guid is not None and ace.inherit_object_guid != object_type:
+        if not propagates:
+            return
+        effective = False
+    kept = flags - set(INHERIT_FLAGS) - {'ID'}
+    inherit_flags = flags & {'OI', 'CI'}
+    trustee = None
+    if owner is not None and ace.trustee.sid == CREATOR_OWNER:
+        trustee = owner
+    elif group is not None and ace.trustee.sid == CREATOR_GROUP:
+        trustee = group
+    mask = ace.rights.rights
+    mapped = mask if ace.acetype == 'ML' else access_mask_cls.map_generic_rights(mask)
+    if effective and propagates and (trustee is not None or mapped != mask):
+        # Split: the child gets the rights it is actually granted, its children get the original ACE
+        yield copy_ace(ace, kept | {'ID'}, mapped, trustee)
+        yield copy_ace(ace, kept | inherit_flags | {'IO', 'ID'})
+    elif effective and propagates:
+        yield copy_ace(ace, kept | inherit_flags | {'ID'})
+    elif effective:
+        yield copy_ace(ace, kept | {'ID'}, mapped, trustee)
+    else:
+        yield copy_ace(ace, kept | inherit_flags | {'IO', 'ID'})
+
+
+def inherit_acl(parent: Optional[ACL], child: Optional[ACL], is_container: bool, object_type: Optional[uuid.UUID],
+                owner: Optional[SID], group: Optional[SID], access_mask_cls: type) -> Optional[ACL]:
+    # Explicit ACEs of the child come first and are kept as they are, its inherited ones are replaced
+    # with those from the parent, unless the child is protected (P). The result is frozen once cached: the
+    # child's ACL and ACEs are copied unless already read-only, the caller's own objects are left as they are
+    if child is not None and (child.aces is None or 'P' in child.flags):
+        if is_frozen(child):
+            return child
+        aces = None if child.aces is None else [copy.copy(ace) for ace in child.aces]
+        return type(child)(child.aclstr, dict(child.flags), aces)
+    explicit = [] if child is None else [ace if is_frozen(ace) else copy.copy(ace)
+                                         for ace in child.aces if 'ID' not in ace.flags]
+    inherited = []
+    if parent is not None and parent.aces is not None:
+        for ace in parent.aces:
+            inherited.extend(inherit_ace(ace, is_container, object_type, owner, group, access_mask_cls))
+    if child is None and parent is None:
+        return None
+    flags = {} if child is None else {abbr: props for abbr, props in child.flags.items() if abbr != 'AI'}
+    flags['AI'] = ACL.FLAGS['AI']
+    return ACL(None, flags, explicit + inherited)
+
+
+def owner_key(sid: Optional[SID]) -> Optional[str]:
+    # Owners and groups as written in the descriptors computed for them
+    return None if sid is None else sid.to_sddl()
+
+
+def sd_key(sd: SD) -> str:
+    # Descriptors computed here are parents of many others, only format each of them once. Only read-only
+    # ones are remembered: the caller's own descriptors can change between calls (e.g. a new root ACE)
+    if not is_frozen(sd):
+        return sd.to_sddl()
+    key = SDDL_KEYS.get(sd)
+    if key is None:
+        key = SDDL_KEYS[sd] = sd.to_sddl()
+    return key
+
+
+def inherit(parent: SD, is_container: bool, object_type: Optional[uuid.UUID] = None, owner: Optional[SID] = None,
+            group: Optional[SID] = None, child: Optional[SD] = None, access_mask_cls: type = AccessMask) -> SD:
+    # Descriptor of a child of 'parent', created by 'owner' and 'group' (defaulting to those of the child
+    # if given, then those of the parent), keeping the explicit ACEs of 'child' if given
+    if owner is None:
+        owner = child.owner if child is not None and child.owner is not None else parent.owner
+    if group is None:
+        group = child.primary_group if child is not None and child.primary_group is not None else parent.primary_group
+    key = (sd_key(parent), is_container, object_type, owner_key(owner), owner_key(group),
+           None if child is None else sd_key(child), access_mask_cls)
+    sd = INHERITED.get(key)
+    if sd is None:
+        dacl = inherit_acl(parent.dacl, None if child is None else child.dacl, is_container, object_type, owner,
+                           group, access_mask_cls)
+        sacl = inherit_acl(parent.sacl, None if child is None else child.sacl, is_container, object_type, owner,
+                           group, access_mask_cls)
+        sd = INHERITED.put(key, SD(None, owner, group, dacl, sacl).freeze())
+    return sd
+
+
+def propagate(root: SD, nodes: Iterable[tuple], access_mask_cls: type = AccessMask) -> Iterator[Tuple[str, SD]]:
+    # Simulates auto-inheritance down a tree after 'root' changed, without touching it. Nodes are
+    # (path, parent path, is_container, current SD or None, object type or None) tuples, each after
+    # its parent; the root's path is its parent path for its direct children. Yields (path, new SD)
+    computed = {}
+    for path, parent_path, is_container, current, object_type in nodes:
+        parent = computed.get(parent_path, root)
+        computed[path] = inherit(parent, is_container, object_type, child=current, access_mask_cls=access_mask_cls)
+        yield path, computed[path]
+
+
+INHERITED = LRUCache(8192)
+SDDL_KEYS = weakref.WeakKeyDictionary()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Computes the security descriptor an object inherits from its parent')
+    parser.add_argument('parent', help='Security descriptor of the parent container')
+    parser.add_argument('--child', '-c', help='Current security descriptor of the object, whose explicit ACEs are kept')
+    parser.add_argument('--object', action='store_true', help='The object is not a container (e.g. a file)')
+    parser.add_argument('--object-type', help='GUID of the object class (Active Directory)')
+    parser.add_argument('--owner', help='Creator of the object, replaces CREATOR OWNER')
+    parser.add_argument('--group', help='Primary group of the creator, replaces CREATOR GROUP')
+    parser.add_argument('--type', '-t', choices=AccessMask.TYPES.keys())
+    parser.add_argument('--format', '-f', choices=['sddl', 'multiline'], default='sddl')
+    args = parser.parse_args()
+    access_mask_cls = AccessMask.get_cls(args.type)
+    sd = inherit(SD.from_str(args.parent, access_mask_cls=access_mask_cls), not args.object,
+                 None if args.object_type is None else uuid.UUID(args.object_type),
+                 None if args.owner is None else SID.from_str(args.owner),
+                 None if args.group is None else SID.from_str(args.group),
+                 None if args.child is None else SD.from_str(args.child, access_mask_cls=access_mask_cls),
+                 access_mask_cls)
+    print(sd.to_sddl() if args.format == 'sddl' else sd.to_str(with_color=False))
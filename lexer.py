@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+import argparse
+import re
+from typing import Iterator, Optional, Tuple
+
+
+class SDDLSyntaxError(ValueError):
+
+    def __init__(self, message: str, text: str, offset: int):
+        super().__init__(f'{message} at offset {offset}')
+        self.text = text
+        self.offset = offset
+
+    def to_str(self) -> str:
+        return f'{self.args[0]}\n    {self.text}\n    {" " * self.offset}^'
+
+
+# Only these characters can change the lexer state, everything in between is skipped over at once
+SPECIAL_CHARS = re.compile(r'[():"]')
+SECTIONS = 'OGDS'
+
+
+def strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def tokenize(text: str, start: int = 0, end: Optional[int] = None,
+             sections: bool = True) -> Iterator[Tuple[str, int, int]]:
+    # Yields (kind, start, end) spans over 'text' in a single pass, without copying any of it:
+    #   'section': the O/G/D/S letter introducing a section (only if sections=True)
+    #   'sid': the owner or primary group of an O: or G: section
+    #   'flags': the flags of an ACL (possibly empty), always before its ACEs
+    #   'ace': the contents of an ACE, without its enclosing parentheses
+    # With sections=False, the whole text is parsed as a single ACL without any header.
+    # ACEs can contain nested parentheses (conditional expressions, resource attributes) and quoted
+    # strings, so they end at the parenthesis which brings the nesting depth back to zero.
+    end = len(text) if end is None else end
+    section = None if sections else 'D'
+    seen = set()
+    content = start  # where the text of the current section starts
+    last = start  # end of the last token yielded in the current section
+    flags_done = False
+    depth = 0
+    ace_start = None
+    pos = start
+    while True:
+        match = SPECIAL_CHARS.search(text, pos, end)
+        if match is None:
+            break
+        i = match.start()
+        c = text[i]
+        pos = i + 1
+        if c == '"':
+            if depth == 0:
+                raise SDDLSyntaxError('Unexpected quote outside of an ACE', text, i)
+            closing = text.find('"', i + 1, end)
+            if closing < 0:
+                raise SDDLSyntaxError('Unterminated string', text, i)
+            pos = closing + 1
+        elif c == '(':
+            if depth == 0:
+                if section is None or section in 'OG':
+                    raise SDDLSyntaxError('Unexpected ACE outside of an ACL', text, i)
+                if not flags_done:
+                    yield ('flags',) + strip_span(text, content, i)
+                    flags_done = True
+                else:
+                    check_blank(text, last, i)
+                ace_start = i + 1
+            depth += 1
+        elif c == ')':
+            if depth == 0:
+                raise SDDLSyntaxError('Unbalanced closing parenthesis', text, i)
+            depth -= 1
+            if depth == 0:
+                yield ('ace', ace_start, i)
+                last = i + 1
+        elif depth == 0 and sections:
+            # A colon outside of ACEs ends the current section, one character early: that
+            # character is the letter of the next section
+            if i - 1 < last:
+                raise SDDLSyntaxError('Expected a section letter (O, G, D or S) before colon', text, i)
+            letter = text[i - 1].upper()
+            if letter not in SECTIONS:
+                raise SDDLSyntaxError(f'Unknown section "{text[i - 1]}"', text, i - 1)
+            if letter in seen:
+                raise SDDLSyntaxError(f'Duplicate {letter}: section', text, i - 1)
+            if section is None:
+                check_blank(text, start, i - 1)
+            else:
+                yield from close_section(text, section, content, last, i - 1, flags_done)
+            seen.add(letter)
+            section = letter
+            yield ('section', i - 1, i)
+            content = last = i + 1
+            flags_done = False
+    if depth > 0:
+        raise SDDLSyntaxError('Unterminated ACE', text, ace_start - 1)
+    if section is None:
+        check_blank(text, start, end)
+    else:
+        yield from close_section(text, section, content, last, end, flags_done)
+
+
+def close_section(text: str, section: str, content: int, last: int, end: int,
+                  flags_done: bool) -> Iterator[Tuple[str, int, int]]:
+    if section in 'OG':
+        yield ('sid',) + strip_span(text, content, end)
+    elif not flags_done:
+        yield ('flags',) + strip_span(text, content, end)
+    else:
+        check_blank(text, last, end)
+
+
+def check_blank(text: str, start: int, end: int):
+    for i in range(start, end):
+        if not text[i].isspace():
+            raise SDDLSyntaxError(f'Unexpected character "{text[i]}"', text, i)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Tokenizer for SDDL strings')
+    parser.add_argument('sddl')
+    parser.add_argument('--acl', action='store_true', help='Parse the input as a single ACL without header')
+    args = parser.parse_args()
+    try:
+        for kind, start, end in tokenize(args.sddl, sections=not args.acl):
+            print(f'{start:>5} {end:>5} {kind:<8} {args.sddl[start:end]}')
+    except SDDLSyntaxError as e:
+        print(e.to_str())
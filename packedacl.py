@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+import argparse
+from array import array
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Iterable, List, Optional
+from ace import ACE
+from acl import ACL
+from sid import SID
+from accessmask import AccessMask
+from utils.cache import LRUCache
+from utils.frozen import freeze, is_frozen
+
+
+class PackedACL(ACL):
+
+    # Columnar ACL: instead of one ACE object per ACE (with its own flags dict, AccessMask and strings),
+    # each ACE is a row across parallel arrays, whose values point into small per-ACL tables of the
+    # distinct types, flag combinations, trustees, GUIDs and strings. ACE objects are only built when
+    # accessed (see PackedACEs), and masks can be queried over the arrays without building any.
+    # It is built like any ACL (from_str(), from_bytes(), or through SD.from_str(..., acl_cls=PackedACL))
+
+    def __init__(self, aclstr: str, flags: Optional[dict] = None, aces: Optional[Iterable[ACE]] = None):
+        self.aclstr = aclstr
+        self.flags = flags
+        self.null = aces is None
+        self.types = array('B')  # index in type_table of (ACE type, AccessMask subclass)
+        self.ace_flags = array('B')  # index in flags_table of the ACE flags, in their original order
+        self.masks = array('I')
+        self.trustees = array('I')  # index in sids
+        self.object_guids = array('I')  # index in guids, 0 when there is none
+        self.inherit_object_guids = array('I')
+        self.acestrs = array('I')  # index in strings, or SAME_AS_SDDL
+        self.mask_strs = array('I')
+        self.attributes = array('I')
+        self.type_table = []
+        self.flags_table = []
+        self.sids = []
+        self.guids = [None]
+        self.strings = [None]
+        # ACEs which cannot fit in the arrays (e.g. masks wider than 32 bits), kept as they are
+        self.unpacked = {}
+        if aces is not None:
+            self.pack(aces)
+
+    @property
+    def aces(self) -> Optional['PackedACEs']:
+        return None if self.null else PackedACEs(self)
+
+    @classmethod
+    def from_acl(cls, acl: ACL) -> 'PackedACL':
+        return cls(acl.aclstr, acl.flags, acl.aces)
+
+    def to_acl(self) -> ACL:
+        return ACL(self.aclstr, dict(self.flags), None if self.null else list(self.aces))
+
+    def pack(self, aces: Iterable[ACE]):
+        # Tables are only deduplicated while packing, lookups afterwards go by index. Each table's
+        # lookup is built once, pack() can be called again to append more ACEs
+        ids = {id(table): {value: pos for pos, value in enumerate(table)}
+               for table in (self.type_table, self.flags_table, self.sids, self.guids, self.strings)}
+
+        def intern(table: list, value, index_bits: int = 32) -> Optional[int]:
+            table_ids = ids[id(table)]
+            pos = table_ids.get(value)
+            if pos is None:
+                if len(table) >= (1 << index_bits):
+                    return None
+                pos = table_ids[value] = len(table)
+                table.append(value)
+            return pos
+
+        for ace in aces:
+            pos = len(self.masks)
+            type_code = intern(self.type_table, (ace.acetype, type(ace.rights)), 8)
+            flags_code = intern(self.flags_table, tuple(ace.flags.items()), 8)
+            mask = None if ace.rights is None else ace.rights.rights
+            if type_code is None or flags_code is None or mask is None or not 0 <= mask <= 0xFFFFFFFF:
+                self.unpacked[pos] = ace
+                type_code = flags_code = mask = 0
+                for column in (self.trustees, self.object_guids, self.inherit_object_guids, self.acestrs,
+                               self.mask_strs, self.attributes):
+                    column.append(0)
+            else:
+                self.trustees.append(intern(self.sids, ace.trustee))
+                self.object_guids.append(intern(self.guids, ace.object_guid))
+                self.inherit_object_guids.append(intern(self.guids, ace.inherit_object_guid))
+                self.mask_strs.append(intern(self.strings, ace.rights.raw))
+                self.attributes.append(intern(self.strings, ace.resource_attribute))
+                # Most ACEs are written the way they would be formatted back (the row holds the same
+                # fields as the ACE), only keep the others' text
+                self.acestrs.append(self.SAME_AS_SDDL if ace.acestr == ace.to_sddl()
+                                    else intern(self.strings, ace.acestr))
+            self.types.append(type_code)
+            self.ace_flags.append(flags_code)
+            self.masks.append(mask)
+
+    def get_ace(self, pos: int) -> ACE:
+        # Builds a standalone ACE from row 'pos': changing it does not change this ACL
+        ace = self.unpacked.get(pos)
+        if ace is not None:
+            return ace
+        acetype, access_mask_cls = self.type_table[self.types[pos]]
+        ace = ACE(None, acetype, dict(self.flags_table[self.ace_flags[pos]]),
+                  access_mask_cls(self.strings[self.mask_strs[pos]], self.masks[pos]),
+                  self.guids[self.object_guids[pos]], self.guids[self.inherit_object_guids[pos]],
+                  self.sids[self.trustees[pos]], self.strings[self.attributes[pos]])
+        acestr = self.acestrs[pos]
+        ace.acestr = ace.to_sddl() if acestr == self.SAME_AS_SDDL else self.strings[acestr]
+        return ace
+
+    def freeze(self) -> 'PackedACL':
+        # Columns become read-only views and tables tuples, ACE objects built from them are still standalone
+        if is_frozen(self):
+            return self
+        self.flags = MappingProxyType(self.flags)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, memoryview(column.tobytes()).cast(column.typecode))
+        for name in self.TABLES:
+            setattr(self, name, tuple(getattr(self, name)))
+        self.unpacked = MappingProxyType({pos: ace.freeze() for pos, ace in self.unpacked.items()})
+        return freeze(self)
+
+    def iter_trustees(self) -> Iterable[SID]:
+        yield from self.sids
+        for ace in self.unpacked.values():
+            yield ace.trustee
+
+    def replace_trustees(self, sids: dict) -> 'PackedACL':
+        # Only the trustee table changes: the copy shares its columns with this ACL, neither of them
+        # modifies them once packed
+        if not any(sid in sids for sid in self.iter_trustees()):
+            return self
+        acl = PackedACL.__new__(PackedACL)
+        acl.__dict__.update(self.__dict__)
+        acl.flags = dict(self.flags)
+        acl.sids = [sids.get(sid, sid) for sid in self.sids]
+        acl.unpacked = {pos: ace.with_trustee(sids[ace.trustee]) if ace.trustee in sids else ace
+                        for pos, ace in self.unpacked.items()}
+        return acl
+
+    def get_mask(self, pos: int) -> Optional[int]:
+        ace = self.unpacked.get(pos)
+        if ace is None:
+            return self.masks[pos]
+        return None if ace.rights is None else ace.rights.rights
+
+    def select(self, acetypes: Optional[Iterable[str]] = None, trustee: Optional[SID] = None) -> List[int]:
+        # Positions of ACEs of one of the given types, for the given trustee (compared by SID when
+        # both are resolved). Only the type and trustee tables are scanned, then the arrays
+        types = None
+        if acetypes is not None:
+            acetypes = {acetype.upper() for acetype in acetypes}
+            types = {code for code, (acetype, _) in enumerate(self.type_table) if acetype in acetypes}
+        sids = None
+        if trustee is not None:
+            sids = {code for code, sid in enumerate(self.sids) if same_trustee(sid, trustee)}
+        positions = [pos for pos, (type_code, sid_code) in enumerate(zip(self.types, self.trustees))
+                     if (types is None or type_code in types) and (sids is None or sid_code in sids)
+                     and pos not in self.unpacked]
+        if len(self.unpacked) == 0:
+            return positions
+        # Rows which did not fit in the arrays are matched on their ACE
+        positions.extend(pos for pos, ace in self.unpacked.items()
+                         if (acetypes is None or ace.acetype.upper() in acetypes)
+                         and (trustee is None or same_trustee(ace.trustee, trustee)))
+        return sorted(positions)
+
+    def find(self, rights: int, match_all: bool = True, acetypes: Optional[Iterable[str]] = None,
+             trustee: Optional[SID] = None) -> List[int]:
+        # Positions of ACEs with all (or, if not match_all, any) of the bits of 'rights' set
+        if acetypes is None and trustee is None:
+            positions = range(len(self.masks))
+        else:
+            positions = self.select(acetypes, trustee)
+        masks = self.masks
+        unpacked = self.unpacked
+        if len(unpacked) == 0:
+            if match_all:
+                return [pos for pos in positions if masks[pos] & rights == rights]
+            return [pos for pos in positions if masks[pos] & rights]
+        found = []
+        for pos in positions:
+            mask = masks[pos] if pos not in unpacked else self.get_mask(pos)
+            if mask is not None and (mask & rights == rights if match_all else mask & rights):
+                found.append(pos)
+        return found
+
+    def combined_mask(self, acetypes: Optional[Iterable[str]] = None, trustee: Optional[SID] = None) -> int:
+        # Union of the masks of the selected ACEs, e.g. everything granted to someone by 'A' ACEs,
+        # before any generic mapping, inheritance flag or deny ACE is taken into account
+        mask = 0
+        for pos in self.select(acetypes, trustee):
+            mask |= self.get_mask(pos) or 0
+        return mask
+
+
+def same_trustee(sid: SID, trustee: SID) -> bool:
+    return sid == trustee or (sid.sid is not None and sid.sid == trustee.sid)
+
+
+class PackedACEs(Sequence):
+
+    # Read-only view of the ACEs of a PackedACL, each built on access
+
+    def __init__(self, acl: PackedACL):
+        self.acl = acl
+
+    def __len__(self) -> int:
+        return len(self.acl.masks)
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self.acl.get_ace(i) for i in range(*pos.indices(len(self)))]
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos < len(self):
+            raise IndexError('ACE index out of range')
+        return self.acl.get_ace(pos)
+
+
+PackedACL.CACHE = LRUCache(8192)
+PackedACL.SAME_AS_SDDL = 0xFFFFFFFF
+PackedACL.COLUMNS = ('types', 'ace_flags', 'masks', 'trustees', 'object_guids', 'inherit_object_guids', 'acestrs',
+                     'mask_strs', 'attributes')
+PackedACL.TABLES = ('type_table', 'flags_table', 'sids', 'guids', 'strings')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Lists the ACEs of an ACL string granting some rights, without building ACE objects for the others')
+    parser.add_argument('acl')
+    parser.add_argument('rights', help='Access rights in SDDL form (e.g. WD, or 0x40000)')
+    parser.add_argument('--any', action='store_true', help='Match ACEs with any of the rights, instead of all of them')
+    parser.add_argument('--type', '-t', choices=AccessMask.TYPES.keys())
+    args = parser.parse_args()
+    access_mask_cls = AccessMask.get_cls(args.type)
+    acl = PackedACL.from_str(args.acl, access_mask_cls=access_mask_cls)
+    for pos in acl.find(access_mask_cls.from_str(args.rights).rights, match_all=not args.any):
+        print(f'{pos + 1:>4} ({acl.aces[pos].to_sddl()})')
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+import argparse
+import ctypes
+import csv
+import json
+import platform
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+from utils.cache import LRUCache
+
+
+class Resolver:
+    # Translates SIDs to account names and back, returns None for anything it cannot resolve
+
+    def resolve_to_name(self, sidstr: str) -> Optional[str]:
+        return None
+
+    def resolve_from_name(self, account_name: str) -> Optional[str]:
+        return None
+
+    def resolve_many_to_names(self, sidstrs: List[str]) -> Dict[str, Optional[str]]:
+        # Backends able to resolve in bulk (e.g. in one round-trip to a domain controller) override these
+        return {sidstr: self.resolve_to_name(sidstr) for sidstr in sidstrs}
+
+    def resolve_many_from_names(self, account_names: List[str]) -> Dict[str, Optional[str]]:
+        return {account_name: self.resolve_from_name(account_name) for account_name in account_names}
+
+
+class LSA_UNICODE_STRING(ctypes.Structure):
+    _fields_ = [('Length', ctypes.c_ushort), ('MaximumLength', ctypes.c_ushort), ('Buffer', ctypes.c_void_p)]
+
+
+class LSA_OBJECT_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [('Length', ctypes.c_ulong), ('RootDirectory', ctypes.c_void_p), ('ObjectName', ctypes.c_void_p),
+                ('Attributes', ctypes.c_ulong), ('SecurityDescriptor', ctypes.c_void_p),
+                ('SecurityQualityOfService', ctypes.c_void_p)]
+
+
+class LSA_TRUST_INFORMATION(ctypes.Structure):
+    _fields_ = [('Name', LSA_UNICODE_STRING), ('Sid', ctypes.c_void_p)]
+
+
+class LSA_REFERENCED_DOMAIN_LIST(ctypes.Structure):
+    _fields_ = [('Entries', ctypes.c_ulong), ('Domains', ctypes.POINTER(LSA_TRUST_INFORMATION))]
+
+
+class LSA_TRANSLATED_NAME(ctypes.Structure):
+    _fields_ = [('Use', ctypes.c_int), ('Name', LSA_UNICODE_STRING), ('DomainIndex', ctypes.c_long)]
+
+
+class Win32Resolver(Resolver):
+
+    def resolve_from_name(self, account_name: str) -> Optional[str]:
+        if platform.system() != 'Windows':
+            return None
+        account_name_buf = ctypes.create_unicode_buffer(account_name)
+        sid_len = ctypes.c_uint32(0)
+        domain_name_len = ctypes.c_uint32(0)
+        sid_name_use = ctypes.c_uint32(0)
+        res = ctypes.windll.advapi32.LookupAccountNameW(None, account_name_buf, None, ctypes.byref(sid_len), None,
+                                                        ctypes.byref(domain_name_len), ctypes.byref(sid_name_use))
+        if res != 0 or ctypes.GetLastError() != 122: # ERROR_INSUFFICIENT_BUFFER
+            return None
+        sid_buf = (ctypes.c_byte * sid_len.value)()
+        domain_name_buf = (ctypes.c_byte * domain_name_len.value)()
+        res = ctypes.windll.advapi32.LookupAccountNameW(None, account_name_buf, ctypes.byref(sid_buf), ctypes.byref(sid_len),
+                                                        domain_name_buf, ctypes.byref(domain_name_len),
+                                                        ctypes.byref(sid_name_use))
+        if res == 0:
+            return None
+        resolved_name = ctypes.c_wchar_p(0)
+        res = ctypes.windll.advapi32.ConvertSidToStringSidW(sid_buf, ctypes.byref(resolved_name))
+        if res == 0:
+            return None
+        res = ctypes.wstring_at(resolved_name)[::]
+        ctypes.windll.kernel32.LocalFree(resolved_name)
+        return res
+
+    def resolve_to_name(self, sidstr: str) -> Optional[str]:
+        if platform.system() != 'Windows':
+            return None
+        sid_str_buf = ctypes.create_unicode_buffer(sidstr)
+        sid_ptr = ctypes.c_void_p(0)
+        res = ctypes.windll.advapi32.ConvertStringSidToSidW(sid_str_buf, ctypes.byref(sid_ptr))
+        if res == 0 or sid_ptr.value == 0:
+            return None
+        user_name_len = ctypes.c_uint32(0)
+        domain_name_len = ctypes.c_uint32(0)
+        sid_name_use = ctypes.c_uint32(0)
+        res = ctypes.windll.advapi32.LookupAccountSidW(None, sid_ptr, None, ctypes.byref(user_name_len), None,
+                                                       ctypes.byref(domain_name_len), ctypes.byref(sid_name_use))
+        if res != 0 or ctypes.GetLastError() != 122:  # ERROR_INSUFFICIENT_BUFFER
+            return None
+        user_name_buf = (ctypes.c_wchar * user_name_len.value)()
+        domain_name_buf = (ctypes.c_wchar * domain_name_len.value)()
+        res = ctypes.windll.advapi32.LookupAccountSidW(None, sid_ptr, user_name_buf, ctypes.byref(user_name_len),
+                                                       domain_name_buf, ctypes.byref(domain_name_len),
+                                                       ctypes.byref(sid_name_use))
+        if res == 0:
+            return None
+        res = ctypes.wstring_at(user_name_buf)
+        domain_name = ctypes.wstring_at(domain_name_buf)
+        if domain_name != '':
+            res = domain_name + '\\' + res
+        ctypes.windll.kernel32.LocalFree(sid_ptr)
+        return res
+
+    def resolve_many_to_names(self, sidstrs: List[str]) -> Dict[str, Optional[str]]:
+        if platform.system() != 'Windows':
+            return {sidstr: None for sidstr in sidstrs}
+        advapi32 = ctypes.windll.advapi32
+        attributes = LSA_OBJECT_ATTRIBUTES()
+        attributes.Length = ctypes.sizeof(LSA_OBJECT_ATTRIBUTES)
+        policy = ctypes.c_void_p(0)
+        status = advapi32.LsaOpenPolicy(None, ctypes.byref(attributes), 0x800, ctypes.byref(policy))  # POLICY_LOOKUP_NAMES
+        if status != 0:
+            return super().resolve_many_to_names(sidstrs)
+        res = {}
+        try:
+            # LsaLookupSids() accepts at most 20480 SIDs per call
+            for chunk_start in range(0, len(sidstrs), 20480):
+                res.update(self.lookup_sids(policy, sidstrs[chunk_start:chunk_start + 20480]))
+        finally:
+            advapi32.LsaClose(policy)
+        return res
+
+    def lookup_sids(self, policy: ctypes.c_void_p, sidstrs: List[str]) -> Dict[str, Optional[str]]:
+        advapi32 = ctypes.windll.advapi32
+        res = {sidstr: None for sidstr in sidstrs}
+        sid_ptrs = (ctypes.c_void_p * len(sidstrs))()
+        valid = []
+        for sidstr in sidstrs:
+            sid_ptr = ctypes.c_void_p(0)
+            if advapi32.ConvertStringSidToSidW(ctypes.create_unicode_buffer(sidstr), ctypes.byref(sid_ptr)) != 0:
+                sid_ptrs[len(valid)] = sid_ptr.value
+                valid.append(sidstr)
+        domains = ctypes.POINTER(LSA_REFERENCED_DOMAIN_LIST)()
+        names = ctypes.POINTER(LSA_TRANSLATED_NAME)()
+        try:
+            if len(valid) == 0:
+                return res
+            status = advapi32.LsaLookupSids(policy, len(valid), sid_ptrs, ctypes.byref(domains), ctypes.byref(names))
+            if (status & 0xFFFFFFFF) not in (0, 0x107):  # STATUS_SUCCESS, STATUS_SOME_NOT_MAPPED
+                return res
+            for i, sidstr in enumerate(valid):
+                name = names[i]
+                if name.Use in (7, 8):  # SidTypeInvalid, SidTypeUnknown
+                    continue
+                resolved = ctypes.wstring_at(name.Name.Buffer, name.Name.Length // 2)
+                if name.DomainIndex >= 0:
+                    domain = domains.contents.Domains[name.DomainIndex].Name
+                    if domain.Length > 0:
+                        resolved = ctypes.wstring_at(domain.Buffer, domain.Length // 2) + '\\' + resolved
+                res[sidstr] = resolved
+            return res
+        finally:
+            if domains:
+                advapi32.LsaFreeMemory(domains)
+            if names:
+                advapi32.LsaFreeMemory(names)
+            for i in range(len(valid)):
+                ctypes.windll.kernel32.LocalFree(ctypes.c_void_p(sid_ptrs[i]))
+
+
+class MappingResolver(Resolver):
+    # Resolves from SID/name pairs exported beforehand, e.g. from a domain controller, so that
+    # resolution also works on non-Windows hosts. Files are either a JSON object mapping SIDs
+    # to names, or CSV/TSV lines with a SID and a name
+
+    def __init__(self, path: Optional[str] = None, fallback: Optional[Resolver] = None):
+        self.names = {}
+        self.sids = {}
+        self.fallback = fallback
+        if path is not None:
+            self.load(path)
+
+    def add(self, sidstr: str, account_name: str):
+        self.names[sidstr.upper()] = account_name
+        self.sids.setdefault(account_name.upper(), sidstr.upper())
+
+    def load(self, path: str):
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            if path.lower().endswith('.json'):
+                for sidstr, account_name in json.load(f).items():
+                    self.add(sidstr, account_name)
+                return
+            dialect = 'excel-tab' if '\t' in f.readline() else 'excel'
+            f.seek(0)
+            for row in csv.reader(f, dialect):
+                if len(row) < 2 or not row[0].strip().upper().startswith('S-'):
+                    continue  # headers, comments, and empty lines
+                self.add(row[0].strip(), row[1].strip())
+
+    def resolve_to_name(self, sidstr: str) -> Optional[str]:
+        res = self.names.get(sidstr.upper())
+        if res is None and self.fallback is not None:
+            res = self.fallback.resolve_to_name(sidstr)
+        return res
+
+    def resolve_from_name(self, account_name: str) -> Optional[str]:
+        res = self.sids.get(account_name.upper())
+        if res is None and self.fallback is not None:
+            res = self.fallback.resolve_from_name(account_name)
+        return res
+
+    def resolve_many_to_names(self, sidstrs: List[str]) -> Dict[str, Optional[str]]:
+        res = {sidstr: self.names.get(sidstr.upper()) for sidstr in sidstrs}
+        missing = [sidstr for sidstr, name in res.items() if name is None]
+        if len(missing) > 0 and self.fallback is not None:
+            res.update(self.fallback.resolve_many_to_names(missing))
+        return res
+
+    def resolve_many_from_names(self, account_names: List[str]) -> Dict[str, Optional[str]]:
+        res = {account_name: self.sids.get(account_name.upper()) for account_name in account_names}
+        missing = [account_name for account_name, sidstr in res.items() if sidstr is None]
+        if len(missing) > 0 and self.fallback is not None:
+            res.update(self.fallback.resolve_many_from_names(missing))
+        return res
+
+
+class SqliteStore:
+    # Persists resolutions between runs. Failed resolutions are stored along with an expiration
+    # date, successful ones never expire
+
+    def __init__(self, path: str):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('CREATE TABLE IF NOT EXISTS resolutions (direction TEXT NOT NULL, input TEXT NOT NULL, '
+                        'output TEXT, expires REAL, PRIMARY KEY (direction, input))')
+        self.db.commit()
+
+    def get(self, direction: str, key: str):
+        # Returns (found, resolved) so that negative entries can be told apart from missing ones
+        with self.lock:
+            row = self.db.execute('SELECT output, expires FROM resolutions WHERE direction = ? AND input = ?',
+                                  (direction, key)).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return False, None
+        return True, row[0]
+
+    def put(self, direction: str, key: str, value: Optional[str], expires: Optional[float] = None):
+        self.put_many(direction, [(key, value, expires)])
+
+    def put_many(self, direction: str, entries: List[tuple]):
+        with self.lock:
+            self.db.executemany('INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?)',
+                                ((direction, key, value, expires) for key, value, expires in entries))
+            self.db.commit()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class CachingResolver(Resolver):
+    # Caches results of another resolver in memory (and optionally in a persistent store), since the
+    # same few trustees appear in most ACEs. Failed resolutions are cached for negative_ttl seconds
+    # only, in case the account gets created or the domain becomes reachable
+
+    def __init__(self, backend: Resolver, maxsize: int = 65536, negative_ttl: float = 300,
+                 store: Optional[SqliteStore] = None):
+        self.backend = backend
+        self.negative_ttl = negative_ttl
+        self.store = store
+        self.lock = threading.Lock()
+        self.cache = LRUCache(maxsize)
+
+    def resolve_to_name(self, sidstr: str) -> Optional[str]:
+        return self.resolve('to_name', sidstr.upper(), self.backend.resolve_to_name)
+
+    def resolve_from_name(self, account_name: str) -> Optional[str]:
+        return self.resolve('from_name', account_name.upper(), self.backend.resolve_from_name)
+
+    def resolve(self, direction: str, key: str, resolve_func) -> Optional[str]:
+        now = time.time()
+        with self.lock:
+            entry = self.cache.get((direction, key))
+        if entry is not None and (entry[1] is None or entry[1] >= now):
+            return entry[0]
+        found = False
+        if self.store is not None:
+            found, res = self.store.get(direction, key)
+        if not found:
+            # Resolve outside of the lock, lookups can take long and concurrent ones should not wait
+            res = resolve_func(key)
+            if self.store is not None:
+                self.store.put(direction, key, res, None if res is not None else now + self.negative_ttl)
+        with self.lock:
+            self.cache.put((direction, key), (res, None if res is not None else now + self.negative_ttl))
+        return res
+
+    def resolve_many_to_names(self, sidstrs: List[str]) -> Dict[str, Optional[str]]:
+        return self.resolve_many('to_name', sidstrs, self.backend.resolve_many_to_names)
+
+    def resolve_many_from_names(self, account_names: List[str]) -> Dict[str, Optional[str]]:
+        return self.resolve_many('from_name', account_names, self.backend.resolve_many_from_names)
+
+    def resolve_many(self, direction: str, inputs: List[str], resolve_func) -> Dict[str, Optional[str]]:
+        now = time.time()
+        res = {}
+        missing = {}
+        with self.lock:
+            for value in inputs:
+                entry = self.cache.get((direction, value.upper()))
+                if entry is not None and (entry[1] is None or entry[1] >= now):
+                    res[value] = entry[0]
+                else:
+                    missing.setdefault(value.upper(), []).append(value)
+        if self.store is not None:
+            for key in list(missing):
+                found, resolved = self.store.get(direction, key)
+                if found:
+                    for value in missing.pop(key):
+                        res[value] = resolved
+        resolved = resolve_func(list(missing)) if len(missing) > 0 else {}
+        entries = [(key, resolved.get(key), None if resolved.get(key) is not None else now + self.negative_ttl)
+                   for key in missing]
+        if self.store is not None and len(entries) > 0:
+            self.store.put_many(direction, entries)
+        with self.lock:
+            for key, value, expires in entries:
+                self.cache.put((direction, key), (value, expires))
+                for original in missing[key]:
+                    res[original] = value
+        return res
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Resolver between SIDs and account names')
+    parser.add_argument('input', nargs='+', help='SIDs or account names to resolve')
+    parser.add_argument('--names', '-n', help='File with exported SID/name pairs (JSON, CSV or TSV)')
+    parser.add_argument('--store', '-s', help='SQLite database persisting resolutions between runs')
+    args = parser.parse_args()
+    backend = Win32Resolver()
+    if args.names is not None:
+        backend = MappingResolver(args.names, fallback=backend)
+    resolver = CachingResolver(backend, store=None if args.store is None else SqliteStore(args.store))
+    for value in args.input:
+        if value.strip().upper().startswith('S-'):
+            print(value, resolver.resolve_to_name(value.strip()))
+        else:
+            print(value, resolver.resolve_from_name(value.strip()))
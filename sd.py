@@ -1,15 +1,21 @@
 #!/usr/bin/env python3
 
 import argparse
-import ctypes
-import string
-import platform
+import io
+import itertools
+import re
+import struct
 import sys
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional
 from sid import SID
 from acl import ACL
+from lexer import strip_span, tokenize
 from accessmask import AccessMask
-from utils.color import propagate_colors
+from resolver import Resolver, CachingResolver, MappingResolver, SqliteStore, Win32Resolver
+from export import FORMATS, get_writer
+from utils.cache import LRUCache
+from utils.color import Colorizer, ListWriter, color_spans
+from utils.frozen import freeze, is_frozen
 
 
 class SD:
@@ -23,81 +29,401 @@ class SD:
         self.sacl = sacl
 
     def to_str(self, with_color: bool = sys.stdin.isatty()) -> str:
+        out = io.StringIO()
+        self.write(out, 0, with_color)
+        return out.getvalue()
+
+    def write(self, out, depth: int = 0, with_color: bool = sys.stdin.isatty()):
+        raw = self.raw if self.raw is not None else self.to_sddl()
+        if not with_color:
+            out.write(raw)
+            self.write_body(out, depth, with_color, None)
+            return
+        # The header is colored like the parts found while formatting the body, which has to be
+        # buffered until then. Each descriptor is colored the same way, no matter what was printed before
+        colorizer = Colorizer()
+        body = []
+        self.write_body(ListWriter(body), depth, with_color, colorizer)
+        out.write(self.color_header(raw, colorizer))
+        out.write(''.join(body))
+
+    def write_body(self, out, depth: int, with_color: bool, colorizer: Optional[Colorizer]):
+        nl = '\n' + '    ' * (depth + 1)
+        for section, label, part in (('O', 'Owner', self.owner), ('G', 'Primary group', self.primary_group),
+                                     ('D', 'Discretionary ACL', self.dacl), ('S', 'System ACL', self.sacl)):
+            if part is None:
+                continue
+            out.write(f'{nl}{label}: ')
+            if colorizer is not None:
+                # Parts colored from here on are in this section of the header
+                colorizer.region, colorizer.index = section, None
+            part.write(out, depth + 1, with_color=with_color, colorizer=colorizer)
+
+    @staticmethod
+    def color_header(header: str, colorizer: Colorizer) -> str:
+        # Colors each part of 'header' the way it was colored in the body, at the span its section, ACE
+        # and field (see ACE_FIELDS) have in the header, which is tokenized once
+        sids = {}
+        aces = {}
+        section = None
+        for kind, start, end in tokenize(header):
+            if kind == 'section':
+                section = header[start].upper()
+            elif kind == 'sid':
+                sids[section] = (start, end)
+            elif kind == 'ace':
+                aces.setdefault(section, []).append((start, end))
+        spans = []
+        fields = {}
+        for region, index, field, color in colorizer.parts:
+            if index is None:
+                span = sids.get(region) if field == 'sid' else None
+            else:
+                ace_spans = aces.get(region, ())
+                if index >= len(ace_spans):
+                    continue
+                if (region, index) not in fields:
+                    fields[region, index] = split_ace_fields(header, *ace_spans[index])
+                span = find_field(header, fields[region, index], field)
+            if span is not None and span[0] < span[1]:
+                spans.append((span[0], span[1], color))
+        return color_spans(header, spans)
+
+    def freeze(self) -> 'SD':
+        # Cached descriptors are shared by every object with the same one, they become read-only
+        if is_frozen(self):
+            return self
+        for acl in (self.dacl, self.sacl):
+            if acl is not None:
+                acl.freeze()
+        return freeze(self)
+
+    def to_dict(self) -> dict:
+        return {
+            'sddl': self.to_sddl(),
+            'owner': None if self.owner is None else self.owner.to_dict(),
+            'group': None if self.primary_group is None else self.primary_group.to_dict(),
+            'dacl': None if self.dacl is None else self.dacl.to_dict(),
+            'sacl': None if self.sacl is None else self.sacl.to_dict(),
+        }
+
+    def to_sddl(self) -> str:
         s = ''
         if self.owner is not None:
-            s += '\n    Owner: ' + self.owner.to_str(with_color=with_color)
+            s += 'O:' + self.owner.to_sddl()
         if self.primary_group is not None:
-            s += '\n    Primary group: ' + self.primary_group.to_str(with_color=with_color)
+            s += 'G:' + self.primary_group.to_sddl()
         if self.dacl is not None:
-            s += '\n    Discretionary ACL: ' + '\n    '.join(self.dacl.to_str().split('\n'))
+            s += 'D:' + self.dacl.to_sddl()
         if self.sacl is not None:
-            s += '\n    System ACL: ' + '\n    '.join(self.sacl.to_str().split('\n'))
-        if with_color:
-            s = propagate_colors(self.raw, s) + s
-        else:
-            s = self.raw + s
+            s += 'S:' + self.sacl.to_sddl()
         return s
 
     @classmethod
-    def from_str(cls, raw: str, access_mask_cls: type = AccessMask):
-        # Detect binary security descriptors and convert them to string
-        # security descriptors, to process them just like others
+    def from_bytes(cls, buf, access_mask_cls: type = AccessMask, offset: int = 0, cached: bool = False,
+                   resolve: bool = True, acl_cls: type = ACL):
+        # Only self-relative security descriptors can be serialized, see SECURITY_DESCRIPTOR_RELATIVE
+        if offset + 20 > len(buf):
+            raise ValueError(f'Truncated security descriptor at offset {offset}')
+        revision, _, control, owner, group, sacl, dacl = struct.unpack_from('<BBHIIII', buf, offset)
+        if revision != 1:
+            raise ValueError(f'Unsupported security descriptor revision {revision} at offset {offset}')
+        if (control & 0x8000) == 0:  # SE_SELF_RELATIVE
+            raise ValueError(f'Security descriptor at offset {offset} is not self-relative')
+        if cached:
+            # Self-relative descriptors do not store their size, it ends with its last component
+            end = offset + 20
+            for sid_offset in (owner, group):
+                if sid_offset != 0 and offset + sid_offset + 2 <= len(buf):
+                    end = max(end, offset + sid_offset + 8 + 4 * buf[offset + sid_offset + 1])
+            for acl_offset in (sacl, dacl):
+                if acl_offset != 0 and offset + acl_offset + 4 <= len(buf):
+                    end = max(end, offset + acl_offset + struct.unpack_from('<H', buf, offset + acl_offset + 2)[0])
+            key = (bytes(buf[offset:end]), access_mask_cls, resolve, acl_cls)
+            sd = cls.CACHE.get(key)
+            if sd is not None:
+                return sd
+        if owner != 0:
+            owner = SID.from_bytes(buf, offset + owner, resolve=resolve)
+        else:
+            owner = None
+        if group != 0:
+            group = SID.from_bytes(buf, offset + group, resolve=resolve)
+        else:
+            group = None
+        acls = []
+        for present, acl_offset, control_flags in ((0x4, dacl, cls.DACL_CONTROL_FLAGS),  # SE_DACL_PRESENT
+                                                   (0x10, sacl, cls.SACL_CONTROL_FLAGS)):  # SE_SACL_PRESENT
+            if (control & present) == 0:
+                acls.append(None)
+            elif acl_offset == 0:
+                acls.append(acl_cls(None, {'NO_ACCESS_CONTROL': ACL.FLAGS['NO_ACCESS_CONTROL']}, None))
+            else:
+                flags = {abbr: ACL.FLAGS[abbr] for abbr, bit in control_flags.items() if control & bit}
+                acls.append(acl_cls.from_bytes(buf, offset + acl_offset, flags, access_mask_cls=access_mask_cls,
+                                               cached=cached, resolve=resolve))
+        sd = cls(None, owner, group, acls[0], acls[1])
+        if cached:
+            return cls.CACHE.put(key, sd.freeze())
+        return sd
+
+    @classmethod
+    def iter_from_bytes(cls, buf, access_mask_cls: type = AccessMask, offsets: Optional[Iterable[int]] = None,
+                        length_format: str = '<I', cached: bool = False, resolve: bool = True,
+                        acl_cls: type = ACL) -> Iterator['SD']:
+        # Decode many self-relative security descriptors stored in one buffer (e.g. a mmap), either at
+        # the given offsets, or back to back each prefixed by its length. Descriptors are decoded through
+        # views of the buffer, none of them is copied out
+        with memoryview(buf) as view:
+            if offsets is not None:
+                for offset in offsets:
+                    yield cls.from_bytes(view, access_mask_cls=access_mask_cls, offset=offset, cached=cached,
+                                         resolve=resolve, acl_cls=acl_cls)
+                return
+            length_size = struct.calcsize(length_format)
+            pos = 0
+            while pos < len(view):
+                if pos + length_size > len(view):
+                    raise ValueError(f'Truncated security descriptor length at offset {pos}')
+                length, = struct.unpack_from(length_format, view, pos)
+                pos += length_size
+                if pos + length > len(view):
+                    raise ValueError(f'Truncated security descriptor at offset {pos}')
+                with view[pos:pos + length] as record:
+                    yield cls.from_bytes(record, access_mask_cls=access_mask_cls, cached=cached, resolve=resolve,
+                                         acl_cls=acl_cls)
+                pos += length
+
+    @classmethod
+    def from_str(cls, raw: str, access_mask_cls: type = AccessMask, cached: bool = False, resolve: bool = True,
+                 acl_cls: type = ACL):
+        # Detect binary security descriptors, and decode them directly. ACLs are built as 'acl_cls',
+        # e.g. PackedACL to keep large ones compact
+        if isinstance(raw, (bytes, bytearray, memoryview)):
+            return cls.from_bytes(raw, access_mask_cls=access_mask_cls, cached=cached, resolve=resolve,
+                                  acl_cls=acl_cls)
         raw = raw.strip()
-        if len(raw) > 0 and all(c in string.hexdigits for c in raw):
-            raw = cls.str_from_hexstring(raw)
-        # Parse 'raw' as a SDDL string
-        left = raw
-        owner = primary_group = dacl = sacl = None
-        if left[:2].upper() == 'O:':
-            end_pos = left.find(':', 2)
-            if end_pos < 0:
-                end_pos = len(left) + 1
-            owner, left = left[2:end_pos - 1], left[end_pos-1:]
-        if left[:2].upper() == 'G:':
-            end_pos = left.find(':', 2)
-            if end_pos < 0:
-                end_pos = len(left) + 1
-            primary_group, left = left[2:end_pos - 1], left[end_pos - 1:]
-        if left[:2].upper() == 'D:':
-            end_pos = left.find(':', 2)
-            if end_pos < 0:
-                end_pos = len(left) + 1
-            dacl, left = left[2:end_pos - 1], left[end_pos - 1:]
-        if left[:2].upper() == 'S:':
-            end_pos = left.find(':', 2)
-            if end_pos < 0:
-                end_pos = len(left) + 1
-            sacl, left = left[2:end_pos - 1], left[end_pos - 1:]
-        return cls(raw,
-                   None if owner is None else SID.from_str(owner),
-                   None if primary_group is None else SID.from_str(primary_group),
-                   None if dacl is None else ACL.from_str(dacl, access_mask_cls=access_mask_cls),
-                   None if sacl is None else ACL.from_str(sacl, access_mask_cls=access_mask_cls))
+        if cls.HEXSTRING.fullmatch(raw):
+            return cls.from_bytes(bytes.fromhex(raw), access_mask_cls=access_mask_cls, cached=cached,
+                                  resolve=resolve, acl_cls=acl_cls)
+        # Identical descriptors are shared by many objects, parse them only once if asked to
+        if cached:
+            key = (raw, access_mask_cls, resolve, acl_cls)
+            sd = cls.CACHE.get(key)
+            if sd is not None:
+                return sd
+        # Parse 'raw' as a SDDL string, sections can come in any order
+        owner = primary_group = None
+        acl_tokens = {}
+        section = None
+        for kind, start, end in tokenize(raw):
+            if kind == 'section':
+                section = raw[start].upper()
+            elif kind == 'sid':
+                sid = SID.from_str(raw[start:end], resolve=resolve)
+                if section == 'O':
+                    owner = sid
+                else:
+                    primary_group = sid
+            else:
+                acl_tokens.setdefault(section, []).append((kind, start, end))
+        acls = []
+        for section in ('D', 'S'):
+            tokens = acl_tokens.get(section)
+            if tokens is None:
+                acls.append(None)
+                continue
+            aclstr = raw[tokens[0][1]:tokens[-1][2] + (1 if tokens[-1][0] == 'ace' else 0)]
+            acls.append(acl_cls.from_tokens(raw, tokens, aclstr, access_mask_cls=access_mask_cls, cached=cached,
+                                            resolve=resolve))
+        sd = cls(raw, owner, primary_group, acls[0], acls[1])
+        if cached:
+            return cls.CACHE.put(key, sd.freeze())
+        return sd
 
     @classmethod
-    def str_from_hexstring(cls, hexstring: str) -> str:
-        if platform.system() != 'Windows':
-            raise RuntimeError("Cannot parse hex string as security descriptor on non-Windows hosts")
-        sd_bytes = (ctypes.c_uint8 * (int(len(hexstring) / 2)))(*(int(hexstring[i:i+2], 16) for i in range(0, len(hexstring), 2)))
-        sd_str = ctypes.c_wchar_p(0)
-        sd_str_len = ctypes.c_uint32(0)
-        res = ctypes.windll.advapi32.ConvertSecurityDescriptorToStringSecurityDescriptorW(ctypes.byref(sd_bytes),
-                                                                                          1,
-                                                                                          ctypes.c_uint8(-1),
-                                                                                          ctypes.byref(sd_str),
-                                                                                          ctypes.byref(sd_str_len))
-        if res == 0:
-            return None
-        res = ctypes.wstring_at(sd_str)[::]
-        ctypes.windll.kernel32.LocalFree(sd_str)
-        return res
+    def resolve_all(cls, sds: Iterable['SD'], resolver: Optional[Resolver] = None) -> List['SD']:
+        # Parsing a batch of descriptors with resolve=False then calling this makes a single round trip
+        # to the resolver for all their distinct owners, groups and trustees. Returns the descriptors
+        # with resolved SIDs, in the same order: those which changed are copies, the originals (which
+        # may be cached and shared) are left as they are
+        sds = list(sds)
+        parsed = [sd for sd in sds if sd is not None]
+        acls = [acl for sd in parsed for acl in (sd.dacl, sd.sacl) if acl is not None and acl.aces is not None]
+        sids = [sid for sd in parsed for sid in (sd.owner, sd.primary_group)]
+        sids += [sid for acl in acls for sid in acl.iter_trustees()]
+        resolved = SID.resolve_all(sids, resolver=resolver)
+        return [None if sd is None else sd.replace_sids(resolved) for sd in sds]
+
+    def replace_sids(self, sids: dict) -> 'SD':
+        # Copy of this descriptor with SIDs swapped for those they map to, or itself if none changes
+        owner = sids.get(self.owner, self.owner)
+        group = sids.get(self.primary_group, self.primary_group)
+        dacl, sacl = (acl if acl is None or acl.aces is None else acl.replace_trustees(sids)
+                      for acl in (self.dacl, self.sacl))
+        if owner is self.owner and group is self.primary_group and dacl is self.dacl and sacl is self.sacl:
+            return self
+        return SD(self.raw, owner, group, dacl, sacl)
+
+
+SD.CACHE = LRUCache(8192)
+SD.HEXSTRING = re.compile(r'[0-9A-Fa-f]+')
+# Fields of an ACE in SDDL, by the name they are colored with ('sid' being its trustee)
+SD.ACE_FIELDS = {'type': 0, 'flags': 1, 'rights': 2, 'object_guid': 3, 'inherit_object_guid': 4, 'sid': 5}
+# SE_DACL_PROTECTED, SE_DACL_AUTO_INHERIT_REQ, SE_DACL_AUTO_INHERITED, and their SACL equivalents
+SD.DACL_CONTROL_FLAGS = {
+    'P': 0x1000,
+    'AR': 0x0100,
+    'AI': 0x0400,
+}
+SD.SACL_CONTROL_FLAGS = {
+    'P': 0x2000,
+    'AR': 0x0200,
+    'AI': 0x0800,
+}
+
+
+def split_ace_fields(text: str, start: int, end: int) -> List[tuple]:
+    # Spans of the fields of the ACE at text[start:end], up to its trustee (its condition or resource
+    # attribute, if any, follows and can contain separators of its own)
+    spans = []
+    for _ in range(len(SD.ACE_FIELDS)):
+        sep = text.find(';', start, end)
+        spans.append(strip_span(text, start, end if sep < 0 else sep))
+        if sep < 0:
+            break
+        start = sep + 1
+    return spans
+
+
+def find_field(text: str, spans: List[tuple], field) -> Optional[tuple]:
+    # ACE flags are colored one by one, each is found in the flags field
+    abbr = None
+    if isinstance(field, tuple):
+        field, abbr = field
+    pos = SD.ACE_FIELDS.get(field)
+    if pos is None or pos >= len(spans):
+        return None
+    start, end = spans[pos]
+    if abbr is not None:
+        found = text[start:end].upper().find(abbr)
+        return None if found < 0 else (start + found, start + found + len(abbr))
+    return start, end
+
+
+def iter_input_lines(paths: Iterable[str], encoding: str = 'utf-8-sig', icacls: bool = False) -> Iterator[tuple]:
+    # Yields (source, line number, line) from each file in turn, '-' being stdin, without reading
+    # any of them in memory at once
+    for path in paths:
+        if path == '-':
+            # Decoded as asked rather than with the locale's encoding, stdin itself is left open
+            stdin = io.TextIOWrapper(sys.stdin.buffer, encoding=encoding, errors='replace')
+            try:
+                yield from iter_numbered_lines('<stdin>', stdin, icacls)
+            finally:
+                stdin.detach()
+        else:
+            with open(path, 'r', encoding=encoding, errors='replace') as f:
+                yield from iter_numbered_lines(path, f, icacls)
+
+
+def iter_numbered_lines(source: str, f, icacls: bool = False) -> Iterator[tuple]:
+    if not icacls:
+        for num, line in enumerate(f, 1):
+            yield source, num, line
+        return
+    # icacls /save output alternates the name of each object and its descriptor: the name becomes the
+    # source of the descriptor. A name left without a descriptor is passed on, to be reported
+    name = None
+    for num, line in enumerate(f, 1):
+        if len(line.strip()) == 0:
+            continue
+        if name is None:
+            name, name_num = line.strip(), num
+        else:
+            yield name, num, line
+            name = None
+    if name is not None:
+        yield source, name_num, name
+
+
+def format_stream(lines: Iterable[tuple], writer, access_mask_cls: type = AccessMask, batch_size: int = 1000,
+                  err=sys.stderr) -> int:
+    # Parses one security descriptor per line (SDDL or hex) and hands them to the writer (see export.py)
+    # a batch at a time, so that memory use stays bounded and trustees of a whole batch are resolved at
+    # once. Lines which cannot be parsed are reported and skipped. Returns the number of such lines
+    errors = 0
+    batch = []
+
+    def flush():
+        if len(batch) == 0:
+            return
+        sds = SD.resolve_all(sd for _, _, sd in batch)
+        writer.write_batch([(source, num, sd) for (source, num, _), sd in zip(batch, sds)])
+        batch.clear()
+
+    for source, num, line in lines:
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        try:
+            batch.append((source, num, SD.from_str(line, access_mask_cls=access_mask_cls, cached=True,
+                                                   resolve=False)))
+        except Exception as e:
+            errors += 1
+            # Keep errors next to the output of the lines around them
+            flush()
+            err.write(f'{source}:{num}: {type(e).__name__}: {e}\n')
+            err.flush()
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return errors
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Parser and formatter for SDDL')
-    parser.add_argument('sd', nargs='+')
-    parser.add_argument('--format', '-f', choices=['sddl', 'multiline'], default='multiline')
+    parser.add_argument('sd', nargs='*', help='Security descriptors, read one per line from stdin if none (and no --input) is given')
+    parser.add_argument('--input', '-i', action='append', default=[], help='File with one security descriptor per line, - for stdin (can be repeated)')
+    parser.add_argument('--encoding', help='Encoding of input files and stdin (default: utf-16 with --icacls, utf-8 otherwise)')
+    parser.add_argument('--icacls', action='store_true', help='Input is icacls /save output, with the name of each object on the line before its descriptor')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Number of lines parsed, resolved and written at once')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='Number of processes parsing descriptors in parallel (not available with multiline output)')
+    parser.add_argument('--format', '-f', choices=FORMATS, default='multiline', help='jsonl writes one record per security descriptor, csv/parquet/arrow one row per ACE')
+    parser.add_argument('--output', '-o', default='-', help='Output file, - for stdout (required for parquet and arrow)')
     parser.add_argument('--type', '-t', choices=AccessMask.TYPES.keys())
+    parser.add_argument('--names', '-n', help='File with exported SID/name pairs (JSON, CSV or TSV) used to resolve trustees')
+    parser.add_argument('--name-store', help='SQLite database persisting trustee resolutions between runs')
     args = parser.parse_args()
-    for sd in args.sd:
-        sd = SD.from_str(sd, access_mask_cls=AccessMask.get_cls(args.type))
-        print(sd.to_str())
+    if args.names is not None or args.name_store is not None:
+        resolver = Win32Resolver()
+        if args.names is not None:
+            resolver = MappingResolver(args.names, fallback=resolver)
+        SID.set_resolver(CachingResolver(resolver, store=None if args.name_store is None else SqliteStore(args.name_store)))
+    encoding = args.encoding or ('utf-16' if args.icacls else 'utf-8-sig')
+    lines = iter(())
+    if len(args.sd) > 0:
+        lines = (('<argv>', num, sd) for num, sd in enumerate(args.sd, 1))
+    if len(args.input) > 0 or len(args.sd) == 0:
+        lines = itertools.chain(lines, iter_input_lines(args.input or ['-'], encoding=encoding, icacls=args.icacls))
+    if args.workers > 1 and args.format == 'multiline':
+        parser.error('--workers requires another --format than multiline')
+    try:
+        writer = get_writer(args.format, args.output)
+    except (ValueError, RuntimeError) as e:
+        parser.error(str(e))
+    try:
+        if args.workers > 1:
+            # Workers need to import this module under its own name, not as __main__
+            from bulk import format_many
+            errors = format_many(lines, writer, args.type, workers=args.workers, batch_size=args.batch_size)
+        else:
+            errors = format_stream(lines, writer, access_mask_cls=AccessMask.get_cls(args.type),
+                                   batch_size=args.batch_size)
+        writer.close()
+    except BrokenPipeError:
+        # Output piped into e.g. head, which exited early
+        sys.stderr.close()
+        sys.exit(0)
+    sys.exit(1 if errors > 0 else 0)
@@ -1,123 +1,219 @@
 #!/usr/bin/env python3
 
+import io
 import argparse
-import platform
-import ctypes
-from typing import Optional
-from utils.color import colorize
+import struct
+import time
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional
+from resolver import Resolver, CachingResolver, Win32Resolver
+from utils.cache import LRUCache
+from utils.color import Colorizer
 
 
 class SID:
 
+    # SIDs are immutable values: a few trustees are referenced by most ACEs, they can share one instance
+    __slots__ = ('raw', 'sid', 'principal', 'abbr', 'desc')
+
     def __init__(self, raw: str, sid: Optional[str] = None, principal: Optional[str] = None,
                  abbr: Optional[str] = None, desc: Optional[str] = None):
-        self.raw = raw
-        self.sid = sid
-        self.principal = principal
-        self.abbr = abbr
-        self.desc = desc
+        object.__setattr__(self, 'raw', raw)
+        object.__setattr__(self, 'sid', sid)
+        object.__setattr__(self, 'principal', principal)
+        object.__setattr__(self, 'abbr', abbr)
+        object.__setattr__(self, 'desc', desc)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'SID objects are immutable, cannot set {name}')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'SID objects are immutable, cannot delete {name}')
+
+    def __reduce__(self):
+        return self.__class__, (self.raw, self.sid, self.principal, self.abbr, self.desc)
 
-    def to_str(self, sid: bool = True, principal: bool = True, abbr: bool = True, desc: bool = True, with_color: bool = True) -> str:
-        s = ''
+    def __eq__(self, other):
+        if not isinstance(other, SID):
+            return NotImplemented
+        return (self.raw == other.raw and self.sid == other.sid and self.principal == other.principal and
+                self.abbr == other.abbr and self.desc == other.desc)
+
+    def __hash__(self):
+        return hash((self.raw, self.sid, self.principal, self.abbr, self.desc))
+
+    def to_str(self, sid: bool = True, principal: bool = True, abbr: bool = True, desc: bool = True, with_color: bool = True,
+               colorizer: Optional[Colorizer] = None) -> str:
+        out = io.StringIO()
+        self.write(out, 0, sid, principal, abbr, desc, with_color, colorizer)
+        return out.getvalue()
+
+    def write(self, out, depth: int = 0, sid: bool = True, principal: bool = True, abbr: bool = True, desc: bool = True,
+              with_color: bool = True, colorizer: Optional[Colorizer] = None):
+        # SIDs always fit on one line, 'depth' is only there for consistency with other write() methods
+        if with_color:
+            out.write((colorizer or Colorizer()).colorize(self.raw, 'sid'))
+        else:
+            out.write(self.raw)
         if sid and self.sid is not None and self.sid != self.raw.upper():
-            s += f' ({self.sid})'
+            out.write(f' ({self.sid})')
         if principal and self.principal is not None and self.principal.upper() != self.raw.upper():
-            s += f' ({self.principal})'
+            out.write(f' ({self.principal})')
         if abbr and self.abbr is not None and self.raw.upper() != self.raw:
-            s += f' ({self.abbr})'
+            out.write(f' ({self.abbr})')
         if desc and self.desc is not None:
-            s += f' ({self.desc})'
-        if with_color:
-            s = colorize(self.raw) + s
-        else:
-            s = self.raw + s
+            out.write(f' ({self.desc})')
+
+    def to_dict(self) -> dict:
+        return {'sid': self.sid, 'name': self.principal, 'abbr': self.abbr}
 
-        return s
+    def to_sddl(self) -> str:
+        # Abbreviations of domain-relative SIDs designate the current domain, only use them
+        # when the SID itself is unknown
+        if self.abbr is not None and (self.sid is None or '<' in self.sid or not self.sid.startswith('S-1-5-21-')):
+            return self.abbr
+        if self.sid is not None:
+            return self.sid
+        return self.raw
+
+    @classmethod
+    def from_bytes(cls, buf, offset: int = 0, resolve: bool = True):
+        # Binary SIDs are a revision, a sub-authority count, a 48-bit big endian
+        # identifier authority, then 32-bit little endian sub-authorities
+        if offset + 8 > len(buf):
+            raise ValueError(f'Truncated SID at offset {offset}')
+        revision, count, authority_high, authority_low = struct.unpack_from('>BBHI', buf, offset)
+        if offset + 8 + 4 * count > len(buf):
+            raise ValueError(f'Truncated SID at offset {offset}')
+        authority = (authority_high << 32) | authority_low
+        sidstr = f'S-{revision}-{authority}' if authority_high == 0 else f'S-{revision}-0x{authority:012X}'
+        for subauthority in struct.unpack_from(f'<{count}I', buf, offset + 8):
+            sidstr += f'-{subauthority}'
+        return cls.from_str(sidstr, resolve=resolve)
+
+    @classmethod
+    def from_str(cls, raw: str, resolve: bool = True):
+        # SIDs parsed with resolve=False are interned separately, see resolve_all(). Both tables are
+        # keyed by the input as given
+        interned = cls.INTERNED if resolve else cls.INTERNED_UNRESOLVED
+        sid = interned.get(raw)
+        if sid is not None:
+            if type(sid) is not tuple:
+                return sid
+            # Failed resolutions are interned with when to attempt them again, as long as the resolver
+            # would keep failing them (see CachingResolver.negative_ttl)
+            if sid[1] > time.time():
+                return sid[0]
+        sid = cls.parse(raw, resolve=resolve)
+        if resolve and not sid.is_resolved():
+            interned.put(raw, (sid, time.time() + getattr(cls.RESOLVER, 'negative_ttl', 0)))
+            return sid
+        return interned.put(raw, sid)
 
     @classmethod
-    def from_str(cls, raw: str):
+    def parse(cls, raw: str, resolve: bool = True):
         raw = raw.strip()
         upper = raw.upper()
-        for wellknown in cls.WELL_KNOWN_SIDS:
-            if '<domain-sid>' in wellknown.sid:
-                prefix, suffix = wellknown.sid.split('<domain-sid>')
-            elif '<root-domain-sid>' in wellknown.sid:
-                prefix, suffix = wellknown.sid.split('<root-domain-sid>')
-            else:
-                prefix, suffix = '', wellknown.sid
-            # Does the input match this well known SID's SID
-            if upper.startswith(prefix) and upper.endswith(suffix):
+        # Look the input up in each index of well known SIDs. If it matches several of them, the entry
+        # first in WELL_KNOWN_SIDS wins, then a match on its SID, then on its abbreviation, then its name
+        matches = []
+        # Does the input match (end with) a well known SID's SID
+        pos = upper.find('S-')
+        while pos >= 0:
+            if upper[pos:] in cls.WELL_KNOWN_BY_SID:
+                matches.append((cls.WELL_KNOWN_BY_SID[upper[pos:]], 0))
+            pos = upper.find('S-', pos + 1)
+        # Does the input match a domain-relative well known SID's prefix and RID
+        for prefix, by_rid in cls.WELL_KNOWN_BY_RID.items():
+            if upper.startswith(prefix) and upper[upper.rfind('-'):] in by_rid:
+                matches.append((by_rid[upper[upper.rfind('-'):]], 0))
+        # Does the input match a well known SID's SDDL abbreviation
+        if upper in cls.WELL_KNOWN_BY_ABBR:
+            matches.append((cls.WELL_KNOWN_BY_ABBR[upper], 1))
+        # Does the input match a well known SID's account name
+        if upper in cls.WELL_KNOWN_BY_PRINCIPAL:
+            matches.append((cls.WELL_KNOWN_BY_PRINCIPAL[upper], 2))
+        if len(matches) > 0:
+            pos, matched = min(matches)
+            wellknown = cls.WELL_KNOWN_SIDS[pos]
+            if matched == 0:
                 return cls(upper, upper, wellknown.principal, wellknown.abbr, wellknown.desc)
-            # Does the input match this well known SID's SDDL abbreviation
-            if upper == wellknown.abbr:
+            elif matched == 1:
                 return cls(upper, wellknown.sid, wellknown.principal, wellknown.abbr, wellknown.desc)
-            # Does the input match this well known SID's account name
-            if wellknown.principal is not None and upper == wellknown.principal.upper():
-                return cls(wellknown.principal, wellknown.sid, wellknown.principal, wellknown.abbr, wellknown.desc)
+            return cls(wellknown.principal, wellknown.sid, wellknown.principal, wellknown.abbr, wellknown.desc)
         # Does the input look like a SID we could try to resolve
         if upper.startswith('S-'):
-            return cls(upper, upper, cls.resolve_to_name(upper), None, None)
+            return cls(upper, upper, cls.resolve_to_name(upper) if resolve else None, None, None)
         # Last resort: try to resolve the input like an account name
-        return cls(raw, cls.resolve_from_name(raw), raw, None, None)
+        return cls(raw, cls.resolve_from_name(raw) if resolve else None, raw, None, None)
+
+    def is_resolved(self) -> bool:
+        return self.sid is not None and self.principal is not None
 
     @classmethod
-    def resolve_from_name(cls, account_name: str) -> Optional[str]:
-        if platform.system() != 'Windows':
-            return None
-        account_name_buf = ctypes.create_unicode_buffer(account_name)
-        sid_len = ctypes.c_uint32(0)
-        domain_name_len = ctypes.c_uint32(0)
-        sid_name_use = ctypes.c_uint32(0)
-        res = ctypes.windll.advapi32.LookupAccountNameW(None, account_name_buf, None, ctypes.byref(sid_len), None,
-                                                        ctypes.byref(domain_name_len), ctypes.byref(sid_name_use))
-        if res != 0 or ctypes.GetLastError() != 122: # ERROR_INSUFFICIENT_BUFFER
-            return None
-        sid_buf = (ctypes.c_byte * sid_len.value)()
-        domain_name_buf = (ctypes.c_byte * domain_name_len.value)()
-        res = ctypes.windll.advapi32.LookupAccountNameW(None, account_name_buf, ctypes.byref(sid_buf), ctypes.byref(sid_len),
-                                                        domain_name_buf, ctypes.byref(domain_name_len),
-                                                        ctypes.byref(sid_name_use))
-        if res == 0:
-            return None
-        resolved_name = ctypes.c_wchar_p(0)
-        res = ctypes.windll.advapi32.ConvertSidToStringSidW(sid_buf, ctypes.byref(resolved_name))
-        if res == 0:
-            return None
-        res = ctypes.wstring_at(resolved_name)[::]
-        ctypes.windll.kernel32.LocalFree(resolved_name)
+    def resolve_all(cls, sids: Iterable['SID'], resolver: Optional[Resolver] = None) -> Dict['SID', 'SID']:
+        # Resolve every distinct unresolved SID at once, e.g. those parsed with resolve=False across a batch
+        # of security descriptors, and return the resolved SID to use instead of each of them
+        resolver = cls.RESOLVER if resolver is None else resolver
+        pending = {sid for sid in sids if sid is not None and not sid.is_resolved()}
+        by_sid = [sid for sid in pending if sid.sid is not None]
+        by_name = [sid for sid in pending if sid.sid is None]
+        names = resolver.resolve_many_to_names(list({sid.sid for sid in by_sid}))
+        sidstrs = resolver.resolve_many_from_names(list({sid.raw for sid in by_name}))
+        res = {}
+        for sid in by_sid:
+            res[sid] = cls(sid.raw, sid.sid, names.get(sid.sid), None, None)
+        for sid in by_name:
+            res[sid] = cls(sid.raw, sidstrs.get(sid.raw), sid.raw, None, None)
+        # Only share results with from_str() if they come from the same resolver it would have used
+        if resolver is cls.RESOLVER:
+            for sid in res.values():
+                if sid.is_resolved():
+                    cls.INTERNED.put(sid.raw, sid)
         return res
 
     @classmethod
-    def resolve_to_name(self, sidstr: str) -> Optional[str]:
-        if platform.system() != 'Windows':
-            return None
-        sid_str_buf = ctypes.create_unicode_buffer(sidstr)
-        sid_ptr = ctypes.c_void_p(0)
-        res = ctypes.windll.advapi32.ConvertStringSidToSidW(sid_str_buf, ctypes.byref(sid_ptr))
-        if res == 0 or sid_ptr.value == 0:
-            return None
-        user_name_len = ctypes.c_uint32(0)
-        domain_name_len = ctypes.c_uint32(0)
-        sid_name_use = ctypes.c_uint32(0)
-        res = ctypes.windll.advapi32.LookupAccountSidW(None, sid_ptr, None, ctypes.byref(user_name_len), None,
-                                                       ctypes.byref(domain_name_len), ctypes.byref(sid_name_use))
-        if res != 0 or ctypes.GetLastError() != 122:  # ERROR_INSUFFICIENT_BUFFER
-            return None
-        user_name_buf = (ctypes.c_wchar * user_name_len.value)()
-        domain_name_buf = (ctypes.c_wchar * domain_name_len.value)()
-        res = ctypes.windll.advapi32.LookupAccountSidW(None, sid_ptr, user_name_buf, ctypes.byref(user_name_len),
-                                                       domain_name_buf, ctypes.byref(domain_name_len),
-                                                       ctypes.byref(sid_name_use))
-        if res == 0:
-            return None
-        res = ctypes.wstring_at(user_name_buf)
-        domain_name = ctypes.wstring_at(domain_name_buf)
-        if domain_name != '':
-            res = domain_name + '\\' + res
-        ctypes.windll.kernel32.LocalFree(sid_ptr)
-        return res
+    def index_well_known_sids(cls):
+        # Index WELL_KNOWN_SIDS by each property from_str() can match, keeping only the position
+        # of the first entry matching each key
+        by_sid = {}
+        by_rid = {}
+        by_abbr = {}
+        by_principal = {}
+        for pos, wellknown in enumerate(cls.WELL_KNOWN_SIDS):
+            for placeholder in ('<domain-sid>', '<root-domain-sid>'):
+                if placeholder in wellknown.sid:
+                    prefix, suffix = wellknown.sid.split(placeholder)
+                    by_rid.setdefault(prefix, {}).setdefault(suffix, pos)
+                    break
+            else:
+                by_sid.setdefault(wellknown.sid, pos)
+            if wellknown.abbr is not None:
+                by_abbr.setdefault(wellknown.abbr, pos)
+            if wellknown.principal is not None:
+                by_principal.setdefault(wellknown.principal.upper(), pos)
+        cls.WELL_KNOWN_BY_SID = MappingProxyType(by_sid)
+        cls.WELL_KNOWN_BY_RID = MappingProxyType({prefix: MappingProxyType(rids) for prefix, rids in by_rid.items()})
+        cls.WELL_KNOWN_BY_ABBR = MappingProxyType(by_abbr)
+        cls.WELL_KNOWN_BY_PRINCIPAL = MappingProxyType(by_principal)
+
+    @classmethod
+    def resolve_from_name(cls, account_name: str) -> Optional[str]:
+        return cls.RESOLVER.resolve_from_name(account_name)
 
+    @classmethod
+    def resolve_to_name(cls, sidstr: str) -> Optional[str]:
+        return cls.RESOLVER.resolve_to_name(sidstr)
+
+    @classmethod
+    def set_resolver(cls, resolver: Resolver):
+        # Interned SIDs hold names resolved by the previous resolver
+        cls.RESOLVER = resolver
+        cls.INTERNED.clear()
 
+SID.INTERNED = LRUCache(65536)
+SID.INTERNED_UNRESOLVED = LRUCache(65536)
+SID.RESOLVER = CachingResolver(Win32Resolver())
 SID.AUTHORITIES = {
     0: 'NULL AUTHORITY',
     1: 'WORLD AUTHORITY',
@@ -148,7 +244,7 @@ SID.WELL_KNOWN_SIDS = [
     SID('', 'S-1-3-1', 'Creator Group', 'CG',
         "Placeholder in an inheritable access control entry, replaced when inherited with the child object's " +
         "creator's primary group SID"),
-    SID('', 'S-1-3-4', 'Owner Rights', None,
+    SID('', 'S-1-3-4', 'Owner Rights', 'OW',
         'Placeholder replaced with the owner of the object. When an ACE with this SID is present, ' +
         'READ_CONTROL and WRITE_DAC are not implicitly granted to the owner'),
     SID('', 'S-1-5-1', 'Dialup', None,
@@ -242,12 +338,23 @@ SID.WELL_KNOWN_SIDS = [
     SID('', 'S-1-16-0', 'Untrusted Integrity Level', None),
     SID('', 'S-1-16-4096', 'Low Integrity Level', 'LW'),
     SID('', 'S-1-16-8192', 'Medium Integrity Level', 'ME'),
-    SID('', 'S-1-16-8448', 'Medium Plus Integrity Level', None),
+    SID('', 'S-1-16-8448', 'Medium Plus Integrity Level', 'MP'),
     SID('', 'S-1-16-12288', 'High Integrity Level', 'HI'),
     SID('', 'S-1-16-16384', 'System Integrity Level', 'SI'),
     SID('', 'S-1-16-20480', 'Protected Process Integrity Level', None),
     SID('', 'S-1-16-28672', 'Secure Process Integrity Level', None),
 ]
+SID.index_well_known_sids()
+
+
+def as_sid(sid) -> SID:
+    return sid if isinstance(sid, SID) else SID.from_str(sid)
+
+
+def sid_key(sid: SID) -> str:
+    # Trustees are compared by SID, or as written when they could not be resolved
+    return sid.sid if sid.sid is not None else sid.raw.upper()
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Resolver for well-known SID')
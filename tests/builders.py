@@ -0,0 +1,43 @@
+import struct
+import uuid
+
+# Builds binary self-relative security descriptors, the way Windows lays them out
+
+
+def sid(sidstr: str) -> bytes:
+    parts = sidstr.split('-')
+    authority = int(parts[2])
+    subauthorities = [int(part) for part in parts[3:]]
+    return (struct.pack('>BBHI', int(parts[1]), len(subauthorities), authority >> 32, authority & 0xFFFFFFFF) +
+            struct.pack(f'<{len(subauthorities)}I', *subauthorities))
+
+
+def ace(typecode: int, flags: int, mask: int, trustee: str, object_guid: str = None, inherit_guid: str = None,
+        extra: bytes = b'') -> bytes:
+    body = struct.pack('<I', mask)
+    if typecode in (0x05, 0x06, 0x07, 0x08, 0x0B):
+        body += struct.pack('<I', (1 if object_guid else 0) | (2 if inherit_guid else 0))
+        if object_guid:
+            body += uuid.UUID(object_guid).bytes_le
+        if inherit_guid:
+            body += uuid.UUID(inherit_guid).bytes_le
+    body += sid(trustee) + extra
+    body += bytes(-len(body) % 4)
+    return struct.pack('<BBH', typecode, flags, len(body) + 4) + body
+
+
+def acl(aces: list) -> bytes:
+    body = b''.join(aces)
+    return struct.pack('<BBHHH', 2, 0, len(body) + 8, len(aces), 0) + body
+
+
+def sd(control: int = 0, owner: str = None, group: str = None, dacl: bytes = None, sacl: bytes = None) -> bytes:
+    body = b''
+    offsets = {}
+    for name, blob in (('sacl', sacl), ('dacl', dacl), ('owner', None if owner is None else sid(owner)),
+                       ('group', None if group is None else sid(group))):
+        offsets[name] = 0 if blob is None else 20 + len(body)
+        body += blob or b''
+    control |= 0x8000 | (0x4 if dacl is not None else 0) | (0x10 if sacl is not None else 0)
+    return struct.pack('<BBHIIII', 1, 0, control, offsets['owner'], offsets['group'], offsets['sacl'],
+                       offsets['dacl']) + body
@@ -0,0 +1,24 @@
+import os
+import sys
+import pytest
+
+# Modules live at the root of the repository and import each other by name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sd import SD
+from acl import ACL
+from ace import ACE
+from sid import SID
+from packedacl import PackedACL
+from resolver import MappingResolver
+
+
+@pytest.fixture(autouse=True)
+def isolated():
+    # Tests never look names up on the host, and do not share cached objects with each other
+    previous = SID.RESOLVER
+    SID.set_resolver(MappingResolver())
+    for cache in (SD.CACHE, ACL.CACHE, PackedACL.CACHE, ACE.CACHE):
+        cache.clear()
+    yield
+    SID.set_resolver(previous)
@@ -0,0 +1,90 @@
+import uuid
+import pytest
+from sd import SD
+from accessmask import AccessMask
+from accesscheck import Token, access_check, MAXIMUM_ALLOWED, WRITE_OWNER, WRITE_DAC, READ_CONTROL
+
+FILE = AccessMask.get_cls('file')
+USER = 'S-1-5-21-1-2-3-1000'
+FILE_ALL_ACCESS = 0x1F01FF
+FILE_READ_DATA = 0x1
+FILE_WRITE_DATA = 0x2
+
+
+def check(sddl: str, token: Token, desired: int) -> int:
+    return access_check(SD.from_str(sddl, access_mask_cls=FILE), token, desired, FILE)
+
+
+def test_take_ownership_privilege_is_not_denied_by_the_dacl():
+    sddl = 'O:BAD:(D;;WO;;;WD)(A;;FA;;;WD)'
+    assert check(sddl, Token(USER, ['WD'], ['SeTakeOwnershipPrivilege']), WRITE_OWNER) == WRITE_OWNER
+    assert check(sddl, Token(USER, ['WD']), WRITE_OWNER) == 0
+    assert check(sddl, Token(USER, ['WD'], ['SeTakeOwnershipPrivilege']), WRITE_OWNER | WRITE_DAC) == \
+        WRITE_OWNER | WRITE_DAC
+    assert check(sddl, Token(USER, ['WD'], ['SeTakeOwnershipPrivilege']), MAXIMUM_ALLOWED) == FILE_ALL_ACCESS
+
+
+def test_take_ownership_privilege_without_any_ace():
+    assert check('O:BAD:(A;;FR;;;BA)', Token(USER, ['WD'], ['SeTakeOwnershipPrivilege']), WRITE_OWNER) == WRITE_OWNER
+
+
+def test_security_privilege_is_required_for_the_sacl():
+    sddl = 'O:BAD:(A;;FA;;;WD)'
+    assert check(sddl, Token(USER, ['WD']), 0x01000000) == 0
+    assert check(sddl, Token(USER, ['WD'], ['SeSecurityPrivilege']), 0x01000000) == 0x01000000
+
+
+def test_deny_only_groups_are_only_used_for_deny_aces():
+    deny_only = ('BA', Token.GROUP_USE_FOR_DENY_ONLY)
+    assert check('D:(A;;FA;;;BA)', Token(USER, [deny_only]), FILE_READ_DATA) == 0
+    assert check('D:(A;;FA;;;BA)', Token(USER, ['BA']), FILE_READ_DATA) == FILE_READ_DATA
+    assert check('D:(D;;FW;;;BA)(A;;FA;;;WD)', Token(USER, [deny_only, 'WD']), FILE_WRITE_DATA) == 0
+    assert check('D:(D;;FW;;;BA)(A;;FA;;;WD)', Token(USER, [deny_only, 'WD']), FILE_READ_DATA) == FILE_READ_DATA
+
+
+def test_owner_gets_read_control_and_write_dac_unless_owner_rights_is_set():
+    token = Token(USER)
+    assert check(f'O:{USER}D:', token, READ_CONTROL | WRITE_DAC) == READ_CONTROL | WRITE_DAC
+    assert check(f'O:{USER}D:(A;;FR;;;OW)', token, WRITE_DAC) == 0
+    assert check(f'O:{USER}D:(A;;FR;;;OW)', token, MAXIMUM_ALLOWED) == FILE.map_generic_rights(0x80000000)
+    assert check(f'O:{USER}D:(A;;FR;;;OW)(A;;WD;;;OW)', token, WRITE_DAC) == WRITE_DAC
+    assert check(f'O:{USER}D:(D;;WD;;;OW)', token, WRITE_DAC) == 0
+
+
+def test_mandatory_label_no_write_up():
+    sddl = 'D:(A;;FA;;;WD)S:(ML;;NW;;;HI)'
+    assert check(sddl, Token(USER, ['WD']), FILE_READ_DATA) == FILE_READ_DATA
+    assert check(sddl, Token(USER, ['WD']), FILE_WRITE_DATA) == 0
+    assert check(sddl, Token(USER, ['WD'], integrity_level='HI'), FILE_WRITE_DATA) == FILE_WRITE_DATA
+    assert check(sddl, Token(USER, ['WD']), MAXIMUM_ALLOWED) & FILE_WRITE_DATA == 0
+    # Objects without a label are medium integrity, no write up
+    assert check('D:(A;;FA;;;WD)', Token(USER, ['WD'], integrity_level='LW'), FILE_WRITE_DATA) == 0
+    assert check('D:(A;;FA;;;WD)', Token(USER, ['WD'], integrity_level='LW'), FILE_READ_DATA) == FILE_READ_DATA
+
+
+def test_maximum_allowed():
+    token = Token(USER, ['WD', 'BU'])
+    assert check('D:(D;;WD;;;WD)(A;;FA;;;WD)', token, MAXIMUM_ALLOWED) == FILE_ALL_ACCESS & ~WRITE_DAC
+    assert check('D:(A;;FR;;;BU)(A;;FW;;;WD)', token, MAXIMUM_ALLOWED) == \
+        FILE.map_generic_rights(0x80000000 | 0x40000000)
+    assert check('D:(A;;FA;;;BA)', token, MAXIMUM_ALLOWED) == 0
+
+
+def test_first_matching_ace_wins():
+    token = Token(USER, ['WD'])
+    assert check('D:(A;;FA;;;WD)(D;;FA;;;WD)', token, FILE_READ_DATA) == FILE_READ_DATA
+    assert check('D:(D;;FA;;;WD)(A;;FA;;;WD)', token, FILE_READ_DATA) == 0
+
+
+@pytest.mark.parametrize('sddl', ['O:BA', 'O:BAD:NO_ACCESS_CONTROL'])
+def test_missing_or_null_dacl_grants_everything(sddl):
+    assert check(sddl, Token(USER), FILE_ALL_ACCESS) == FILE_ALL_ACCESS
+
+
+def test_inherit_only_and_object_aces():
+    token = Token(USER, ['WD'])
+    assert check('D:(A;OICIIO;FA;;;WD)', token, FILE_READ_DATA) == 0
+    guid = 'bf967aba-0de6-11d0-a285-00aa003049e2'
+    sddl = f'D:(OA;;RP;{guid};;WD)'
+    assert access_check(SD.from_str(sddl), token, 0x10) == 0
+    assert access_check(SD.from_str(sddl), token, 0x10, object_types=[uuid.UUID(guid)]) == 0x10
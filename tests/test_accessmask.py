@@ -0,0 +1,95 @@
+import itertools
+import os
+import random
+import subprocess
+import sys
+import pytest
+from accessmask import AccessMask
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FILE = AccessMask.get_cls('file')
+
+
+def masks_of(cls: type, seed: int, count: int, size: int) -> list:
+    rand = random.Random(seed)
+    values = [val for val, _ in cls.SDDL_RIGHTS]
+    res = []
+    for _ in range(count):
+        mask = 0
+        for val in rand.sample(values, min(size, len(values))):
+            mask |= val
+        res.append(mask)
+    return res
+
+
+@pytest.mark.parametrize('objtype', sorted(AccessMask.TYPES))
+def test_sddl_round_trips(objtype):
+    cls = AccessMask.TYPES[objtype]
+    for mask in masks_of(cls, 0, 200, 4) + [0x1, 0x100000, 0x08000000]:
+        assert cls.from_str(cls.encode_sddl(mask)).rights == mask
+
+
+@pytest.mark.parametrize('objtype', ['file', 'ad', 'regkey', 'service'])
+def test_sddl_cover_is_shortest(objtype):
+    cls = AccessMask.TYPES[objtype]
+    for mask in masks_of(cls, 1, 100, 3):
+        best = None
+        for size in range(1, 4):
+            for combo in itertools.combinations(cls.SDDL_RIGHTS, size):
+                covered = 0
+                for val, _ in combo:
+                    covered |= val
+                if covered == mask:
+                    best = size
+                    break
+            if best is not None:
+                break
+        assert len(cls.find_sddl_cover(mask)) == best
+
+
+def test_known_encodings():
+    assert FILE.encode_sddl(0x1F01FF) == 'FA'
+    assert FILE.encode_sddl(0x10000000) == 'GA'
+    assert AccessMask.get_cls('ad').encode_sddl(0x130) == 'RPWPCR'
+    assert AccessMask.encode_sddl(0x1) == 'CC'
+    # SYNCHRONIZE has no abbreviation, masks including it are written in hex
+    assert FILE.encode_sddl(0x120089) == '0x120089'
+    assert FILE(None, 0x120089).to_sddl() == '0x120089'
+
+
+def test_generic_mapping():
+    assert FILE.map_generic_rights(0x80000000) == 0x120089
+    assert FILE.map_generic_rights(0x10000000 | 0x1) == 0x1F01FF
+    assert FILE.map_generic_rights(0x40000000 | 0x20000000) == 0x120116 | 0x1200A0
+    assert FILE.from_str('GR').map_generic().rights == 0x120089
+    # Without a type, generic rights only map to standard ones
+    assert AccessMask.map_generic_rights(0x80000000 | 0x1) == 0x20001
+    assert AccessMask.map_generic_rights(0x10000000) == 0x1FFFFF
+
+
+def test_from_str():
+    assert FILE.from_str('FA').rights == 0x1F01FF
+    assert FILE.from_str('0x10 | rcsd, 0x1').rights == 0x30011
+    assert FILE.from_str('WRITE_DAC').rights == 0x40000
+    assert AccessMask.get_cls('ad').from_str('RP').rights == 0x10
+    with pytest.raises(ValueError):
+        FILE.from_str('FAZZ')
+
+
+def test_get_cls():
+    assert AccessMask.get_cls(' FILE ') is FILE
+    assert AccessMask.get_cls(None) is AccessMask
+    assert AccessMask.get_cls('nonexistent') is AccessMask
+    assert AccessMask.get_cls('directory') is AccessMask.get_cls('filedir')
+
+
+def test_types_are_imported_on_first_use():
+    code = ('import sys; from accessmask import AccessMask; before = "accessmasks.job" in sys.modules; '
+            'AccessMask.TYPES["job"]; print(before, "accessmasks.job" in sys.modules, "job" in AccessMask.TYPES)')
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, check=True)
+    assert result.stdout.split() == [b'False', b'True', b'True']
+
+
+def test_right_names_and_unknown_bits():
+    text = FILE(None, 0x40000 | 0x04000000).to_str(with_color=False)
+    assert 'WRITE_DAC' in text and '<Unknown reserved right 0x4000000>' in text
@@ -0,0 +1,130 @@
+import struct
+import uuid
+import pytest
+import builders
+from sd import SD
+from acl import ACL
+from ace import ACE
+from accessmask import AccessMask
+
+FILE = AccessMask.TYPES['file']
+USER_FORCE_CHANGE_PASSWORD = '00299570-246d-11d0-a768-00aa006e0529'
+USER = 'bf967aba-0de6-11d0-a285-00aa003049e2'
+
+
+def test_decode_descriptor():
+    dacl = builders.acl([builders.ace(0x00, 0x03, 0x1F01FF, 'S-1-5-18'),
+                         builders.ace(0x01, 0x00, 0x40000, 'S-1-1-0')])
+    sacl = builders.acl([builders.ace(0x11, 0x00, 0x1, 'S-1-16-12288')])
+    buf = builders.sd(0x1000, 'S-1-5-32-544', 'S-1-5-18', dacl, sacl)
+    sd = SD.from_bytes(buf, access_mask_cls=FILE)
+    assert sd.to_sddl() == 'O:BAG:SYD:P(A;OICI;FA;;;SY)(D;;WD;;;WD)S:(ML;;NW;;;HI)'
+
+
+def test_decode_object_ace():
+    dacl = builders.acl([builders.ace(0x05, 0x02, 0x100, 'S-1-5-11', USER_FORCE_CHANGE_PASSWORD, USER)])
+    ace = SD.from_bytes(builders.sd(dacl=dacl)).dacl.aces[0]
+    assert ace.acetype == 'OA'
+    assert ace.object_guid == uuid.UUID(USER_FORCE_CHANGE_PASSWORD)
+    assert ace.inherit_object_guid == uuid.UUID(USER)
+    assert ace.trustee.sid == 'S-1-5-11'
+
+
+def test_null_dacl():
+    buf = struct.pack('<BBHIIII', 1, 0, 0x8004, 0, 0, 0, 0)
+    assert SD.from_bytes(buf).dacl.aces is None
+
+
+def test_same_as_hex_string():
+    buf = builders.sd(owner='S-1-5-18', dacl=builders.acl([builders.ace(0x00, 0, 0x120089, 'S-1-5-11')]))
+    assert SD.from_str(buf.hex()).to_sddl() == SD.from_bytes(buf).to_sddl()
+
+
+def test_iter_from_bytes():
+    first = builders.sd(owner='S-1-5-18')
+    second = builders.sd(owner='S-1-5-32-544', dacl=builders.acl([]))
+    buf = b''.join(struct.pack('<I', len(blob)) + blob for blob in (first, second))
+    assert [sd.to_sddl() for sd in SD.iter_from_bytes(buf)] == ['O:SY', 'O:BAD:']
+    with pytest.raises(ValueError):
+        list(SD.iter_from_bytes(buf[:-3]))
+
+
+@pytest.mark.parametrize('buf', [
+    b'',
+    struct.pack('<BBHIIII', 1, 0, 0x8000, 0, 0, 0, 0)[:19],
+    struct.pack('<BBHIIII', 2, 0, 0x8000, 0, 0, 0, 0),  # unsupported revision
+    struct.pack('<BBHIIII', 1, 0, 0x0000, 0, 0, 0, 0),  # not self-relative
+    struct.pack('<BBHIIII', 1, 0, 0x8000, 20, 0, 0, 0) + builders.sid('S-1-5-32-544')[:10],
+])
+def test_truncated_descriptor(buf):
+    with pytest.raises(ValueError):
+        SD.from_bytes(buf)
+
+
+def test_truncated_acl_header():
+    # The DACL offset points at the last 2 bytes of the buffer
+    buf = struct.pack('<BBHIIII', 1, 0, 0x8004, 0, 0, 0, 20) + b'\x02\x00'
+    with pytest.raises(ValueError, match='Truncated ACL header'):
+        SD.from_bytes(buf)
+    with pytest.raises(ValueError):
+        ACL.from_bytes(b'\x02\x00\x08', 0)
+
+
+def test_acl_size_overflows_buffer():
+    acl = bytearray(builders.acl([builders.ace(0x00, 0, 0x1, 'S-1-5-18')]))
+    struct.pack_into('<H', acl, 2, len(acl) + 4)
+    with pytest.raises(ValueError, match='Invalid ACL size'):
+        ACL.from_bytes(bytes(acl))
+
+
+def test_ace_count_exceeds_acl():
+    acl = bytearray(builders.acl([builders.ace(0x00, 0, 0x1, 'S-1-5-18')]))
+    struct.pack_into('<H', acl, 4, 2)
+    with pytest.raises(ValueError, match='Truncated ACL'):
+        ACL.from_bytes(bytes(acl))
+
+
+def test_truncated_ace_header():
+    with pytest.raises(ValueError, match='Truncated ACE header'):
+        ACE.from_bytes(b'\x00\x00', 0)
+
+
+def test_truncated_ace_trustee():
+    ace = bytearray(builders.ace(0x00, 0, 0x1, 'S-1-5-21-1-2-3-1001'))
+    struct.pack_into('<H', ace, 2, 16)
+    with pytest.raises(ValueError, match='Truncated ACE trustee'):
+        ACE.from_bytes(bytes(ace[:16]))
+
+
+@pytest.mark.parametrize('size,message', [
+    (8, 'Truncated object ACE flags'),  # the ACE ends right after its mask
+    (16, 'Truncated object type GUID'),
+    (32, 'Truncated inherited object type GUID'),
+])
+def test_truncated_object_ace(size, message):
+    # The ACE size says it ends before its object flags or GUIDs do, the buffer itself is longer
+    ace = bytearray(builders.ace(0x05, 0, 0x100, 'S-1-5-11', USER_FORCE_CHANGE_PASSWORD, USER))
+    struct.pack_into('<H', ace, 2, size)
+    with pytest.raises(ValueError, match=message):
+        ACE.from_bytes(bytes(ace))
+
+
+def test_truncated_condition():
+    literal = b'\x04' + struct.pack('<qBB', 3, 3, 2)
+    ace = builders.ace(0x09, 0, 0x1, 'S-1-1-0', extra=b'artx' + literal[:6])
+    with pytest.raises(ValueError, match='Truncated conditional expression'):
+        ACE.from_bytes(ace)
+
+
+def test_truncated_claim():
+    ace = builders.ace(0x12, 0, 0, 'S-1-1-0', extra=struct.pack('<IHHII', 20, 1, 0, 0, 4))
+    with pytest.raises(ValueError, match='Truncated claim'):
+        ACE.from_bytes(ace)
+
+
+def test_unsupported_ace_type_and_flags():
+    with pytest.raises(ValueError, match='Unsupported ACE type 0x04'):
+        ACE.from_bytes(builders.ace(0x04, 0, 0x1, 'S-1-5-18'))
+    # Flags without an SDDL abbreviation could not be written back
+    with pytest.raises(ValueError, match='Unsupported ACE flags 0x20'):
+        ACE.from_bytes(builders.ace(0x00, 0x23, 0x1F01FF, 'S-1-5-18'))
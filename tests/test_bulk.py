@@ -0,0 +1,51 @@
+import io
+import json
+import pytest
+from sd import SD, format_stream
+from sid import SID
+from accessmask import AccessMask
+from resolver import MappingResolver
+from export import JsonLinesWriter
+from bulk import parse_many, format_many, resolve_records
+
+SDDLS = ['O:BAD:(A;;FA;;;S-1-5-21-1-2-3-1000)', 'not sddl', 'D:(A;;FR;;;BU)', 'O:SY'] * 5
+
+
+@pytest.mark.parametrize('workers,chunksize', [(1, 256), (2, 3)])
+def test_records_match_the_parser_in_order(workers, chunksize):
+    records = list(parse_many(SDDLS, 'file', workers=workers, chunksize=chunksize, resolve=False))
+    assert [index for index, _ in records] == list(range(len(SDDLS)))
+    for (_, record), sddl in zip(records, SDDLS):
+        if sddl == 'not sddl':
+            assert record['error'].startswith('SDDLSyntaxError')
+        else:
+            assert record == SD.from_str(sddl, access_mask_cls=AccessMask.get_cls('file'), resolve=False).to_dict()
+
+
+def test_unordered_results_cover_every_input():
+    records = list(parse_many(SDDLS, workers=2, chunksize=2, ordered=False, resolve=False))
+    assert sorted(index for index, _ in records) == list(range(len(SDDLS)))
+
+
+def test_records_are_resolved_in_the_parent():
+    names = MappingResolver()
+    names.add('S-1-5-21-1-2-3-1000', 'CONTOSO\\alice')
+    SID.set_resolver(names)
+    _, record = next(parse_many(SDDLS[:1], workers=1))
+    assert record['dacl']['aces'][0]['trustee']['name'] == 'CONTOSO\\alice'
+    record = {'owner': {'sid': None, 'name': 'contoso\\ALICE', 'abbr': None}, 'group': None, 'dacl': None, 'sacl': None}
+    resolve_records([record], names)
+    assert record['owner']['sid'] == 'S-1-5-21-1-2-3-1000'
+
+
+def test_format_many_matches_format_stream():
+    lines = [('in.txt', num, sddl + '\n') for num, sddl in enumerate(SDDLS, 1)]
+    outputs = []
+    for run in (lambda writer, err: format_stream(lines, writer, err=err),
+                lambda writer, err: format_many(lines, writer, workers=2, chunksize=3, batch_size=4, err=err)):
+        out, err = io.StringIO(), io.StringIO()
+        assert run(JsonLinesWriter(out), err) == 5
+        assert err.getvalue().splitlines()[0].startswith('in.txt:2: SDDLSyntaxError')
+        outputs.append([json.loads(line) for line in out.getvalue().splitlines()])
+    assert outputs[0] == outputs[1]
+    assert [record['line'] for record in outputs[0]][:3] == [1, 3, 4]
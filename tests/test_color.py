@@ -0,0 +1,63 @@
+import re
+import builders
+from sd import SD
+from utils.color import Colorizer, color_spans, wrap_color
+
+COLORED = re.compile('\033\\[;1;([0-9]+)m(.*?)\033\\[;0;0m')
+
+
+def colored_parts(text: str) -> list:
+    return [(part, int(color)) for color, part in COLORED.findall(text)]
+
+
+def header_and_body(sd: SD) -> tuple:
+    header, _, body = sd.to_str(with_color=True).partition('\n')
+    return colored_parts(header), colored_parts(body)
+
+
+def test_header_parts_have_the_colors_of_the_body():
+    sd = SD.from_str('O:BAG:SYD:PAI(A;oici;FA;;;SY)(D;;WD;;;WD)')
+    header, body = header_and_body(sd)
+    assert [part for part, _ in header] == ['BA', 'SY', 'A', 'oi', 'ci', 'FA', 'SY', 'D', 'WD', 'WD']
+    assert {(part.upper(), color) for part, color in header} <= {(part.upper(), color) for part, color in body}
+
+
+def test_acl_flags_are_not_mistaken_for_ace_types():
+    header, _ = header_and_body(SD.from_str('D:PAI(A;;FA;;;SY)'))
+    assert header[0][0] == 'A'
+    assert SD.from_str('D:PAI(A;;FA;;;SY)').to_str(with_color=True).startswith('D:PAI(\033')
+
+
+def test_object_aces_color_everything_after_their_guids():
+    # GUIDs are formatted after the trustee, but come before it in SDDL
+    sd = SD.from_str('D:(OA;;RPWP;bf967a7f-0de6-11d0-a285-00aa003049e2;;DA)S:(ML;;NW;;;LW)')
+    header, body = header_and_body(sd)
+    assert [part for part, _ in header] == ['OA', 'RPWP', 'bf967a7f-0de6-11d0-a285-00aa003049e2', 'DA', 'ML', 'NW', 'LW']
+    assert set(header) <= set(body)
+
+
+def test_header_of_binary_descriptor():
+    # The header is formatted back from the descriptor, SIDs are colored even when written differently
+    dacl = builders.acl([builders.ace(0, 0, 0x1F01FF, 'S-1-5-32-544')])
+    sd = SD.from_bytes(builders.sd(0x8004, owner='S-1-5-18', dacl=dacl))
+    header, body = header_and_body(sd)
+    assert [part for part, _ in header] == ['SY', 'A', 'FA', 'BA']
+    assert [color for _, color in header] == [color for _, color in body]
+
+
+def test_colors_restart_for_each_descriptor():
+    sd = SD.from_str('O:BAG:SY')
+    assert sd.to_str(with_color=True) == sd.to_str(with_color=True)
+
+
+def test_color_spans_skips_overlaps():
+    assert color_spans('abcdef', [(3, 5, 31), (0, 2, 32), (1, 4, 34)]) == \
+        wrap_color('ab', 32) + 'c' + wrap_color('de', 31) + 'f'
+
+
+def test_only_parts_with_a_field_are_recorded():
+    colorizer = Colorizer()
+    colorizer.colorize('x')
+    colorizer.region, colorizer.index = 'D', 2
+    colorizer.colorize('A', 'type')
+    assert [part[:3] for part in colorizer.parts] == [('D', 2, 'type')]
@@ -0,0 +1,30 @@
+import os
+import sys
+import pytest
+from sd import SD
+from sid import SID
+from accessmask import AccessMask
+from accesscheck import integrity_rid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import corpus
+
+
+@pytest.mark.parametrize('abbr', corpus.WELL_KNOWN + corpus.DOMAIN_RIDS + corpus.LABELS)
+def test_abbreviations_are_well_known(abbr):
+    assert SID.from_str(abbr).sid is not None
+
+
+@pytest.mark.parametrize('label', corpus.LABELS)
+def test_labels_are_integrity_levels(label):
+    assert integrity_rid(SID.from_str(label)) in (4096, 8192, 8448, 12288, 16384)
+
+
+def test_corpora_parse_and_are_reproducible():
+    corpora = corpus.generate(count=20, seed=1)
+    assert corpora == corpus.generate(count=20, seed=1)
+    for name, (objtype, sddls) in corpora.items():
+        sds = [SD.from_str(sddl, access_mask_cls=AccessMask.TYPES[objtype]) for sddl in sddls]
+        if name == 'label':
+            assert all(any(ace.acetype == 'ML' for ace in sd.sacl.aces) for sd in sds)
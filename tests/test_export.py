@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+import pytest
+from sd import SD
+from export import RecordWriter, JsonLinesWriter, CsvWriter, TextWriter
+
+SDDL = 'O:SYG:SYD:P(A;OICI;FA;;;SY)(D;;WD;;;WD)S:'
+
+
+def test_record_writer_is_abstract():
+    with pytest.raises(TypeError):
+        RecordWriter()
+
+
+def test_jsonl_writes_one_record_per_descriptor():
+    out = io.StringIO()
+    JsonLinesWriter(out).write_batch([('in.txt', 3, SD.from_str(SDDL))])
+    record, = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert (record['source'], record['line'], record['sddl']) == ('in.txt', 3, SDDL)
+    assert [ace['type'] for ace in record['dacl']['aces']] == ['A', 'D']
+
+
+def test_csv_writes_one_row_per_ace_and_empty_acl():
+    out = io.StringIO()
+    CsvWriter(out).write_batch([('in.txt', 3, SD.from_str(SDDL))])
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [(row['acl'], row['ace_index'], row['ace_type'], row['trustee_sid']) for row in rows] == \
+        [('D', '0', 'A', 'S-1-5-18'), ('D', '1', 'D', 'S-1-1-0'), ('S', '', '', '')]
+    assert rows[0]['acl_flags'] == 'P' and rows[0]['mask'] == str(0x1F01FF)
+
+
+def test_sddl_writer():
+    out = io.StringIO()
+    TextWriter(out, sddl=True).write_batch([(None, 1, SD.from_str(SDDL))])
+    assert out.getvalue() == SDDL + '\n'
+
+
+class Terminal(io.StringIO):
+
+    def isatty(self) -> bool:
+        return True
+
+
+def test_text_writer_only_colors_terminals():
+    for stream, colored in ((io.StringIO(), False), (Terminal(), True)):
+        TextWriter(stream).write_batch([(None, 1, SD.from_str(SDDL))])
+        assert ('\x1b[' in stream.getvalue()) == colored
@@ -0,0 +1,90 @@
+import pickle
+import pytest
+import builders
+from sd import SD
+from acl import ACL
+from ace import ACE
+from sid import SID
+from accessmask import AccessMask
+from packedacl import PackedACL
+from inheritance import inherit
+from utils.frozen import is_frozen
+
+SDDL = 'O:BAG:SYD:PAI(A;OICI;FA;;;SY)(D;;WD;;;WD)S:(AU;SA;WD;;;WD)'
+
+
+def test_cached_descriptor_is_read_only():
+    sd = SD.from_str(SDDL, cached=True)
+    ace = sd.dacl.aces[0]
+    for obj, name, value in ((sd, 'owner', SID.from_str('SY')), (sd, 'dacl', None), (sd.dacl, 'aces', []),
+                             (ace, 'trustee', SID.from_str('WD')), (ace, 'rights', AccessMask(None, 1)),
+                             (sd.sacl.aces[0], 'acetype', 'A')):
+        with pytest.raises(AttributeError):
+            setattr(obj, name, value)
+    with pytest.raises(TypeError):
+        sd.dacl.flags['AI'] = None
+    with pytest.raises(TypeError):
+        ace.flags['OI'] = None
+    with pytest.raises(TypeError):
+        sd.dacl.aces[0] = ace
+    assert SD.from_str(SDDL, cached=True).to_sddl() == sd.to_sddl()
+
+
+def test_cached_binary_descriptor_is_read_only():
+    dacl = builders.acl([builders.ace(0, 0, 0x1F01FF, 'S-1-5-18')])
+    sd = SD.from_bytes(builders.sd(0x8004, owner='S-1-5-18', dacl=dacl), cached=True)
+    assert is_frozen(sd) and is_frozen(sd.dacl) and is_frozen(sd.dacl.aces[0])
+    with pytest.raises(AttributeError):
+        sd.dacl.aces[0].trustee = None
+
+
+def test_frozen_objects_keep_their_class():
+    sd = SD.from_str(SDDL, cached=True)
+    assert isinstance(sd, SD) and isinstance(sd.dacl, ACL) and isinstance(sd.dacl.aces[0], ACE)
+    assert type(sd).__name__ == 'SD'
+
+
+def test_uncached_descriptor_is_mutable():
+    sd = SD.from_str(SDDL)
+    assert not is_frozen(sd)
+    sd.owner = SID.from_str('SY')
+    sd.dacl.aces.append(ACE.from_str('(A;;GR;;;BU)'))
+    sd.dacl.aces[0].trustee = SID.from_str('WD')
+    sd.dacl.aces[0].flags['ID'] = ACE.FLAGS['ID']
+    assert sd.to_sddl() == 'O:SYG:SYD:PAI(A;OICIID;FA;;;WD)(D;;WD;;;WD)(A;;GR;;;BU)S:(AU;SA;WD;;;WD)'
+
+
+def test_access_masks_are_immutable():
+    mask = AccessMask.from_str('GR')
+    with pytest.raises(AttributeError):
+        mask.rights = 0
+    with pytest.raises(AttributeError):
+        del mask.raw
+    copy = pickle.loads(pickle.dumps(mask))
+    assert (type(copy), copy.raw, copy.rights) == (type(mask), mask.raw, mask.rights)
+
+
+def test_cached_packed_acl_is_read_only():
+    acl = PackedACL.from_str('(A;;FA;;;SY)(A;;0x1FFFFFFFF;;;WD)', cached=True)
+    assert is_frozen(acl) and is_frozen(acl.unpacked[1])
+    with pytest.raises(TypeError):
+        acl.masks[0] = 0
+    with pytest.raises(AttributeError):
+        acl.sids.append(None)
+    with pytest.raises(AttributeError):
+        acl.sids = []
+    # ACEs built from the columns are still standalone copies
+    ace = acl.aces[0]
+    ace.trustee = SID.from_str('WD')
+    assert acl.aces[0].trustee.abbr == 'SY'
+    assert acl.find(0x1F01FF) == [0, 1]
+
+
+def test_inherited_descriptors_do_not_freeze_the_child():
+    parent = SD.from_str('O:BAG:SYD:(A;OICI;FA;;;SY)')
+    child = SD.from_str('D:P(A;;FA;;;BU)')
+    sd = inherit(parent, True, child=child)
+    assert is_frozen(sd) and is_frozen(sd.dacl)
+    assert not is_frozen(child.dacl) and not is_frozen(child.dacl.aces[0])
+    child.dacl.aces[0].trustee = SID.from_str('WD')
+    assert sd.dacl.aces[0].trustee.abbr == 'BU'
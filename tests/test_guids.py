@@ -0,0 +1,39 @@
+import uuid
+import pytest
+from ace import ACE
+from utils.guidtable import GUIDTable
+
+USER_CLASS = 'bf967aba-0de6-11d0-a285-00aa003049e2'
+FORCE_CHANGE_PASSWORD = '00299570-246d-11d0-a768-00aa006e0529'
+
+
+@pytest.mark.parametrize('key', [USER_CLASS, USER_CLASS.upper(), '{' + USER_CLASS + '}', USER_CLASS.replace('-', ''),
+                                 uuid.UUID(USER_CLASS), uuid.UUID(USER_CLASS).bytes])
+def test_lookups_accept_any_form(key):
+    assert ACE.GUID_OBJECT_TYPES[key] == 'User'
+    assert key in ACE.GUID_OBJECT_TYPES
+
+
+@pytest.mark.parametrize('key', ['bf967aba-0de6-11d0-a285-00aa003049e3', 'not a guid', b'short', 42, None])
+def test_missing_keys(key):
+    assert key not in ACE.GUID_OBJECT_TYPES
+    with pytest.raises(KeyError):
+        ACE.GUID_OBJECT_TYPES[key]
+
+
+def test_tables_load_on_first_lookup():
+    table = GUIDTable('adguids', 'EXTENDED_RIGHTS')
+    assert not table.is_loaded()
+    assert table[FORCE_CHANGE_PASSWORD] == 'User-Force-Change-Password'
+    assert table.is_loaded()
+    keys = list(table)
+    assert len(keys) == len(table) and uuid.UUID(FORCE_CHANGE_PASSWORD) in keys
+    assert keys == sorted(keys, key=lambda key: key.bytes)
+
+
+def test_object_aces_are_named():
+    ace = ACE.from_str(f'(OA;CI;CR;{{{FORCE_CHANGE_PASSWORD.upper()}}};{USER_CLASS};AU)')
+    assert ace.object_guid == uuid.UUID(FORCE_CHANGE_PASSWORD)
+    text = ace.to_str(with_color=False)
+    assert 'Extended right limited to: 00299570-246d-11d0-a768-00aa006e0529 (User-Force-Change-Password)' in text
+    assert f'Only inherited by objects of type: {USER_CLASS} (User)' in text
@@ -0,0 +1,100 @@
+import itertools
+import os
+import subprocess
+import sys
+import pytest
+from sd import SD
+from accessmask import AccessMask
+from index import TrusteeIndex, MaskIndex, write_varint, iter_postings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FILE = AccessMask.get_cls('file')
+OBJECTS = [
+    ('a', 'O:BAD:(A;;FA;;;BA)(A;;FR;;;BU)'),
+    ('b', 'O:BAD:(A;;FA;;;BA)(A;;FR;;;BU)'),
+    ('c', 'O:BAD:(D;;FW;;;BU)(A;;0x1;;;BU)(A;OICIIO;FA;;;CO)'),
+    ('d', 'O:SYD:(A;;0x3;;;S-1-5-21-1-2-3-1000)S:(AU;SA;FA;;;WD)'),
+    ('e', 'O:SYD:'),
+]
+
+
+def build(cls=MaskIndex) -> TrusteeIndex:
+    return cls(FILE).add_many(OBJECTS)
+
+
+def test_objects_sharing_a_descriptor_share_its_id():
+    index = build(TrusteeIndex)
+    assert len(index) == 5 and len(index.sddls) == 4
+    assert index.add('f', ' ' + OBJECTS[0][1]) == 0
+
+
+@pytest.mark.parametrize('cls', [TrusteeIndex, MaskIndex])
+def test_find_by_trustee(cls):
+    index = build(cls)
+    assert list(index.find('BU')) == ['a', 'b', 'c']
+    assert list(index.find('S-1-5-32-545', 0x1)) == ['a', 'b', 'c']
+    assert list(index.find('BU', 0x2)) == []
+    assert list(index.find('BU', 0x2, match_all=False, acetypes=['D'])) == ['c']
+    assert list(index.find('S-1-5-21-1-2-3-1000', 0x3)) == ['d']
+    assert list(index.find('WD', acetypes=None)) == ['d']
+    assert list(index.find('AU')) == []
+    # Inherit-only ACEs are left out unless asked for
+    assert list(index.find('CO')) == []
+    assert list(cls(FILE, inherit_only=True).add_many(OBJECTS).find('CO')) == ['c']
+
+
+def expected_rows(index: MaskIndex, rights: int, mode: str, acetypes) -> list:
+    rows = []
+    for row in range(len(index.row_sds)):
+        _, acetype, _, mask = index.get_row(row)
+        if acetypes is not None and acetype not in acetypes:
+            continue
+        if (mode == 'superset' and mask & rights == rights) or (mode == 'subset' and mask & ~rights == 0) or \
+                (mode == 'any' and (rights == 0 or mask & rights)):
+            rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize('rights,mode,acetypes', list(itertools.product(
+    [0, 0x1, 0x3, 0x40000, 0x80000000, 0x1F01FF], ['superset', 'any', 'subset'], [None, ('A', 'OA'), ('D',)])))
+def test_mask_queries_match_a_scan(rights, mode, acetypes):
+    index = build()
+    mapped = FILE.map_generic_rights(rights)
+    assert index.query_rows(rights, mode, acetypes) == expected_rows(index, mapped, mode, acetypes)
+    assert index.count(rights, mode, acetypes) == len(expected_rows(index, mapped, mode, acetypes))
+
+
+def test_any_with_no_rights_matches_like_find():
+    index = build()
+    assert list(index.query(0, 'any')) == list(index.query(0, 'superset')) == ['a', 'b', 'c', 'd']
+    assert list(index.query(0, 'any', trustees=['BU'])) == list(index.find('BU', 0, match_all=False))
+
+
+def test_mask_queries_by_trustee():
+    index = build()
+    assert list(index.query(0x1, trustees=['BU'])) == ['a', 'b', 'c']
+    assert list(index.query(0x1F01FF, 'superset', trustees=['BU', 'BA'])) == ['a', 'b']
+    assert index.query_sds(0x1, 'subset', trustees=['BU']) == [1]
+
+
+def test_queries_after_adding_more():
+    index = build()
+    assert list(index.query(0x1F01FF)) == ['a', 'b']
+    index.add('f', 'D:(A;;FA;;;WD)')
+    assert list(index.query(0x1F01FF)) == ['a', 'b', 'f']
+
+
+def test_varints_round_trip():
+    buf = bytearray()
+    pairs = [(0, 0), (127, 128), (300, 1), (1 << 31, 5)]
+    for delta, entry in pairs:
+        write_varint(buf, delta)
+        write_varint(buf, entry)
+    assert list(iter_postings(bytes(buf))) == pairs
+
+
+def test_cli_any_without_rights_lists_every_object():
+    lines = ''.join(f'{object_id}\t{sddl}\n' for object_id, sddl in OBJECTS)
+    result = subprocess.run([sys.executable, os.path.join(ROOT, 'index.py'), '--any', '-t', 'file'],
+                            input=lines.encode(), capture_output=True, check=True)
+    assert result.stdout.decode().split() == ['a', 'b', 'c', 'd']
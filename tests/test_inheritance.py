@@ -0,0 +1,92 @@
+import uuid
+from sd import SD
+from ace import ACE
+from sid import SID
+from accessmask import AccessMask
+from inheritance import inherit, propagate, INHERITED
+
+FILE = AccessMask.get_cls('file')
+AD = AccessMask.get_cls('ad')
+PARENT = 'O:BAG:SYD:AI(A;OICI;FA;;;SY)(A;CI;FR;;;BU)(A;OI;0x1;;;WD)(A;OICIIO;GA;;;CO)(A;OICINP;FW;;;AU)(A;;FA;;;BA)'
+USER = 'S-1-5-21-1-2-3-1000'
+
+
+def parent() -> SD:
+    return SD.from_str(PARENT, access_mask_cls=FILE)
+
+
+def test_container_child():
+    sd = inherit(parent(), True, owner=SID.from_str(USER), access_mask_cls=FILE)
+    assert sd.to_sddl() == (
+        f'O:{USER}G:SYD:AI(A;OICIID;FA;;;SY)'
+        # Generic rights are mapped for the container, and kept for its children in an inherit-only copy
+        '(A;ID;0x120089;;;BU)(A;CIIOID;FR;;;BU)'
+        # Object-only ACEs are carried down for the objects below
+        '(A;OIIOID;CC;;;WD)'
+        # CREATOR OWNER becomes the new owner, and keeps propagating as is
+        f'(A;ID;FA;;;{USER})(A;OICIIOID;GA;;;CO)'
+        # NP: effective on the container only
+        '(A;ID;0x120116;;;AU)')
+
+
+def test_object_child():
+    # Owner and group default to the parent's, nothing propagates further
+    sd = inherit(parent(), False, access_mask_cls=FILE)
+    assert sd.to_sddl() == 'O:BAG:SYD:AI(A;ID;FA;;;SY)(A;ID;CC;;;WD)(A;ID;FA;;;BA)(A;ID;0x120116;;;AU)'
+
+
+def test_explicit_aces_are_kept_first_and_inherited_ones_replaced():
+    child = SD.from_str('D:(A;;FA;;;BU)(A;ID;FA;;;WD)')
+    sd = inherit(parent(), False, child=child, access_mask_cls=FILE)
+    assert sd.to_sddl() == 'O:BAG:SYD:AI(A;;FA;;;BU)(A;ID;FA;;;SY)(A;ID;CC;;;WD)(A;ID;FA;;;BA)(A;ID;0x120116;;;AU)'
+
+
+def test_protected_child_keeps_its_dacl():
+    child = SD.from_str('O:BUD:P(A;;FA;;;BU)')
+    assert inherit(parent(), True, child=child, access_mask_cls=FILE).to_sddl() == 'O:BUG:SYD:P(A;;FA;;;BU)'
+
+
+def test_object_type_inheritance():
+    user_class = 'bf967aba-0de6-11d0-a285-00aa003049e2'
+    group_class = 'bf967a9c-0de6-11d0-a285-00aa003049e2'
+    root = SD.from_str(f'O:DAD:(OA;CI;RP;;{user_class};AU)', access_mask_cls=AD)
+    assert inherit(root, True, uuid.UUID(user_class), access_mask_cls=AD).dacl.aces[0].flags.keys() == {'CI', 'ID'}
+    # Other types only carry it down, inherit-only
+    sd = inherit(root, True, uuid.UUID(group_class), access_mask_cls=AD)
+    assert sd.to_sddl() == f'O:DAD:AI(OA;CIIOID;RP;;{user_class};AU)'
+    assert len(inherit(root, False, uuid.UUID(group_class), access_mask_cls=AD).dacl.aces) == 0
+
+
+def test_results_are_memoized():
+    INHERITED.clear()
+    first = inherit(parent(), True, access_mask_cls=FILE)
+    assert inherit(parent(), True, access_mask_cls=FILE) is first
+    assert inherit(parent(), False, access_mask_cls=FILE) is not first
+
+
+def test_changes_to_the_root_are_seen():
+    root = SD.from_str('O:BAG:SYD:(A;OICI;FA;;;SY)', access_mask_cls=FILE)
+    assert inherit(root, False, access_mask_cls=FILE).to_sddl() == 'O:BAG:SYD:AI(A;ID;FA;;;SY)'
+    root.dacl.aces.append(ACE.from_str('(A;OICI;WD;;;BU)', access_mask_cls=FILE))
+    assert inherit(root, False, access_mask_cls=FILE).to_sddl() == 'O:BAG:SYD:AI(A;ID;FA;;;SY)(A;ID;WD;;;BU)'
+    nodes = [('C:\\a', 'C:\\', True, None, None), ('C:\\a\\f', 'C:\\a', False, None, None)]
+    before = dict(propagate(root, nodes, access_mask_cls=FILE))
+    root.dacl.aces.pop(0)
+    after = dict(propagate(root, nodes, access_mask_cls=FILE))
+    assert before['C:\\a\\f'].to_sddl() == 'O:BAG:SYD:AI(A;ID;FA;;;SY)(A;ID;WD;;;BU)'
+    assert after['C:\\a\\f'].to_sddl() == 'O:BAG:SYD:AI(A;ID;WD;;;BU)'
+
+
+def test_propagate_down_a_tree():
+    root = SD.from_str('O:BAG:SYD:PAI(A;OICI;FA;;;SY)(A;CI;GR;;;BU)', access_mask_cls=FILE)
+    nodes = [
+        ('C:\\a', 'C:\\', True, None, None),
+        ('C:\\a\\b', 'C:\\a', True, SD.from_str('D:P(A;;FA;;;WD)'), None),
+        ('C:\\a\\b\\f', 'C:\\a\\b', False, None, None),
+        ('C:\\a\\f', 'C:\\a', False, None, None),
+    ]
+    res = dict(propagate(root, nodes, access_mask_cls=FILE))
+    assert res['C:\\a'].to_sddl() == 'O:BAG:SYD:AI(A;OICIID;FA;;;SY)(A;ID;0x120089;;;BU)(A;CIIOID;FR;;;BU)'
+    assert res['C:\\a\\b'].to_sddl() == 'O:BAG:SYD:P(A;;FA;;;WD)'
+    assert res['C:\\a\\b\\f'].to_sddl() == 'O:BAG:SYD:AI'
+    assert res['C:\\a\\f'].to_sddl() == 'O:BAG:SYD:AI(A;ID;FA;;;SY)'
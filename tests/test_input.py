@@ -0,0 +1,52 @@
+import io
+import os
+import subprocess
+import sys
+from sd import iter_input_lines, format_stream
+from export import get_writer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICACLS = 'dir\r\nD:AI(A;OICIID;FA;;;SY)\r\ndir\\file.txt\r\nD:AI(A;ID;FA;;;BA)\r\n'
+
+
+def test_reads_files_with_encoding(tmp_path):
+    path = tmp_path / 'sds.txt'
+    path.write_text('O:SY\n\nO:BA\n', encoding='utf-16')
+    assert [(num, line.strip()) for _, num, line in iter_input_lines([str(path)], encoding='utf-16')] == \
+        [(1, 'O:SY'), (2, ''), (3, 'O:BA')]
+
+
+def test_reads_stdin_with_encoding(monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO('O:SY\nO:BA\n'.encode('utf-16')), encoding='ascii'))
+    lines = list(iter_input_lines(['-'], encoding='utf-16'))
+    assert [(source, num, line.strip()) for source, num, line in lines] == [('<stdin>', 1, 'O:SY'), ('<stdin>', 2, 'O:BA')]
+    assert not sys.stdin.buffer.closed
+
+
+def test_icacls_names_become_sources(tmp_path):
+    path = tmp_path / 'acls.txt'
+    path.write_text(ICACLS + 'orphan\r\n', encoding='utf-16', newline='')
+    lines = [(source, num, line.strip()) for source, num, line in
+             iter_input_lines([str(path)], encoding='utf-16', icacls=True)]
+    assert lines == [('dir', 2, 'D:AI(A;OICIID;FA;;;SY)'), ('dir\\file.txt', 4, 'D:AI(A;ID;FA;;;BA)'),
+                     (str(path), 5, 'orphan')]
+
+
+def test_icacls_output_parses_without_errors(tmp_path):
+    path = tmp_path / 'acls.txt'
+    path.write_text(ICACLS, encoding='utf-16', newline='')
+    out = tmp_path / 'out.jsonl'
+    err = io.StringIO()
+    writer = get_writer('jsonl', str(out))
+    errors = format_stream(iter_input_lines([str(path)], encoding='utf-16', icacls=True), writer, err=err)
+    writer.close()
+    assert errors == 0 and err.getvalue() == ''
+    assert len(out.read_text().splitlines()) == 2
+
+
+def test_cli_decodes_stdin():
+    result = subprocess.run([sys.executable, os.path.join(ROOT, 'sd.py'), '--icacls', '-f', 'jsonl'],
+                            input=ICACLS.encode('utf-16'), capture_output=True, check=True)
+    assert result.stderr == b''
+    assert [line.count(b'"source"') for line in result.stdout.splitlines()] == [1, 1]
+    assert b'dir\\\\file.txt' in result.stdout
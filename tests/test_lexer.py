@@ -0,0 +1,69 @@
+import pytest
+from lexer import SDDLSyntaxError, tokenize
+from acl import ACL
+from sd import SD
+
+
+def spans(text: str, **kwargs) -> list:
+    return [(kind, text[start:end]) for kind, start, end in tokenize(text, **kwargs)]
+
+
+def test_tokenizes_every_section():
+    assert spans('O:BAG:SYD:PAI(A;OICI;FA;;;SY)(D;;WD;;;WD)S:(AU;SA;FA;;;WD)') == [
+        ('section', 'O'), ('sid', 'BA'), ('section', 'G'), ('sid', 'SY'),
+        ('section', 'D'), ('flags', 'PAI'), ('ace', 'A;OICI;FA;;;SY'), ('ace', 'D;;WD;;;WD'),
+        ('section', 'S'), ('flags', ''), ('ace', 'AU;SA;FA;;;WD'),
+    ]
+
+
+def test_sections_in_any_order_with_blanks():
+    assert spans(' D: P ( A;;FA;;;SY ) O: BA ') == [
+        ('section', 'D'), ('flags', 'P'), ('ace', ' A;;FA;;;SY '), ('section', 'O'), ('sid', 'BA'),
+    ]
+
+
+def test_nested_parentheses_and_quoted_strings_stay_in_their_ace():
+    ace = 'XA;;FR;;;WD;(@User.title == "a)b(" && (Member_of {SID(BA)}))'
+    assert spans(f'D:({ace})(A;;FA;;;SY)') == [('section', 'D'), ('flags', ''), ('ace', ace), ('ace', 'A;;FA;;;SY')]
+
+
+def test_acl_without_header():
+    assert spans('AI(A;;FA;;;SY)', sections=False) == [('flags', 'AI'), ('ace', 'A;;FA;;;SY')]
+    assert spans('', sections=False) == [('flags', '')]
+
+
+def test_empty_sections():
+    assert spans('D:S:') == [('section', 'D'), ('flags', ''), ('section', 'S'), ('flags', '')]
+
+
+@pytest.mark.parametrize('text,message,offset', [
+    ('D:(A;;FA;;;SY', 'Unterminated ACE', 2),
+    ('D:(A;;FA;;;SY))', 'Unbalanced closing parenthesis', 14),
+    ('D:(XA;;FR;;;WD;(@User.x == "a))', 'Unterminated string', 27),
+    ('O:BA(A;;FA;;;SY)', 'Unexpected ACE outside of an ACL', 4),
+    ('X:BA', 'Unknown section "X"', 0),
+    ('O:BAO:SY', 'Duplicate O: section', 4),
+    ('D:(A;;FA;;;SY)x(A;;FA;;;BA)', 'Unexpected character "x"', 14),
+    ('x D:', 'Unexpected character "x"', 0),
+    (':BA', 'Expected a section letter (O, G, D or S) before colon', 0),
+    ('D:"', 'Unexpected quote outside of an ACE', 2),
+])
+def test_syntax_errors_point_at_their_offset(text, message, offset):
+    with pytest.raises(SDDLSyntaxError) as info:
+        list(tokenize(text))
+    assert info.value.args[0] == f'{message} at offset {offset}'
+    assert info.value.offset == offset
+    assert info.value.to_str().splitlines()[2] == '    ' + ' ' * offset + '^'
+
+
+def test_syntax_errors_are_value_errors_from_parsers():
+    with pytest.raises(ValueError):
+        SD.from_str('D:(A;;FA;;;SY')
+    with pytest.raises(SDDLSyntaxError):
+        ACL.from_str('(A;;FA;;;SY')
+
+
+def test_parsers_use_the_spans():
+    sd = SD.from_str('S:(AU;SA;FA;;;WD) D:AI(A;;FA;;;SY) O:BA')
+    assert sd.to_sddl() == 'O:BAD:AI(A;;FA;;;SY)S:(AU;SA;FA;;;WD)'
+    assert sd.dacl.aclstr == 'AI(A;;FA;;;SY)'
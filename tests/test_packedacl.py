@@ -0,0 +1,51 @@
+import time
+from acl import ACL
+from ace import ACE
+from sid import SID
+from packedacl import PackedACL
+
+SDDL = '(A;OICI;FA;;;SY)(D;;WD;;;WD)(A;;0x1200A9;;;BU)(A;;0x1FFFFFFFF;;;BU)(a;ci;fa;;;sy)'
+
+
+def test_round_trips_aces_and_their_text():
+    acl = PackedACL.from_str(SDDL)
+    assert acl.to_sddl() == ACL.from_str(SDDL).to_sddl()
+    assert [ace.acestr for ace in acl.aces] == ['A;OICI;FA;;;SY', 'D;;WD;;;WD', 'A;;0x1200A9;;;BU',
+                                                'A;;0x1FFFFFFFF;;;BU', 'a;ci;fa;;;sy']
+    assert list(acl.unpacked) == [3]
+
+
+def test_queries_include_unpacked_aces():
+    acl = PackedACL.from_str(SDDL)
+    users = SID.from_str('BU')
+    assert acl.select(['A'], users) == [2, 3]
+    assert acl.select(['a']) == [0, 2, 3, 4]
+    assert acl.find(0x100000000) == [3]
+    assert acl.find(0x1, trustee=users) == [2, 3]
+    assert acl.find(0x40000 | 0x1, match_all=False, acetypes=['D']) == [1]
+    assert acl.combined_mask(['A'], users) == 0x1FFFFFFFF
+    assert acl.combined_mask(['D']) == 0x40000
+
+
+def test_replaced_trustees_are_queried():
+    acl = PackedACL.from_str(SDDL)
+    everyone = SID.from_str('WD')
+    copy = acl.replace_trustees({SID.from_str('BU'): everyone})
+    assert copy.select(trustee=everyone) == [1, 2, 3]
+    assert acl.select(trustee=everyone) == [1]
+
+
+def test_packing_scales_linearly():
+    # Interning looks every value up in per-table dictionaries built once, not once per ACE
+    def pack_time(count: int) -> float:
+        aces = [ACE.from_str(f'(A;;FA;;;S-1-5-21-1-2-3-{1000 + i})') for i in range(count)]
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            acl = PackedACL(None, {}, aces)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        assert len(acl.sids) == count
+        return best
+
+    assert pack_time(4000) < 8 * pack_time(1000)
@@ -0,0 +1,62 @@
+from sd import SD
+from acl import ACL
+from sid import SID
+from packedacl import PackedACL
+from resolver import MappingResolver
+
+SDDL = 'O:S-1-5-21-1-2-3-1000G:SYD:(A;;FA;;;S-1-5-21-1-2-3-1001)(A;;GR;;;BU)'
+
+
+def use_names():
+    names = MappingResolver()
+    names.add('S-1-5-21-1-2-3-1000', 'CONTOSO\\Administrator')
+    names.add('S-1-5-21-1-2-3-1001', 'CONTOSO\\alice')
+    SID.set_resolver(names)
+
+
+def test_resolves_owner_and_trustees():
+    use_names()
+    sd, = SD.resolve_all([SD.from_str(SDDL, resolve=False)])
+    assert sd.owner.principal == 'CONTOSO\\Administrator'
+    assert sd.dacl.aces[0].trustee.principal == 'CONTOSO\\alice'
+    assert sd.dacl.aces[1].trustee.principal == 'Users'
+    assert sd.to_sddl() == SDDL
+
+
+def test_cached_descriptors_are_not_modified():
+    use_names()
+    cached = SD.from_str(SDDL, cached=True, resolve=False)
+    resolved, = SD.resolve_all([cached])
+    assert resolved is not cached
+    assert resolved.dacl.aces[0].trustee.principal == 'CONTOSO\\alice'
+    again = SD.from_str(SDDL, cached=True, resolve=False)
+    assert again is cached
+    assert again.owner.principal is None
+    assert again.dacl.aces[0].trustee.principal is None
+
+
+def test_keeps_order_and_none():
+    use_names()
+    first = SD.from_str('O:SY', resolve=False)
+    second = SD.from_str(SDDL, resolve=False)
+    sds = SD.resolve_all([first, None, second])
+    assert sds[0] is first  # nothing to resolve
+    assert sds[1] is None
+    assert sds[2].owner.principal == 'CONTOSO\\Administrator'
+
+
+def test_acl_resolve_all():
+    use_names()
+    acl = ACL.from_str('(A;;FA;;;S-1-5-21-1-2-3-1001)', cached=True, resolve=False)
+    resolved, = ACL.resolve_all([acl])
+    assert resolved.aces[0].trustee.principal == 'CONTOSO\\alice'
+    assert acl.aces[0].trustee.principal is None
+
+
+def test_packed_acl_resolve_all():
+    use_names()
+    sd = SD.from_str(SDDL, resolve=False, acl_cls=PackedACL)
+    resolved, = SD.resolve_all([sd])
+    assert isinstance(resolved.dacl, PackedACL)
+    assert resolved.dacl.aces[0].trustee.principal == 'CONTOSO\\alice'
+    assert sd.dacl.aces[0].trustee.principal is None
@@ -0,0 +1,108 @@
+import threading
+import time
+from resolver import Resolver, CachingResolver, MappingResolver, SqliteStore
+
+NAMES = {'S-1-5-21-1-2-3-1000': 'CONTOSO\\alice', 'S-1-5-21-1-2-3-1001': 'CONTOSO\\bob'}
+
+
+class CountingResolver(Resolver):
+
+    def __init__(self):
+        self.calls = []
+
+    def resolve_to_name(self, sidstr: str):
+        self.calls.append(('to_name', sidstr))
+        return NAMES.get(sidstr)
+
+    def resolve_from_name(self, account_name: str):
+        self.calls.append(('from_name', account_name))
+        return {name.upper(): sid for sid, name in NAMES.items()}.get(account_name.upper())
+
+    def resolve_many_to_names(self, sidstrs):
+        self.calls.append(('many_to_names', sorted(sidstrs)))
+        return {sidstr: NAMES.get(sidstr) for sidstr in sidstrs}
+
+
+def test_caches_successful_resolutions():
+    backend = CountingResolver()
+    resolver = CachingResolver(backend)
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-1000') == 'CONTOSO\\alice'
+    assert resolver.resolve_to_name('s-1-5-21-1-2-3-1000') == 'CONTOSO\\alice'
+    assert resolver.resolve_from_name('contoso\\BOB') == 'S-1-5-21-1-2-3-1001'
+    assert resolver.resolve_from_name('CONTOSO\\bob') == 'S-1-5-21-1-2-3-1001'
+    assert len(backend.calls) == 2
+
+
+def test_failed_resolutions_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    backend = CountingResolver()
+    resolver = CachingResolver(backend, negative_ttl=60)
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-9999') is None
+    now[0] += 59
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-9999') is None
+    assert len(backend.calls) == 1
+    now[0] += 2
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-9999') is None
+    assert len(backend.calls) == 2
+
+
+def test_batches_only_look_up_what_is_missing():
+    backend = CountingResolver()
+    resolver = CachingResolver(backend)
+    resolver.resolve_to_name('S-1-5-21-1-2-3-1000')
+    res = resolver.resolve_many_to_names(['S-1-5-21-1-2-3-1000', 'S-1-5-21-1-2-3-1001', 's-1-5-21-1-2-3-1001'])
+    assert res == {'S-1-5-21-1-2-3-1000': 'CONTOSO\\alice', 'S-1-5-21-1-2-3-1001': 'CONTOSO\\bob',
+                   's-1-5-21-1-2-3-1001': 'CONTOSO\\bob'}
+    assert backend.calls[-1] == ('many_to_names', ['S-1-5-21-1-2-3-1001'])
+    resolver.resolve_many_to_names(['S-1-5-21-1-2-3-1001'])
+    assert len(backend.calls) == 2
+
+
+def test_store_persists_between_runs(tmp_path):
+    path = str(tmp_path / 'names.db')
+    backend = CountingResolver()
+    store = SqliteStore(path)
+    CachingResolver(backend, store=store).resolve_many_to_names(['S-1-5-21-1-2-3-1000', 'S-1-5-21-1-2-3-9999'])
+    store.close()
+    store = SqliteStore(path)
+    resolver = CachingResolver(backend, store=store)
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-1000') == 'CONTOSO\\alice'
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-9999') is None
+    assert len(backend.calls) == 1
+    assert store.get('to_name', 'S-1-5-21-1-2-3-9999')[0]
+    store.put('to_name', 'S-1-5-21-1-2-3-8888', None, time.time() - 1)
+    assert store.get('to_name', 'S-1-5-21-1-2-3-8888') == (False, None)
+    store.close()
+
+
+def test_concurrent_lookups(tmp_path):
+    resolver = CachingResolver(CountingResolver(), store=SqliteStore(str(tmp_path / 'names.db')))
+    results = []
+
+    def work():
+        for _ in range(50):
+            results.append(resolver.resolve_to_name('S-1-5-21-1-2-3-1000'))
+            results.append(resolver.resolve_many_to_names(['S-1-5-21-1-2-3-1001'])['S-1-5-21-1-2-3-1001'])
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(set(results)) == ['CONTOSO\\alice', 'CONTOSO\\bob'] and len(results) == 800
+
+
+def test_mapping_resolver_files_and_fallback(tmp_path):
+    (tmp_path / 'names.json').write_text('{"S-1-5-21-1-2-3-1000": "CONTOSO\\\\alice"}', encoding='utf-8')
+    (tmp_path / 'names.tsv').write_text('sid\tname\nS-1-5-21-1-2-3-1001\tCONTOSO\\bob\n', encoding='utf-8')
+    (tmp_path / 'names.csv').write_text('# export\nS-1-5-21-1-2-3-1002,"CONTOSO\\carol"\n', encoding='utf-8')
+    fallback = MappingResolver(str(tmp_path / 'names.json'))
+    resolver = MappingResolver(str(tmp_path / 'names.tsv'), fallback=fallback)
+    resolver.load(str(tmp_path / 'names.csv'))
+    assert resolver.resolve_to_name('s-1-5-21-1-2-3-1001') == 'CONTOSO\\bob'
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-1002') == 'CONTOSO\\carol'
+    assert resolver.resolve_to_name('S-1-5-21-1-2-3-1000') == 'CONTOSO\\alice'
+    assert resolver.resolve_from_name('contoso\\alice') == 'S-1-5-21-1-2-3-1000'
+    assert resolver.resolve_many_to_names(['S-1-5-21-1-2-3-1000', 'S-1-5-21-1-2-3-9']) == \
+        {'S-1-5-21-1-2-3-1000': 'CONTOSO\\alice', 'S-1-5-21-1-2-3-9': None}
@@ -0,0 +1,73 @@
+import pickle
+import pytest
+from ace import ACE
+from sid import SID
+from resolver import CachingResolver, MappingResolver
+
+DOMAIN_USER = 'S-1-5-21-1-2-3-1001'
+
+
+def test_well_known():
+    sid = SID.from_str('ba')
+    assert (sid.sid, sid.abbr, sid.principal) == ('S-1-5-32-544', 'BA', 'Administrators')
+    assert SID.from_str('S-1-5-18').to_sddl() == 'SY'
+    assert SID.from_str('DU').sid == 'S-1-5-21-<domain-sid>-513'
+    assert SID.from_str('OW').sid == 'S-1-3-4'
+
+
+def test_integrity_levels():
+    levels = [SID.from_str(abbr).sid for abbr in ('LW', 'ME', 'MP', 'HI', 'SI')]
+    assert levels == ['S-1-16-4096', 'S-1-16-8192', 'S-1-16-8448', 'S-1-16-12288', 'S-1-16-16384']
+    assert SID.from_str('S-1-16-8448').to_sddl() == 'MP'
+    ace = ACE.from_str('(ML;;NW;;;MP)')
+    assert (ace.trustee.sid, ace.trustee.principal) == ('S-1-16-8448', 'Medium Plus Integrity Level')
+    assert ace.to_sddl() == 'ML;;NW;;;MP'
+
+
+def test_immutable_value():
+    sid = SID.from_str('SY')
+    with pytest.raises(AttributeError):
+        sid.principal = 'someone'
+    assert sid == SID.parse('SY') and hash(sid) == hash(SID.parse('SY'))
+    assert pickle.loads(pickle.dumps(sid)) == sid
+
+
+def test_interned():
+    assert SID.from_str('SY') is SID.from_str('SY')
+    # Unresolved SIDs are kept apart from resolved ones
+    assert SID.from_str('SY', resolve=False) is SID.from_str('SY', resolve=False)
+
+
+def test_failed_resolution_retried_after_negative_ttl():
+    names = MappingResolver()
+    SID.set_resolver(CachingResolver(names, negative_ttl=0))
+    assert SID.from_str(DOMAIN_USER).principal is None
+    names.add(DOMAIN_USER, 'CONTOSO\\alice')
+    assert SID.from_str(DOMAIN_USER).principal == 'CONTOSO\\alice'
+
+
+def test_failed_resolution_reused_within_negative_ttl():
+    names = MappingResolver()
+    SID.set_resolver(CachingResolver(names, negative_ttl=3600))
+    failed = SID.from_str(DOMAIN_USER)
+    names.add(DOMAIN_USER, 'CONTOSO\\alice')
+    assert SID.from_str(DOMAIN_USER) is failed
+
+
+def test_resolve_all_shares_with_from_str():
+    names = MappingResolver()
+    names.add(DOMAIN_USER, 'CONTOSO\\alice')
+    SID.set_resolver(names)
+    unresolved = SID.from_str(DOMAIN_USER, resolve=False)
+    assert unresolved.principal is None
+    resolved = SID.resolve_all([unresolved])[unresolved]
+    assert resolved.principal == 'CONTOSO\\alice'
+    assert SID.from_str(DOMAIN_USER) is resolved
+    assert SID.from_str(DOMAIN_USER, resolve=False) is unresolved
+
+
+def test_resolve_by_name():
+    names = MappingResolver()
+    names.add(DOMAIN_USER, 'CONTOSO\\alice')
+    SID.set_resolver(names)
+    assert SID.from_str('contoso\\alice').sid == DOMAIN_USER
@@ -1,33 +1,67 @@
 import ctypes
 import platform
-import re
-
-global_counter = 0
+from typing import Iterable, Optional
 
 COLORS = [31,32,34,35,36] #41,42,43,44,45,46,54]
 
 
-def colorize(s: str) -> str:
-    global global_counter
-    global_counter += 1
-    if global_counter == 1 and platform.system() == 'Windows':
+console_enabled = False
+
+
+def enable_console():
+    global console_enabled
+    if not console_enabled and platform.system() == 'Windows':
         k = ctypes.windll.kernel32
         mode = ctypes.c_uint32(0)
         k.GetConsoleMode(k.GetStdHandle(-11), ctypes.byref(mode))
         k.SetConsoleMode(k.GetStdHandle(-11), mode.value | 0x4)  # enable virtual terminal processing
+    console_enabled = True
+
+
+def wrap_color(s: str, color: int) -> str:
+    return f"\033[;1;{color}m" + s + "\033[;0;0m"
+
+
+def color_spans(text: str, spans: Iterable[tuple]) -> str:
+    # Colors the (start, end, color) spans of 'text' in a single pass, a span overlapping a previous
+    # one is left out
+    res = []
+    pos = 0
+    for start, end, color in sorted(spans):
+        if start < pos:
+            continue
+        res.append(text[pos:start])
+        res.append(wrap_color(text[start:end], color))
+        pos = end
+    res.append(text[pos:])
+    return ''.join(res)
+
+
+class ListWriter:
+
+    # Minimal stream writing into a list, for text which has to be buffered before being written out
+
+    def __init__(self, parts: list):
+        self.write = parts.append
+
+
+class Colorizer:
+
+    # Colors the parts of one object being formatted, cycling through colors from the start for each
+    # of them. Parts colored with a field name are recorded along with where the formatter is (region,
+    # e.g. a section of a security descriptor, and index of the ACE in it), so that the same parts can
+    # then be colored in its one-line SDDL form (see SD.color_header())
+
+    def __init__(self):
+        self.counter = 0
+        self.region = None
+        self.index = None
+        self.parts = []  # (region, index, field, color)
 
-    color = COLORS[global_counter % len(COLORS)]
-    start = f"\033[;1;{color}m"
-    end = "\033[;0;0m"
-    return start + s + end
-
-
-def propagate_colors(dense: str, colored: str) -> str:
-    pos_in_dense = 0
-    for colored_part, text_part in re.findall(r'(\033\[;1;[0-9]+m(.+?)\033\[;0;0m)', colored):
-        text_pos = dense.find(text_part, pos_in_dense)
-        if text_pos < 0:
-            break
-        dense = dense[:text_pos] + colored_part + dense[text_pos + len(text_part):]
-        pos_in_dense = text_pos + len(colored_part)
-    return dense
+    def colorize(self, s: str, field: Optional[object] = None) -> str:
+        self.counter += 1
+        enable_console()
+        color = COLORS[self.counter % len(COLORS)]
+        if field is not None:
+            self.parts.append((self.region, self.index, field, color))
+        return wrap_color(s, color)
@@ -0,0 +1,35 @@
+# Cached ACEs, ACLs and security descriptors are shared by everything which parsed the same input.
+# Freezing one switches it to a subclass of its class which refuses attribute changes: objects only
+# pay for the check once frozen, and are still instances of their class for everything else
+
+FROZEN_CLASSES = {}
+FROZEN = set()
+
+
+def freeze(obj):
+    cls = type(obj)
+    if cls in FROZEN:
+        return obj
+    frozen = FROZEN_CLASSES.get(cls)
+    if frozen is None:
+        frozen = FROZEN_CLASSES[cls] = type(cls.__name__, (cls,), {
+            '__slots__': (),
+            '__module__': cls.__module__,
+            '__setattr__': refuse_set,
+            '__delattr__': refuse_delete,
+        })
+        FROZEN.add(frozen)
+    obj.__class__ = frozen
+    return obj
+
+
+def is_frozen(obj) -> bool:
+    return type(obj) in FROZEN
+
+
+def refuse_set(self, name, value):
+    raise AttributeError(f'{type(self).__name__} object is cached and shared, cannot set {name}')
+
+
+def refuse_delete(self, name):
+    raise AttributeError(f'{type(self).__name__} object is cached and shared, cannot delete {name}')
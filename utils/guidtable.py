@@ -0,0 +1,61 @@
+import bisect
+import importlib
+import uuid
+from collections.abc import Mapping
+
+
+class GUIDTable(Mapping):
+
+    # Read-only GUID -> name mapping, backed by a dict literal in a data module which is only imported
+    # on first lookup. Once loaded, names are kept in a list indexed by the position of their GUID in a
+    # sorted list of 16-byte keys. GUIDs can be looked up as uuid.UUID, 16 bytes, or in any text form
+    # uuid.UUID accepts (case insensitive)
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.keys_bytes = None
+        self.names = None
+
+    def load(self):
+        entries = {}
+        for guid, name in getattr(importlib.import_module(self.module), self.name).items():
+            entries.setdefault(uuid.UUID(guid).bytes, name)
+        keys = sorted(entries)
+        self.names = [entries[key] for key in keys]
+        self.keys_bytes = keys
+
+    def is_loaded(self) -> bool:
+        return self.keys_bytes is not None
+
+    @staticmethod
+    def key_bytes(guid) -> bytes:
+        if isinstance(guid, uuid.UUID):
+            return guid.bytes
+        if isinstance(guid, bytes) and len(guid) == 16:
+            return guid
+        if isinstance(guid, str):
+            try:
+                return uuid.UUID(guid).bytes
+            except ValueError:
+                pass
+        raise KeyError(guid)
+
+    def __getitem__(self, guid) -> str:
+        if self.keys_bytes is None:
+            self.load()
+        key = self.key_bytes(guid)
+        pos = bisect.bisect_left(self.keys_bytes, key)
+        if pos == len(self.keys_bytes) or self.keys_bytes[pos] != key:
+            raise KeyError(guid)
+        return self.names[pos]
+
+    def __iter__(self):
+        if self.keys_bytes is None:
+            self.load()
+        return (uuid.UUID(bytes=key) for key in self.keys_bytes)
+
+    def __len__(self) -> int:
+        if self.keys_bytes is None:
+            self.load()
+        return len(self.keys_bytes)